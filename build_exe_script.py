@@ -4,11 +4,80 @@ This script will guide you through creating an executable file (.exe)
 for the Akbar JAYA Cashier System using PyInstaller
 
 Run this script first to set up everything needed.
+
+Build modes:
+    python build_exe_script.py                   # onefile: one .exe (default)
+    python build_exe_script.py --mode onedir     # folder build, fastest start-up
+    python build_exe_script.py --mode both --benchmark
+
+- onefile unpacks Python, PyQt6 and pandas to a temp folder on EVERY launch
+- onedir is unpacked once at install time; it is built without UPX (every
+  compressed DLL would be decompressed again at load), its bytecode is
+  compiled at build time and it leaves out every optional package the
+  import trace shows the till never loads
+- --benchmark launches each build several times and compares cold and
+  warm start-up (process start until the welcome screen is ready)
 """
 
+import argparse
+import json
+import os
+import shutil
 import subprocess
 import sys
-import os
+import tempfile
+import time
+from functools import partial
+
+APP_NAME = 'AkbarJayaCashier'
+BUILD_MODES = ('onefile', 'onedir')
+TRACE_FILE = os.path.join('build', 'import_trace.json')
+LAUNCH_RUNS = 5
+
+# Optional packages PyInstaller bundles because pandas, numpy or PyQt6 *can*
+# use them. Each one is excluded only if the import trace shows the till
+# never loads it.
+EXCLUDE_CANDIDATES = [
+    # pandas / numpy optional dependencies
+    'matplotlib', 'scipy', 'IPython', 'jinja2', 'pyarrow', 'openpyxl', 'xlrd',
+    'xlsxwriter', 'odf', 'pyxlsb', 'python_calamine', 'sqlalchemy', 'psycopg2',
+    'pymysql', 'adbc_driver_manager', 'tables', 'h5py', 'numexpr', 'bottleneck',
+    'numba', 'fsspec', 's3fs', 'gcsfs', 'lxml', 'html5lib', 'bs4', 'tabulate',
+    'xarray', 'zstandard', 'blosc', 'pytz', 'yaml', 'pygments', 'markupsafe',
+    'certifi', 'charset_normalizer', 'requests', 'urllib3', 'cryptography',
+    'cffi', 'psutil',
+    # test and development tools
+    'pytest', 'hypothesis', 'docutils', 'sphinx', 'setuptools', 'pkg_resources',
+    'pip', 'unittest', 'doctest', 'pydoc', 'lib2to3', 'tkinter', '_tkinter',
+    'curses', 'xmlrpc',
+    # Qt modules the till has no use for
+    'PyQt6.QtWebEngineCore', 'PyQt6.QtWebEngineWidgets', 'PyQt6.QtQml',
+    'PyQt6.QtQuick', 'PyQt6.QtQuickWidgets', 'PyQt6.QtMultimedia',
+    'PyQt6.QtMultimediaWidgets', 'PyQt6.Qt3DCore', 'PyQt6.QtBluetooth',
+    'PyQt6.QtNetwork', 'PyQt6.QtSql', 'PyQt6.QtTest', 'PyQt6.QtDesigner',
+    'PyQt6.QtOpenGL', 'PyQt6.QtOpenGLWidgets', 'PyQt6.QtPdf', 'PyQt6.QtSvg',
+    'PyQt6.QtCharts', 'PyQt6.QtPositioning', 'PyQt6.QtSensors',
+    'PyQt6.QtSerialPort', 'PyQt6.QtWebSockets',
+]
+
+# Runs in a fresh interpreter per storage backend: import every module of
+# the program, exercise the till (catalog, cart, checkout, reports) through
+# the benchmark suite and print what ended up imported
+TRACE_SCRIPT = r"""
+import glob, json, os, sys
+stdout, sys.stdout = sys.stdout, sys.stderr
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+import main_prog_improved, receipt_improved, report_improved
+for path in sorted(glob.glob(os.path.join("modules", "*.py"))):
+    __import__("modules." + os.path.basename(path)[:-3])
+try:
+    import fpdf  # report_improved imports it on the first PDF
+except ImportError:
+    pass
+from modules.benchmark import run_scale
+run_scale(200, sys.argv[1], 1)
+stdout.write(json.dumps(sorted(sys.modules)) + "\n")
+"""
 
 def print_header(text):
     print("\n" + "="*60)
@@ -66,12 +135,69 @@ def check_requirements():
             print(f"❌ {package} is NOT installed")
             print(f"   Installing {package}...")
             run_command(f"pip install {package}", f"Installing {package}")
+    return True
+
+def trace_imports():
+    """Run the program headless and return the set of modules it imported"""
+    print_header("Tracing imports")
+    print("\n🔄 Running the till on sample data to see what it imports...")
+    root = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    modules = set()
+    for backend in ("csv", "sqlite"):
+        result = subprocess.run([sys.executable, "-c", TRACE_SCRIPT, backend], cwd=root, env=env,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"❌ Import trace failed ({backend}):")
+            print(result.stderr[-2000:])
+            return None
+        modules.update(json.loads(result.stdout.strip().splitlines()[-1]))
+    modules = sorted(modules)
+    os.makedirs(os.path.dirname(TRACE_FILE), exist_ok=True)
+    with open(TRACE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(modules, f, indent=1)
+    print(f"✅ {len(modules)} modules imported (saved to {TRACE_FILE})")
+    return set(modules)
+
+def derive_excludes(traced):
+    """Candidates the trace never imported, neither the package nor anything in it"""
+    excludes = []
+    for name in EXCLUDE_CANDIDATES:
+        used = any(module == name or module.startswith(name + '.') for module in traced)
+        if not used:
+            excludes.append(name)
+    kept = [name for name in EXCLUDE_CANDIDATES if name not in excludes]
+    print(f"✅ Excluding {len(excludes)} unused packages")
+    if kept:
+        print(f"   Kept (imported by the till): {', '.join(kept)}")
+    return excludes
 
-def create_spec_file():
+def spec_filename(mode):
+    return f'{APP_NAME}.spec' if mode == 'onefile' else f'{APP_NAME}_{mode}.spec'
+
+def create_spec_file(mode='onefile', excludes=None):
     """Create PyInstaller spec file for better control"""
-    print_header("STEP 4: Creating PyInstaller Configuration")
-    
-    spec_content = """# -*- mode: python ; coding: utf-8 -*-
+    print_header(f"STEP 4: Creating PyInstaller Configuration ({mode})")
+
+    if mode == 'onefile':
+        # Sources are shipped next to the bytecode, as before
+        datas = """[
+        ('data', 'data'),
+        ('modules', 'modules'),
+        ('docs', 'docs'),
+        ('receipt_improved.py', '.'),
+        ('report_improved.py', '.'),
+    ]"""
+    else:
+        # The program itself is only needed as bytecode, which Analysis
+        # compiles into the PYZ archive at build time
+        datas = """[
+        ('data', 'data'),
+        ('docs', 'docs'),
+    ]"""
+
+    spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
+# Generated by build_exe_script.py --mode {mode}
 
 block_cipher = None
 
@@ -79,13 +205,7 @@ a = Analysis(
     ['main_prog_improved.py'],
     pathex=[],
     binaries=[],
-    datas=[
-        ('data', 'data'),
-        ('modules', 'modules'),
-        ('docs', 'docs'),
-        ('receipt_improved.py', '.'),
-        ('report_improved.py', '.'),
-    ],
+    datas={datas},
     hiddenimports=[
         'PyQt6.QtCore',
         'PyQt6.QtGui',
@@ -94,17 +214,21 @@ a = Analysis(
         'pandas',
     ],
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    excludes={excludes or []!r},
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize={0 if mode == 'onefile' else 1},
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+"""
 
+    if mode == 'onefile':
+        spec_content += f"""
 exe = EXE(
     pyz,
     a.scripts,
@@ -112,7 +236,7 @@ exe = EXE(
     a.zipfiles,
     a.datas,
     [],
-    name='AkbarJayaCashier',
+    name='{APP_NAME}',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
@@ -128,28 +252,155 @@ exe = EXE(
     icon=None,
 )
 """
-    
+    else:
+        spec_content += f"""
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='{APP_NAME}',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='{APP_NAME}',
+)
+"""
+
     try:
-        with open('AkbarJayaCashier.spec', 'w') as f:
+        with open(spec_filename(mode), 'w') as f:
             f.write(spec_content)
-        print("✅ Configuration file created: AkbarJayaCashier.spec")
+        print(f"✅ Configuration file created: {spec_filename(mode)}")
         return True
     except Exception as e:
         print(f"❌ Error creating spec file: {e}")
         return False
 
-def build_exe():
+def build_exe(mode='onefile'):
     """Build the executable"""
-    print_header("STEP 5: Building Executable (This may take 5-10 minutes)")
+    print_header(f"STEP 5: Building Executable - {mode} (This may take 5-10 minutes)")
     print("\n⏳ Please wait... PyInstaller is bundling everything...")
     print("   This includes Python, PyQt6, pandas, and all your code.")
-    
+
+    # Each mode gets its own output folders so both builds can coexist
+    folders = "" if mode == 'onefile' else f" --distpath {os.path.join('dist', mode)} --workpath {os.path.join('build', mode)}"
     return run_command(
-        "pyinstaller AkbarJayaCashier.spec --clean",
+        f"pyinstaller {spec_filename(mode)} --clean --noconfirm{folders}",
         "Building EXE file"
     )
 
-def main():
+def exe_path(mode):
+    name = APP_NAME + ('.exe' if sys.platform == 'win32' else '')
+    if mode == 'onefile':
+        return os.path.join('dist', name)
+    return os.path.join('dist', mode, APP_NAME, name)
+
+def bundle_size_mb(mode):
+    path = exe_path(mode)
+    if mode == 'onefile':
+        return os.path.getsize(path) / 1e6
+    total = 0
+    for folder, _, files in os.walk(os.path.dirname(path)):
+        # Shared libraries may be symlinked; count each file once
+        total += sum(os.path.getsize(os.path.join(folder, name)) for name in files
+                     if not os.path.islink(os.path.join(folder, name)))
+    return total / 1e6
+
+def drop_os_caches():
+    """Empty the OS file cache so the next launch reads from disk (Linux, as root)"""
+    try:
+        os.sync()
+        with open('/proc/sys/vm/drop_caches', 'w') as f:
+            f.write('3\n')
+        return True
+    except (AttributeError, OSError):
+        return False
+
+def launch_once(path, workdir):
+    """Milliseconds from process start until the app has started up and quit"""
+    env = dict(os.environ, AKBAR_EXIT_AFTER_STARTUP='1')
+    if sys.platform.startswith('linux') and not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY'):
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+    start = time.perf_counter()
+    result = subprocess.run([os.path.abspath(path)], cwd=workdir, env=env,
+                            capture_output=True, text=True, timeout=300)
+    ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"{path} exited with {result.returncode}: {result.stderr[-500:]}")
+    return ms
+
+def benchmark_launch(modes, runs=LAUNCH_RUNS):
+    """Compare cold and warm start-up of the built executables"""
+    print_header("Launch benchmark")
+    modes = [mode for mode in modes if os.path.exists(exe_path(mode))]
+    if not modes:
+        print("❌ No build found in dist/ - build first")
+        return False
+
+    cold_from_disk = drop_os_caches()
+    if not cold_from_disk:
+        print("⚠️  Cannot empty the OS file cache here (needs Linux and root);")
+        print("   'cold' is the first launch after the build, which is only truly")
+        print("   cold right after a reboot.")
+
+    rows = []
+    for mode in modes:
+        # Each launch gets a copy of data/ so start-up recovery never touches the real files
+        workdir = tempfile.mkdtemp(prefix='akbar_launch_')
+        try:
+            shutil.copytree('data', os.path.join(workdir, 'data'))
+            print(f"\n🔄 Launching {mode} build {runs + 1} times...")
+            drop_os_caches()
+            cold = launch_once(exe_path(mode), workdir)
+            warm = sorted(launch_once(exe_path(mode), workdir) for _ in range(runs))
+            rows.append((mode, cold, warm[0], warm[len(warm) // 2], bundle_size_mb(mode)))
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"❌ {mode}: {e}")
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n  {'Build':<10}{'cold':>10}{'warm min':>12}{'warm median':>14}{'size':>10}")
+    for mode, cold, warm_min, warm_median, size in rows:
+        print(f"  {mode:<10}{cold:>8.0f}ms{warm_min:>10.0f}ms{warm_median:>12.0f}ms{size:>8.0f}MB")
+    return bool(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Akbar Jaya Cashier executable")
+    parser.add_argument("--mode", choices=BUILD_MODES + ('both',), default='onefile',
+                        help="onefile: a single .exe; onedir: a folder that starts faster")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="compare cold and warm launch times after building")
+    parser.add_argument("--benchmark-only", action="store_true",
+                        help="benchmark the existing builds without rebuilding")
+    parser.add_argument("--runs", type=int, default=LAUNCH_RUNS, help="warm launches per build")
+    args = parser.parse_args(argv)
+
+    # Only wait for Enter when started without options (BUILD_EXE.bat)
+    interactive = not (sys.argv[1:] if argv is None else argv)
+
+    def pause(prompt):
+        if interactive:
+            input(prompt)
+
     print("""
     ╔════════════════════════════════════════════════════════════╗
     ║                                                            ║
@@ -167,25 +418,43 @@ def main():
         print("❌ ERROR: This script must be run from the AkbarJAYACashier folder!")
         print(f"   Current directory: {os.getcwd()}")
         print(f"   Required file: main_prog_improved.py not found")
-        input("\nPress Enter to exit...")
+        pause("\nPress Enter to exit...")
         return
     
+    modes = list(BUILD_MODES) if args.mode == 'both' else [args.mode]
+    excludes = []
+
+    def trace_excludes():
+        traced = trace_imports()
+        if traced is None:
+            return False
+        excludes.extend(derive_excludes(traced))
+        return True
+
     # Run all steps
-    steps = [
-        check_python,
-        install_pyinstaller,
-        check_requirements,
-        create_spec_file,
-        build_exe
-    ]
+    steps = []
+    if not args.benchmark_only:
+        steps += [check_python, install_pyinstaller, check_requirements]
+        if 'onedir' in modes:
+            # With --mode both the onefile build gets the same excludes, so the
+            # benchmark compares the packaging and nothing else
+            steps.append(trace_excludes)
+        for mode in modes:
+            steps += [partial(create_spec_file, mode, excludes), partial(build_exe, mode)]
+    if args.benchmark or args.benchmark_only:
+        steps.append(partial(benchmark_launch, modes, args.runs))
     
     for step in steps:
         if not step():
             print("\n❌ Build process failed!")
             print("   Please check the errors above and try again.")
-            input("\nPress Enter to exit...")
+            pause("\nPress Enter to exit...")
             return
-    
+    if args.benchmark_only:
+        return
+    if 'onedir' in modes:
+        print(f"\n📁 Folder build: {os.path.dirname(exe_path('onedir'))}")
+        print("   Copy the WHOLE folder; start the program with the EXE inside it.")
     # Success!
     print_header("BUILD COMPLETE! 🎉")
     print("""
@@ -223,7 +492,7 @@ def main():
          for easy access!
     """)
     
-    input("\n✅ Press Enter to exit...")
+    pause("\n✅ Press Enter to exit...")
 
 if __name__ == "__main__":
     main()
@@ -16,550 +16,103 @@ Enhanced with:
 Run: python main_prog_improved.py
 """
 
-import sys
 import os
-import pandas as pd
-from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QScrollArea, QMessageBox, QInputDialog, 
-    QTextEdit, QLineEdit, QFileDialog, QGridLayout, QDialog
-)
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
-from PyQt6.QtGui import QFont
+import sys
 from datetime import datetime
 
-# Import our custom modules
-from receipt_improved import generate_receipt_text
-from report_improved import generate_sales_report
-from modules.welcome_screen import WelcomeScreen
-
-
-class LargePaymentDialog(QDialog):
-    """Large payment dialog for elderly customers with big text and buttons"""
-    
-    def __init__(self, parent, total_amount):
-        super().__init__(parent)
-        self.setWindowTitle("Payment")
-        self.resize(900, 650)  # Reduced height to fit buttons without scrolling
-        self.setStyleSheet("QDialog { background-color: #f8fafc; }")
-        self.setModal(True)
-        
-        self.total_amount = total_amount
-        self.payment_amount = 0.0
-        
-        self.init_ui()
-        self.center_on_screen()  # Center dialog on screen
-    
-    def init_ui(self):
-        """Initialize payment dialog with large UI elements"""
-        layout = QVBoxLayout()
-        layout.setSpacing(20)  # Reduced spacing to fit everything
-        self.setLayout(layout)
-        
-        # Title - Smaller padding
-        title = QLabel("💳 PAYMENT")
-        title.setFont(QFont("Arial", 42, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            color: white;
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #10b981, stop:1 #059669);
-            padding: 25px;
-            border-radius: 15px;
-        """)
-        layout.addWidget(title)
-        
-        # Total amount display - Slightly smaller
-        total_label = QLabel(f"TOTAL AMOUNT:")
-        total_label.setFont(QFont("Arial", 30, QFont.Weight.Bold))
-        total_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        total_label.setStyleSheet("color: #1e40af; margin-top: 10px;")
-        layout.addWidget(total_label)
-        
-        total_value = QLabel(f"${self.total_amount:.2f}")
-        total_value.setFont(QFont("Arial", 60, QFont.Weight.Bold))
-        total_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        total_value.setStyleSheet("""
-            color: #dc2626;
-            background-color: #fee2e2;
-            padding: 20px;
-            border-radius: 15px;
-            border: 5px solid #ef4444;
-        """)
-        layout.addWidget(total_value)
-        
-        # Payment input section
-        input_container = QWidget()
-        input_container.setStyleSheet("""
-            background-color: #ffffff;
-            border-radius: 15px;
-            padding: 30px;
-            border: 3px solid #cbd5e1;
-        """)
-        input_layout = QVBoxLayout()
-        input_container.setLayout(input_layout)
-        
-        payment_label = QLabel("💵 Enter Payment Received:")
-        payment_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-        payment_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        payment_label.setStyleSheet("color: #1e293b; margin-bottom: 15px;")
-        input_layout.addWidget(payment_label)
-        
-        self.payment_input = QLineEdit()
-        self.payment_input.setFont(QFont("Arial", 52, QFont.Weight.Bold))
-        self.payment_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.payment_input.setPlaceholderText("0.00")
-        self.payment_input.setStyleSheet("""
-            QLineEdit {
-                padding: 20px;
-                border: 5px solid #3b82f6;
-                border-radius: 15px;
-                background-color: #eff6ff;
-                color: #1e40af;
-            }
-            QLineEdit:focus {
-                border: 5px solid #10b981;
-                background-color: #d1fae5;
-            }
-        """)
-        input_layout.addWidget(self.payment_input)
-        
-        layout.addWidget(input_container)
-        
-        # Buttons - EXTRA LARGE
-        buttons_container = QWidget()
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setSpacing(20)
-        buttons_container.setLayout(buttons_layout)
-        
-        # Confirm button - Smaller but still large enough
-        confirm_btn = QPushButton("✅\nCONFIRM\nPAYMENT")
-        confirm_btn.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-        confirm_btn.setMinimumSize(QSize(350, 120))
-        confirm_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        confirm_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10b981;
-                color: white;
-                border-radius: 20px;
-                padding: 15px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-        """)
-        confirm_btn.clicked.connect(self.validate_payment)
-        buttons_layout.addWidget(confirm_btn)
-        
-        # Cancel button - Smaller but still large enough
-        cancel_btn = QPushButton("❌\nCANCEL")
-        cancel_btn.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-        cancel_btn.setMinimumSize(QSize(350, 120))
-        cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ef4444;
-                color: white;
-                border-radius: 20px;
-                padding: 15px;
-            }
-            QPushButton:hover {
-                background-color: #dc2626;
-            }
-        """)
-        cancel_btn.clicked.connect(self.reject)
-        buttons_layout.addWidget(cancel_btn)
-        
-        layout.addWidget(buttons_container)
-        
-        # Set focus to payment input
-        self.payment_input.setFocus()
-    
-    def validate_payment(self):
-        """Validate payment amount"""
-        try:
-            payment = float(self.payment_input.text())
-            
-            if payment < self.total_amount:
-                # Show error in large format
-                error_msg = QMessageBox(self)
-                error_msg.setWindowTitle("Insufficient Payment")
-                error_msg.setIcon(QMessageBox.Icon.Warning)
-                error_msg.setText(f"⚠️ INSUFFICIENT PAYMENT\n\n"
-                                f"Required: ${self.total_amount:.2f}\n"
-                                f"Received: ${payment:.2f}\n\n"
-                                f"Please enter at least ${self.total_amount:.2f}")
-                error_msg.setStyleSheet("""
-                    QMessageBox {
-                        font-size: 24px;
-                    }
-                    QLabel {
-                        font-size: 24px;
-                        min-width: 500px;
-                    }
-                """)
-                error_msg.exec()
-                self.payment_input.setFocus()
-                self.payment_input.selectAll()
-                return
-            
-            self.payment_amount = payment
-            self.accept()
-            
-        except ValueError:
-            error_msg = QMessageBox(self)
-            error_msg.setWindowTitle("Invalid Input")
-            error_msg.setIcon(QMessageBox.Icon.Warning)
-            error_msg.setText("⚠️ INVALID AMOUNT\n\nPlease enter a valid number!")
-            error_msg.setStyleSheet("""
-                QMessageBox {
-                    font-size: 24px;
-                }
-                QLabel {
-                    font-size: 24px;
-                    min-width: 400px;
-                }
-            """)
-            error_msg.exec()
-            self.payment_input.setFocus()
-            self.payment_input.selectAll()
-    
-    def center_on_screen(self):
-        """Center the dialog on the current screen"""
-        screen = QApplication.primaryScreen()
-        if screen:
-            screen_geometry = screen.availableGeometry()
-            x = (screen_geometry.width() - self.width()) // 2
-            y = (screen_geometry.height() - self.height()) // 2
-            self.move(x, y)
-
-##FIXED version
-class LargeCompletionDialog(QDialog):
-    """Large completion dialog showing payment and change for elderly customers"""
-    
-    def __init__(self, parent, payment, change):
-        super().__init__(parent)
-        self.setWindowTitle("Transaction Complete")
-        self.resize(900, 650)  # Optimized height to fit without scrolling
-        self.setStyleSheet("QDialog { background-color: #f8fafc; }")
-        self.setModal(True)
-        
-        self.payment = payment
-        self.change = change
-        
-        self.init_ui()
-        self.center_on_screen()  # Center on screen
-    
-    def init_ui(self):
-        """Initialize completion dialog with large UI elements"""
-        layout = QVBoxLayout()
-        layout.setSpacing(15)  # Reduced spacing to fit everything
-        self.setLayout(layout)
-        
-        # Success icon and title - Smaller padding
-        title = QLabel("✅ TRANSACTION\nCOMPLETE!")
-        title.setFont(QFont("Arial", 44, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            color: white;
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #10b981, stop:1 #059669);
-            padding: 30px;
-            border-radius: 20px;
-        """)
-        layout.addWidget(title)
-        
-        # Payment received - Smaller
-        payment_container = QWidget()
-        payment_container.setStyleSheet("""
-            background-color: #dbeafe;
-            border-radius: 15px;
-            padding: 20px;
-            border: 4px solid #3b82f6;
-        """)
-        payment_layout = QVBoxLayout()
-        payment_container.setLayout(payment_layout)
-        
-        payment_label = QLabel("💵 Payment Received:")
-        payment_label.setFont(QFont("Arial", 26, QFont.Weight.Bold))
-        payment_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        payment_label.setStyleSheet("color: #1e40af;")
-        payment_layout.addWidget(payment_label)
-        
-        payment_value = QLabel(f"${self.payment:.2f}")
-        payment_value.setFont(QFont("Arial", 52, QFont.Weight.Bold))
-        payment_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        payment_value.setStyleSheet("color: #1e40af; margin: 8px;")
-        payment_layout.addWidget(payment_value)
-        
-        layout.addWidget(payment_container)
-        
-        # Change to give - Smaller
-        change_container = QWidget()
-        change_container.setStyleSheet("""
-            background-color: #d1fae5;
-            border-radius: 15px;
-            padding: 20px;
-            border: 4px solid #10b981;
-        """)
-        change_layout = QVBoxLayout()
-        change_container.setLayout(change_layout)
-        
-        change_label = QLabel("💰 Change to Return:")
-        change_label.setFont(QFont("Arial", 26, QFont.Weight.Bold))
-        change_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        change_label.setStyleSheet("color: #047857;")
-        change_layout.addWidget(change_label)
-        
-        change_value = QLabel(f"${self.change:.2f}")
-        change_value.setFont(QFont("Arial", 56, QFont.Weight.Bold))
-        change_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        change_value.setStyleSheet("color: #047857; margin: 8px;")
-        change_layout.addWidget(change_value)
-        
-        layout.addWidget(change_container)
-        
-        # Thank you message - Smaller
-        thank_you = QLabel("🙏 Thank You!")
-        thank_you.setFont(QFont("Arial", 28, QFont.Weight.Bold))
-        thank_you.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        thank_you.setStyleSheet("color: #6366f1; margin: 12px;")
-        layout.addWidget(thank_you)
-        
-        # OK button - Smaller but still large
-        ok_btn = QPushButton("✅\nOK")
-        ok_btn.setFont(QFont("Arial", 28, QFont.Weight.Bold))
-        ok_btn.setMinimumSize(QSize(400, 120))
-        ok_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border-radius: 20px;
-                padding: 15px;
-            }
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-        """)
-        ok_btn.clicked.connect(self.accept)
-        layout.addWidget(ok_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-    
-    def center_on_screen(self):
-        """Center the dialog on the current screen"""
-        screen = QApplication.primaryScreen()
-        if screen:
-            screen_geometry = screen.availableGeometry()
-            x = (screen_geometry.width() - self.width()) // 2
-            y = (screen_geometry.height() - self.height()) // 2
-            self.move(x, y)
-
+from modules.startup import startup_trace, warm_up, wait_for_warm_up
+
+# Only what the welcome screen and the window classes need is imported here.
+# pandas, storage, the report engine and the manager dialogs are loaded in the
+# background (modules.startup) or on first use.
+with startup_trace.phase("import PyQt6"):
+    from PyQt6.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+        QPushButton, QLabel, QScrollArea, QMessageBox, QInputDialog,
+        QTextEdit, QLineEdit, QFileDialog, QGridLayout, QDialog, QProgressBar
+    )
+    from PyQt6.QtCore import Qt, QTimer, QSize
+    from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
+    from PyQt6.QtGui import QFont, QTextDocument, QShortcut, QKeySequence
 
-##--------------Fixed
+# Import our custom modules
+with startup_trace.phase("import cashier modules"):
+    from receipt_improved import generate_receipt_text
+    from modules.cart import Cart
+    from modules.cart_view import CartPanel
+    from modules.catalog_view import (
+        CatalogDialog, CatalogListModel, ProductTileView,
+        TILE_HEIGHT, is_low_stock
+    )
+    from modules.product_search import ProductSearchIndex
+    from modules.barcode_scanner import BarcodeIndex, ScanInput, parse_scan
+    from modules.activity_logger import activity_logger
+    from modules.background_jobs import get_job_runner
+    from modules.perf_monitor import perf_monitor, PerfSummaryDialog
+    from modules.theme import apply_theme, set_state
+    from modules.checkout_dialogs import (
+        LargePaymentDialog, LargeCustomerNameDialog, LargeCompletionDialog
+    )
 
-class LargeCustomerNameDialog(QDialog):
-    """Large dialog for entering customer name - elderly-friendly"""
-    
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.setWindowTitle("Customer Name")
-        self.resize(900, 600)
-        self.setStyleSheet("QDialog { background-color: #f8fafc; }")
-        self.setModal(True)
-        
-        self.customer_name = "Customer"
-        
-        self.init_ui()
-        self.center_on_screen()
-    
-    def init_ui(self):
-        """Initialize customer name dialog with large UI elements"""
-        layout = QVBoxLayout()
-        layout.setSpacing(30)
-        self.setLayout(layout)
-        
-        # Title
-        title = QLabel("👤 CUSTOMER NAME")
-        title.setFont(QFont("Arial", 48, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            color: white;
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #3b82f6, stop:1 #2563eb);
-            padding: 40px;
-            border-radius: 15px;
-        """)
-        layout.addWidget(title)
-        
-        # Instructions
-        instructions = QLabel("Please enter the customer's name:")
-        instructions.setFont(QFont("Arial", 28, QFont.Weight.Bold))
-        instructions.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        instructions.setStyleSheet("color: #1e40af; margin: 20px;")
-        layout.addWidget(instructions)
-        
-        # Name input section
-        input_container = QWidget()
-        input_container.setStyleSheet("""
-            background-color: #ffffff;
-            border-radius: 15px;
-            padding: 30px;
-            border: 3px solid #cbd5e1;
-        """)
-        input_layout = QVBoxLayout()
-        input_container.setLayout(input_layout)
-        
-        name_label = QLabel("📝 Customer Name:")
-        name_label.setFont(QFont("Arial", 28, QFont.Weight.Bold))
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_label.setStyleSheet("color: #1e293b; margin-bottom: 20px;")
-        input_layout.addWidget(name_label)
-        
-        self.name_input = QLineEdit()
-        self.name_input.setFont(QFont("Arial", 48, QFont.Weight.Bold))
-        self.name_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.name_input.setPlaceholderText("Enter name here...")
-        self.name_input.setText("Customer")  # Default value
-        self.name_input.setStyleSheet("""
-            QLineEdit {
-                padding: 30px;
-                border: 5px solid #3b82f6;
-                border-radius: 15px;
-                background-color: #eff6ff;
-                color: #1e40af;
-            }
-            QLineEdit:focus {
-                border: 5px solid #10b981;
-                background-color: #d1fae5;
-            }
-        """)
-        input_layout.addWidget(self.name_input)
-        
-        layout.addWidget(input_container)
-        
-        # Buttons - EXTRA LARGE
-        buttons_container = QWidget()
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setSpacing(20)
-        buttons_container.setLayout(buttons_layout)
-        
-        # OK button
-        ok_btn = QPushButton("✅\nOK")
-        ok_btn.setFont(QFont("Arial", 32, QFont.Weight.Bold))
-        ok_btn.setMinimumSize(QSize(350, 150))
-        ok_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10b981;
-                color: white;
-                border-radius: 20px;
-                padding: 20px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-        """)
-        ok_btn.clicked.connect(self.accept_name)
-        buttons_layout.addWidget(ok_btn)
-        
-        # Skip button (use default "Customer")
-        skip_btn = QPushButton("⏭️\nSKIP\n(Use 'Customer')")
-        skip_btn.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-        skip_btn.setMinimumSize(QSize(350, 150))
-        skip_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        skip_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6b7280;
-                color: white;
-                border-radius: 20px;
-                padding: 20px;
-            }
-            QPushButton:hover {
-                background-color: #4b5563;
-            }
-        """)
-        skip_btn.clicked.connect(self.skip_name)
-        buttons_layout.addWidget(skip_btn)
-        
-        layout.addWidget(buttons_container)
-        
-        # Set focus to name input and select all text
-        self.name_input.setFocus()
-        self.name_input.selectAll()
-    
-    def accept_name(self):
-        """Accept the entered name"""
-        name = self.name_input.text().strip()
-        if name:
-            self.customer_name = name
-        else:
-            self.customer_name = "Customer"
-        self.accept()
-    
-    def skip_name(self):
-        """Skip and use default 'Customer'"""
-        self.customer_name = "Customer"
-        self.accept()
-    
-    def center_on_screen(self):
-        """Center the dialog on the current screen"""
-        screen = QApplication.primaryScreen()
-        if screen:
-            screen_geometry = screen.availableGeometry()
-            x = (screen_geometry.width() - self.width()) // 2
-            y = (screen_geometry.height() - self.height()) // 2
-            self.move(x, y)
 
 class AkbarCashier(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Akbar Jaya Cashier System - Enhanced UI v1.8")
         self.setGeometry(100, 100, 1200, 800)
-        self.cart = []
-
-        self.setStyleSheet("QMainWindow { background-color: #f8fafc; }")
+        # Loaded by the start-up warm-up, or here when the window is used on its own
+        from modules.storage import get_storage
+        from modules.catalog import ProductCatalog
+
+        self.cart = Cart()
+        self.catalog_dialog = None  # Created on first open, then reused
+        self.payment_dialog = None  # Checkout dialogs: created once, reset per checkout
+        self.name_dialog = None
+        self.completion_dialog = None
+
+        # Products, sales and users all go through the storage layer.
+        # Checkouts interrupted by a crash were replayed by the start-up warm-up.
+        self.storage = get_storage()
+        if not self.storage.acquire_till():
+            print("[WARN] Another till is using the same data files")
+        # Commits, printing and PDF output run on worker threads
+        self.jobs = get_job_runner()
+        # Event-loop lag heartbeat and slow-operation log (F12 shows the summary)
+        perf_monitor.start()
+        QShortcut(QKeySequence("F12"), self).activated.connect(self.show_perf_summary)
+
+        # Colours, borders and states all come from the application theme
+        apply_theme()
+        self.setObjectName("cashierWindow")
 
         self.main_widget = QWidget()
+        self.main_widget.setObjectName("cashierMain")
         self.setCentralWidget(self.main_widget)
-        self.main_widget.setStyleSheet("background-color: #f8fafc;")
         self.main_layout = QVBoxLayout()
         self.main_widget.setLayout(self.main_layout)
 
         # Title
         self.title_label = QLabel("AKBAR JAYA")
+        self.title_label.setObjectName("appTitle")
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title_font = QFont("Arial", 32, QFont.Weight.Bold)
         self.title_label.setFont(title_font)
-        self.title_label.setStyleSheet("""
-            color: #1e3a8a;
-            background-color: #dbeafe;
-            padding: 20px;
-            border-radius: 10px;
-            margin: 5px;
-        """)
         self.main_layout.addWidget(self.title_label)
 
         # Date & Time
         self.datetime_label = QLabel()
+        self.datetime_label.setObjectName("clock")
         self.datetime_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         datetime_font = QFont("Arial", 16, QFont.Weight.Bold)
         self.datetime_label.setFont(datetime_font)
-        self.datetime_label.setStyleSheet("color: #059669; padding: 5px;")
         self.main_layout.addWidget(self.datetime_label)
 
         # Cashier Name
         self.cashier_label = QLabel()
+        self.cashier_label.setObjectName("cashierBadge")
         self.cashier_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         cashier_font = QFont("Arial", 18, QFont.Weight.Bold)
         self.cashier_label.setFont(cashier_font)
-        self.cashier_label.setStyleSheet("""
-            color: #7c3aed;
-            background-color: #f3e8ff;
-            padding: 10px;
-            border-radius: 8px;
-            margin: 5px;
-        """)
         self.main_layout.addWidget(self.cashier_label)
 
         # Cashier name and ID will be set from welcome screen
@@ -583,79 +136,86 @@ class AkbarCashier(QMainWindow):
 
         # Left panel: Products
         self.product_area = QWidget()
+        self.product_area.setObjectName("productArea")
         self.product_layout = QVBoxLayout()
         self.product_area.setLayout(self.product_layout)
-        self.product_area.setStyleSheet("""
-            background-color: #ffffff;
-            border-radius: 10px;
-            padding: 10px;
-        """)
 
         # Title for catalog section
         catalog_title = QLabel("📂 Product Catalog")
+        catalog_title.setObjectName("sectionTitle")
         catalog_title.setFont(QFont("Arial", 18, QFont.Weight.Bold))
         catalog_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        catalog_title.setStyleSheet("""
-            color: #1e40af;
-            background-color: #dbeafe;
-            padding: 10px;
-            border-radius: 8px;
-            margin: 5px;
-        """)
         self.product_layout.addWidget(catalog_title)
 
+        # Search-as-you-type over product ids and names
+        self.search_input = QLineEdit()
+        self.search_input.setObjectName("searchInput")
+        self.search_input.setPlaceholderText("🔍 Search products by ID or name...")
+        self.search_input.setFont(QFont("Arial", 16))
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.search_products)
+        self.product_layout.addWidget(self.search_input)
+
+        self.search_model = CatalogListModel(ProductCatalog(), self)
+        self.search_results = ProductTileView(self.search_model)
+        self.search_results.setFixedHeight(3 * TILE_HEIGHT + 10)
+        self.search_results.product_selected.connect(self.add_to_cart)
+        self.search_results.hide()
+        self.product_layout.addWidget(self.search_results)
+
+        # Catalog prefix buttons are rebuilt in here
+        self.prefix_layout = QVBoxLayout()
+        self.product_layout.addLayout(self.prefix_layout)
+
         self.scroll = QScrollArea()
+        self.scroll.setObjectName("productScroll")
         self.scroll.setWidgetResizable(True)
         self.scroll.setWidget(self.product_area)
-        self.scroll.setStyleSheet("QScrollArea { border: none; }")
         self.h_layout.addWidget(self.scroll, 2)
 
         # Right panel: Cart & Receipt with buttons at BOTTOM
         self.cart_area = QWidget()
+        self.cart_area.setObjectName("cartArea")
         self.cart_layout = QVBoxLayout()
         self.cart_layout.setSpacing(10)
         self.cart_area.setLayout(self.cart_layout)
-        self.cart_area.setStyleSheet("""
-            background-color: #ffffff;
-            border-radius: 10px;
-            padding: 15px;
-        """)
         self.h_layout.addWidget(self.cart_area, 1)
 
+        # Busy indicator while background jobs (saving, printing, PDFs) run
+        self.busy_bar = QProgressBar()
+        self.busy_bar.setMaximumWidth(200)
+        self.busy_bar.setTextVisible(False)
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.hide()
+        self.statusBar().addPermanentWidget(self.busy_bar)
+        self.jobs.busy_changed.connect(self.on_jobs_busy)
+        self.jobs.progress.connect(self.on_job_progress)
+
+        # Barcode fast-entry: scanner (or keyboard) types a code and Enter
+        self.scan_input = ScanInput()
+        self.scan_input.setObjectName("scanInput")
+        self.scan_input.setPlaceholderText("📷 Scan barcode or type ID (e.g. 5*AJ001)")
+        self.scan_input.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.scan_input.scanned.connect(self.add_scanned)
+        self.cart_layout.addWidget(self.scan_input)
+
+        # Result of the last scan; errors show here so no dialog steals focus
+        self.scan_status = QLabel()
+        self.scan_status.setObjectName("scanStatus")
+        self.scan_status.setFont(QFont("Arial", 13, QFont.Weight.Bold))
+        self.cart_layout.addWidget(self.scan_status)
+
         # Cart section - NOW BIGGER (no max height initially)
-        self.cart_scroll_area = QScrollArea()
-        self.cart_scroll_area.setWidgetResizable(True)
-        self.cart_scroll_area.setMinimumHeight(200)
-        # NO maximum height - cart can grow to fill space
-        self.cart_scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: 2px solid #cbd5e1;
-                border-radius: 8px;
-                background-color: #f8fafc;
-            }
-        """)
-        
-        self.cart_label = QLabel("🛒 Shopping Cart:\n\n  (Empty)")
-        self.cart_label.setFont(QFont("Arial", 14))  # Slightly bigger font
-        self.cart_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        self.cart_label.setStyleSheet("color: #1e40af; padding: 10px; background-color: transparent;")
-        self.cart_label.setWordWrap(True)
-        
-        self.cart_scroll_area.setWidget(self.cart_label)
-        self.cart_layout.addWidget(self.cart_scroll_area, 1)  # Takes available space
+        # Model/view table: each add repaints only its row and the total
+        self.cart_panel = CartPanel(self.cart)
+        self.cart_panel.setMinimumHeight(200)
+        self.cart_layout.addWidget(self.cart_panel, 1)  # Takes available space
 
         # Receipt display - HIDDEN BY DEFAULT
         self.receipt_display = QTextEdit()
+        self.receipt_display.setObjectName("receipt")
         self.receipt_display.setReadOnly(True)
         self.receipt_display.setFont(QFont("Courier New", 11))
-        self.receipt_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8fafc;
-                border: 2px solid #cbd5e1;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
         self.receipt_display.hide()  # HIDDEN AT START
         self.cart_layout.addWidget(self.receipt_display, 1)
 
@@ -667,97 +227,47 @@ class AkbarCashier(QMainWindow):
         
         # Checkout - GREEN
         self.checkout_btn = QPushButton("💳\nCHECKOUT")
+        self.checkout_btn.setObjectName("checkoutButton")
         self.checkout_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         self.checkout_btn.setMinimumSize(QSize(140, 80))
         self.checkout_btn.setMaximumSize(QSize(140, 80))
-        self.checkout_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10b981;
-                color: white;
-                border-radius: 12px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-        """)
         self.checkout_btn.clicked.connect(self.checkout)
         button_grid.addWidget(self.checkout_btn, 0, 0)
 
         # Cancel - RED
         self.cancel_btn = QPushButton("❌\nCANCEL")
+        self.cancel_btn.setObjectName("cancelItemButton")
         self.cancel_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         self.cancel_btn.setMinimumSize(QSize(140, 80))
         self.cancel_btn.setMaximumSize(QSize(140, 80))
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ef4444;
-                color: white;
-                border-radius: 12px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #dc2626;
-            }
-        """)
         self.cancel_btn.clicked.connect(self.cancel_item)
         button_grid.addWidget(self.cancel_btn, 0, 1)
 
         # Print - BLUE
         self.print_btn = QPushButton("🖨️\nPRINT")
+        self.print_btn.setObjectName("printButton")
         self.print_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         self.print_btn.setMinimumSize(QSize(140, 80))
         self.print_btn.setMaximumSize(QSize(140, 80))
-        self.print_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border-radius: 12px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-        """)
         self.print_btn.clicked.connect(self.print_receipt)
         button_grid.addWidget(self.print_btn, 1, 0)
 
         # PDF - PURPLE
         self.pdf_btn = QPushButton("📄\nSAVE PDF")
+        self.pdf_btn.setObjectName("pdfButton")
         self.pdf_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         self.pdf_btn.setMinimumSize(QSize(140, 80))
         self.pdf_btn.setMaximumSize(QSize(140, 80))
-        self.pdf_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8b5cf6;
-                color: white;
-                border-radius: 12px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-        """)
         self.pdf_btn.clicked.connect(self.print_receipt_to_pdf)
         button_grid.addWidget(self.pdf_btn, 1, 1)
 
         # Report - ORANGE (spans 2 columns)
         self.report_btn = QPushButton("📊\nREPORT")
+        self.report_btn.setObjectName("reportButton")
         self.report_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         self.report_btn.setMinimumSize(QSize(288, 80))
         self.report_btn.setMaximumSize(QSize(288, 80))
-        self.report_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f59e0b;
-                color: white;
-                border-radius: 12px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #d97706;
-            }
-        """)
-        self.report_btn.clicked.connect(lambda: generate_sales_report(self))
+        self.report_btn.clicked.connect(self.open_sales_report)
         button_grid.addWidget(self.report_btn, 2, 0, 1, 2)
         
         # Add buttons at BOTTOM of layout
@@ -767,253 +277,173 @@ class AkbarCashier(QMainWindow):
         self.show_stock_summary()
 
     def load_products(self):
-        data_path = os.path.join("data", "products.csv")
-        os.makedirs("data", exist_ok=True)
-        
-        if not os.path.exists(data_path) or os.stat(data_path).st_size == 0:
-            sample_data = """product_id,name,category,price,stock
-AJ001,Milo 3-in-1,Drink,1.80,25
-AJ002,Maggi Curry,Food,3.50,40
-AJ003,Sprite Can,Drink,1.60,30
-AJ004,Rice 5kg,Food,13.50,10
-AJ005,Battery AA,Electronics,2.00,15
-"""
-            with open(data_path, "w", encoding="utf-8") as f:
-                f.write(sample_data)
-        
-        try:
-            df = pd.read_csv(data_path)
-        except Exception as e:
-            print(f"[ERROR] Failed to load products.csv: {e}")
-            df = pd.DataFrame(columns=["product_id", "name", "category", "price", "stock"])
-        
-        return df
+        return self.storage.load_products()
 
+    def open_sales_report(self):
+        # The report engine is only imported the first time a report is made
+        from report_improved import generate_sales_report
+        generate_sales_report(self)
+
+    @perf_monitor.timed("refresh_product_list")
     def refresh_product_list(self):
-        self.products = self.load_products()
-        
-        if 'price' in self.products.columns:
-            self.products['price'] = pd.to_numeric(self.products['price'], errors='coerce').fillna(0.0)
-        if 'stock' in self.products.columns:
-            self.products['stock'] = pd.to_numeric(self.products['stock'], errors='coerce').fillna(0).astype(int)
-
-        # Clear existing buttons (skip the title label at index 0)
-        for i in reversed(range(self.product_layout.count())):
-            if i > 0:  # Keep the title label
-                widget = self.product_layout.itemAt(i).widget()
-                if widget:
-                    widget.setParent(None)
+        """Reload products from storage and rebuild the catalog buttons"""
+        from modules.catalog import ProductCatalog
+        # Catalog coerces price/stock dtypes and indexes products by ID
+        self.catalog = ProductCatalog(self.load_products())
+        self.products = self.catalog.df
+        if self.catalog_dialog is not None:
+            self.catalog_dialog.set_catalog(self.catalog)
+        self.search_index = ProductSearchIndex(self.catalog)
+        self.barcode_index = BarcodeIndex(self.catalog)
+        self.search_model.set_catalog(self.catalog)
+        self.search_products(self.search_input.text())
+
+        # Clear existing buttons
+        while self.prefix_layout.count():
+            widget = self.prefix_layout.takeAt(0).widget()
+            if widget:
+                widget.setParent(None)
 
         # Get unique catalog prefixes (first 2 characters of product_id)
         catalogs = {}
-        for _, p in self.products.iterrows():
-            prefix = p['product_id'][:2]  # Get first 2 chars (AJ, PK, OB, etc.)
-            if prefix not in catalogs:
-                catalogs[prefix] = []
-            catalogs[prefix].append(p)
-        
-        # Default colors for categories
-        colors = {
-            'Drink': '#3b82f6',
-            'Food': '#10b981',
-            'Electronics': '#f59e0b',
-            'default': '#6366f1'
-        }
-        
+        for product in self.catalog:
+            catalogs.setdefault(product.product_id[:2], []).append(product)
+
+        # Per-prefix low-stock bookkeeping lets a sale repaint only flipped buttons
+        self.prefix_buttons = {}
+        self.prefix_low_counts = {}
+        self.low_stock_ids = {p.product_id for p in self.catalog if is_low_stock(p.stock)}
+
         # Create catalog buttons
         for prefix in sorted(catalogs.keys()):
             products_in_catalog = catalogs[prefix]
-            
-            # Check if any product in this catalog has low stock
-            has_low_stock = any(int(p.get('stock', 0)) <= 5 for p in products_in_catalog)
-            
-            # Determine color based on first product's category or low stock
-            first_product = products_in_catalog[0]
-            category = str(first_product.get('category', 'default'))
-            color = colors.get(category, colors['default'])
-            
-            if has_low_stock:
-                color = '#ef4444'  # Red for low stock
-            
+
+            # Color based on first product's category; red while any product is low
+            category = products_in_catalog[0].category
+            self.prefix_low_counts[prefix] = sum(
+                1 for p in products_in_catalog if p.product_id in self.low_stock_ids
+            )
+
             # Count products in catalog
             count = len(products_in_catalog)
-            
+
             # Create catalog button
             btn = QPushButton(f"📁\n{prefix}\n({count} items)")
+            btn.setObjectName("prefixButton")
+            btn.setProperty("category", category)
             btn.setFont(QFont("Arial", 20, QFont.Weight.Bold))
             btn.setMinimumSize(QSize(150, 150))
             btn.setMaximumSize(QSize(150, 150))
-            
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    color: white;
-                    border: none;
-                    border-radius: 15px;
-                    padding: 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: {color};
-                    opacity: 0.85;
-                    transform: scale(1.05);
-                }}
-            """)
-            
+            self.prefix_buttons[prefix] = btn
+            self._style_prefix_button(prefix)
+
             # Connect to open catalog dialog
             btn.clicked.connect(lambda _, p=prefix: self.open_catalog_dialog(p))
-            self.product_layout.addWidget(btn)
-        
+            self.prefix_layout.addWidget(btn)
+
         # Add stretch to push buttons to top
-        self.product_layout.addStretch()
+        self.prefix_layout.addStretch()
 
-    def open_catalog_dialog(self, catalog_prefix):
-        """Open a dialog showing all products in the selected catalog"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle(f"Catalog: {catalog_prefix}")
-        dialog.setGeometry(200, 200, 800, 600)
-        dialog.setStyleSheet("QDialog { background-color: #f8fafc; }")
-        
-        layout = QVBoxLayout()
-        dialog.setLayout(layout)
-        
-        # Title
-        title = QLabel(f"📂 {catalog_prefix} Products")
-        title.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            color: #1e40af;
-            background-color: #dbeafe;
-            padding: 15px;
-            border-radius: 10px;
-            margin: 10px;
-        """)
-        layout.addWidget(title)
-        
-        # Scroll area for products
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
-        
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout()
-        scroll_widget.setLayout(scroll_layout)
-        scroll.setWidget(scroll_widget)
-        
-        # Filter products by prefix
-        catalog_products = self.products[self.products['product_id'].str.startswith(catalog_prefix)]
-        
-        # Default colors
-        colors = {
-            'Drink': '#3b82f6',
-            'Food': '#10b981',
-            'Electronics': '#f59e0b',
-            'default': '#6366f1'
-        }
-        
-        # Create product buttons
-        for _, p in catalog_products.iterrows():
-            try:
-                label_text = (
-                    f"🏷️ {p['product_id']}\n"
-                    f"📦 {p['name']}\n"
-                    f"💰 ${float(p['price']):.2f}\n"
-                    f"📊 Stock: {int(p['stock'])}\n"
-                )
-            except:
-                label_text = f"{p.get('product_id','Unknown')} — {p.get('name','Unnamed')}"
-            
-            btn = QPushButton(label_text)
-            btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-            btn.setMinimumHeight(100)
-            
-            category = str(p.get('category', 'default'))
-            color = colors.get(category, colors['default'])
-            
-            if int(p.get('stock', 0)) <= 5:
-                color = '#ef4444'
-            
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    color: white;
-                    border: none;
-                    border-radius: 10px;
-                    padding: 15px;
-                    text-align: left;
-                }}
-                QPushButton:hover {{
-                    background-color: {color};
-                    opacity: 0.85;
-                }}
-            """)
-            
-            # Add to cart and close dialog
-            btn.clicked.connect(lambda _, pid=p['product_id']: self.add_to_cart_and_close(pid, dialog))
-            scroll_layout.addWidget(btn)
-        
-        layout.addWidget(scroll)
-        
-        # Close button
-        close_btn = QPushButton("❌ Close")
-        close_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        close_btn.setMinimumHeight(50)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6b7280;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #4b5563;
-            }
-        """)
-        close_btn.clicked.connect(dialog.close)
-        layout.addWidget(close_btn)
-        
-        dialog.exec()
-    
-    def add_to_cart_and_close(self, product_id, dialog):
-        """Add product to cart and optionally close dialog"""
-        self.add_to_cart(product_id)
-        # Don't close dialog automatically - let user add multiple items
-        # dialog.close()
+    def search_products(self, text):
+        """Show ranked matches for the search box; the catalog buttons stay below"""
+        if not text.strip():
+            self.search_results.hide()
+            return
+        self.search_model.set_product_ids(self.search_index.search(text))
+        self.search_results.scrollToTop()
+        self.search_results.show()
+
+    def _style_prefix_button(self, prefix):
+        """Color a catalog button by category, or red while it holds low-stock products"""
+        set_state(self.prefix_buttons[prefix], "lowStock", self.prefix_low_counts[prefix] > 0)
+
+    def apply_stock_changes(self, product_ids):
+        """
+        Update the catalog display after stock changed in the in-memory catalog
+        Only catalog buttons whose low-stock state flipped are restyled.
+        """
+        flipped = set()
+        for pid in product_ids:
+            product = self.catalog.get(pid)
+            if product is None:
+                continue
+            low = is_low_stock(product.stock)
+            if low == (pid in self.low_stock_ids):
+                continue
+            prefix = pid[:2]
+            before = self.prefix_low_counts[prefix] > 0
+            if low:
+                self.low_stock_ids.add(pid)
+                self.prefix_low_counts[prefix] += 1
+            else:
+                self.low_stock_ids.discard(pid)
+                self.prefix_low_counts[prefix] -= 1
+            if (self.prefix_low_counts[prefix] > 0) != before:
+                flipped.add(prefix)
+
+        for prefix in flipped:
+            self._style_prefix_button(prefix)
+        # Tiles showing these products repaint with the new stock
+        for pid in product_ids:
+            self.search_model.product_changed(pid)
+            if self.catalog_dialog is not None:
+                self.catalog_dialog.model.product_changed(pid)
 
+    def open_catalog_dialog(self, catalog_prefix):
+        """Open the (reused) catalog dialog on the selected prefix"""
+        if self.catalog_dialog is None:
+            self.catalog_dialog = CatalogDialog(self.catalog, self)
+            # Keep the dialog open so several items can be added
+            self.catalog_dialog.product_selected.connect(self.add_to_cart)
+        self.catalog_dialog.show_prefix(catalog_prefix)
+        self.scan_input.setFocus()
+
+    @perf_monitor.timed("add_to_cart")
     def add_to_cart(self, product_id):
-        product = self.products[self.products['product_id'] == product_id].iloc[0]
-        current_qty_in_cart = self.cart.count(product_id)
+        product = self.catalog[product_id]
+        current_qty_in_cart = self.cart.quantity(product_id)
         
-        if product['stock'] <= current_qty_in_cart:
+        if product.stock <= current_qty_in_cart:
             QMessageBox.warning(self, "Out of Stock", 
-                              f"{product['name']} has only {product['stock']} left in stock!")
+                              f"{product.name} has only {product.stock} left in stock!")
             return
         
-        self.cart.append(product_id)
-        self.update_cart_label()
+        self.cart.add(product)
+        self.cart_panel.refresh_line(product_id)
+
+    @perf_monitor.timed("add_scanned")
+    def add_scanned(self, text):
+        """Add a scanned code (optionally N*CODE) to the cart without any dialog"""
+        scan = parse_scan(text)
+        product_id = self.barcode_index.lookup(scan[1]) if scan else None
+        if product_id is None:
+            self._scan_feedback(f"❌ Unknown code: {text.strip()}", error=True)
+            return
+        qty = scan[0]
+        product = self.catalog[product_id]
+        available = product.stock - self.cart.quantity(product_id)
+        if qty > available:
+            self._scan_feedback(f"❌ {product.name}: only {max(available, 0)} left in stock", error=True)
+            return
+
+        if self.receipt_display.isVisible():
+            # First scan of the next customer closes the previous receipt
+            self.receipt_display.clear()
+            self.receipt_display.hide()
+            self.cart_panel.show()
+        self.cart.add(product, qty)
+        self.cart_panel.refresh_line(product_id)
+        self._scan_feedback(f"✅ {qty} x {product.name}")
+
+    def _scan_feedback(self, message, error=False):
+        if error:
+            QApplication.beep()
+        self.scan_status.setText(message)
+        set_state(self.scan_status, "state", "error" if error else "ok")
 
     def update_cart_label(self):
-        text = "🛒 Shopping Cart:\n\n"
-        summary = {}
-        for pid in self.cart:
-            summary[pid] = summary.get(pid, 0) + 1
-        
-        if not summary:
-            text += "  (Empty)\n"
-        else:
-            for pid, qty in summary.items():
-                product = self.products[self.products['product_id'] == pid].iloc[0]
-                name = product['name']
-                price = float(product['price'])
-                total = price * qty
-                text += f"  • {name}\n"
-                text += f"    {qty} × ${price:.2f} = ${total:.2f}\n\n"
-            
-            grand_total = sum(float(self.products[self.products['product_id'] == pid].iloc[0]['price']) 
-                            for pid in self.cart)
-            text += f"───────────────────\n"
-            text += f"TOTAL: ${grand_total:.2f}\n"
-        
-        self.cart_label.setText(text)
+        """Redraw the whole cart panel (after the cart is cleared)"""
+        self.cart_panel.refresh_all()
 
     def show_stock_summary(self):
         low_stock = self.products[self.products['stock'] <= 5]
@@ -1035,64 +465,105 @@ AJ005,Battery AA,Electronics,2.00,15
             QMessageBox.information(self, "Empty Cart", "Your cart is empty!")
             return
 
-        total = sum(float(self.products[self.products['product_id'] == pid].iloc[0]['price']) 
-                   for pid in self.cart)
+        total = self.cart.subtotal
         
-        # Create a larger, elderly-friendly payment dialog
-        payment_dialog = LargePaymentDialog(self, total)
-        result = payment_dialog.exec()
+        self.build_checkout_dialogs()
+
+        # Larger, elderly-friendly payment dialog
+        self.payment_dialog.reset(total)
+        result = self.payment_dialog.exec()
         
         if result != QDialog.DialogCode.Accepted:
             return
         
-        payment = payment_dialog.payment_amount
-        ok = True
-        
-        if not ok or payment < total:
-            QMessageBox.warning(self, "Payment Error", 
-                              f"Payment must be at least ${total:.2f}.")
-            return
-        
+        # validate_payment() only accepts the dialog for at least the total
+        payment = self.payment_dialog.payment_amount
         change = payment - total
 
         # Use custom large dialog for customer name input
-        name_dialog = LargeCustomerNameDialog(self)
-        result = name_dialog.exec()
+        self.name_dialog.reset()
+        result = self.name_dialog.exec()
         
         if result == QDialog.DialogCode.Accepted:
-            customer_name = name_dialog.customer_name
+            customer_name = self.name_dialog.customer_name
         else:
             customer_name = "Customer"
 
-        for pid in self.cart:
-            idx = self.products[self.products['product_id'] == pid].index[0]
-            self.products.at[idx, 'stock'] -= 1
-        self.products.to_csv(os.path.join("data", "products.csv"), index=False)
+        # The receipt is rendered from the cart now; the commit runs on the
+        # write lane and the cart is only emptied once it is durable.
+        # Timed from here: the dialogs above wait on the customer.
+        with perf_monitor.span("checkout"):
+            receipt_text = generate_receipt_text(
+                self.cart, self.catalog,
+                customer_name=customer_name,
+                payment_amount=payment,
+                change_amount=change,
+                cashier_name=f"{self.cashier_name} (ID: {self.employee_id})"
+            )
+            self.checkout_btn.setEnabled(False)
+            self.statusBar().showMessage("💾 Saving sale...")
+            self.save_sales(
+                customer_name,
+                on_done=lambda sale: self.sale_saved(sale, receipt_text, payment, change),
+                on_error=self.sale_failed
+            )
+
+    def build_checkout_dialogs(self):
+        """Create the checkout dialogs once; later checkouts only reset them"""
+        if self.payment_dialog is None:
+            self.payment_dialog = LargePaymentDialog(self)
+            self.name_dialog = LargeCustomerNameDialog(self)
+            self.completion_dialog = LargeCompletionDialog(self)
+
+    def sale_saved(self, sale, receipt_text, payment, change):
+        """GUI-thread completion of a committed checkout"""
+        with perf_monitor.span("checkout_finish"):
+            deltas = sale['deltas']
+            self.checkout_btn.setEnabled(True)
+            self.statusBar().showMessage("✅ Sale saved", 3000)
+            # The catalog belongs to the GUI thread; the write lane only wrote files
+            self.catalog.apply_stock_deltas(deltas)
+            self.apply_stock_changes(list(deltas))
+
+            # Remove exactly what was sold; items scanned meanwhile stay in the cart
+            for pid, delta in deltas.items():
+                self.cart.remove(pid, -delta)
+            self.update_cart_label()
+
+            record = sale['record']
+            activity_logger.log_sale(
+                record['employee_id'], record['cashier_name'], record['customer_name'],
+                record['total'], -sum(deltas.values())
+            )
+
+            # NEW v1.4: Show receipt box and HIDE cart completely
+            self.receipt_display.setPlainText(receipt_text)
+            self.receipt_display.show()  # Show receipt after checkout
+
+            # HIDE cart completely to focus on receipt
+            self.cart_panel.hide()
 
-        self.save_sales(customer_name)
+        # Show large completion dialog for elderly
+        self.completion_dialog.reset(payment, change)
+        self.completion_dialog.exec()
+        self.scan_input.setFocus()
 
-        receipt_text = generate_receipt_text(
-            self.cart, self.products,
-            customer_name=customer_name,
-            payment_amount=payment,
-            change_amount=change,
-            cashier_name=f"{self.cashier_name} (ID: {self.employee_id})"
-        )
-        
-        # NEW v1.4: Show receipt box and HIDE cart completely
-        self.receipt_display.setPlainText(receipt_text)
-        self.receipt_display.show()  # Show receipt after checkout
-        
-        # HIDE cart completely to focus on receipt
-        self.cart_scroll_area.hide()
+    def sale_failed(self, error):
+        self.checkout_btn.setEnabled(True)
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "Checkout Failed",
+                            f"The sale could not be saved and the cart was kept:\n{error}")
 
-        self.cart = []
-        self.update_cart_label()
-        self.refresh_product_list()
-        
-        # Show large completion dialog for elderly
-        completion_dialog = LargeCompletionDialog(self, payment, change)
-        completion_dialog.exec()
+    def show_perf_summary(self):
+        PerfSummaryDialog(perf_monitor, self).exec()
+
+    def on_jobs_busy(self, busy):
+        self.busy_bar.setRange(0, 0)  # Indeterminate until a job reports progress
+        self.busy_bar.setVisible(busy)
+
+    def on_job_progress(self, percent):
+        self.busy_bar.setRange(0, 100)
+        self.busy_bar.setValue(percent)
 
     def print_receipt(self):
         if not self.receipt_display.toPlainText().strip():
@@ -1103,15 +574,14 @@ AJ005,Battery AA,Electronics,2.00,15
         dialog = QPrintDialog(printer, self)
         
         if dialog.exec() == QPrintDialog.DialogCode.Accepted:
-            self.receipt_display.print(printer)
+            self.print_in_background(printer)
         
         # Reset: Hide receipt, show cart again, clear data
-        self.cart = []
+        self.cart.clear()
         self.update_cart_label()
         self.receipt_display.clear()
         self.receipt_display.hide()  # Hide receipt again
-        self.cart_scroll_area.show()  # Show cart again
-        self.refresh_product_list()
+        self.cart_panel.show()  # Show cart again
         
         QMessageBox.information(self, "Ready", "✅ Transaction completed!")
 
@@ -1129,22 +599,27 @@ AJ005,Battery AA,Electronics,2.00,15
         
         if filename:
             printer.setOutputFileName(filename)
-            self.receipt_display.print(printer)
-            QMessageBox.information(self, "Saved", f"✅ Receipt saved as PDF:\n{filename}")
+            self.print_in_background(
+                printer,
+                on_done=lambda _: QMessageBox.information(self, "Saved", f"✅ Receipt saved as PDF:\n{filename}")
+            )
+
+    def print_in_background(self, printer, on_done=None):
+        """Print (or write to PDF) a snapshot of the receipt on a worker thread"""
+        # Pass a text snapshot; the widget may be cleared meanwhile
+        self.jobs.run(
+            print_text, self.receipt_display.toPlainText(), self.receipt_display.font(), printer,
+            name="print receipt",
+            on_done=on_done,
+            on_error=lambda error: QMessageBox.warning(self, "Print Error", f"Failed to print receipt:\n{error}")
+        )
 
     def cancel_item(self):
         if not self.cart:
             QMessageBox.information(self, "Cart Empty", "No items to cancel.")
             return
 
-        summary = {}
-        for pid in self.cart:
-            summary[pid] = summary.get(pid, 0) + 1
-        
-        items_list = [
-            f"{self.products[self.products['product_id']==pid].iloc[0]['name']} x {qty}" 
-            for pid, qty in summary.items()
-        ]
+        items_list = [f"{line.name} x {line.qty}" for line in self.cart]
 
         item, ok = QInputDialog.getItem(
             self, "Cancel Item", "Select item to remove:", items_list, 0, False
@@ -1152,38 +627,65 @@ AJ005,Battery AA,Electronics,2.00,15
         
         if ok and item:
             pid_to_remove = None
-            for pid, qty in summary.items():
-                name = self.products[self.products['product_id']==pid].iloc[0]['name']
-                if item.startswith(name):
-                    pid_to_remove = pid
+            for line in self.cart:
+                if item.startswith(line.name):
+                    pid_to_remove = line.product_id
                     break
             
             if pid_to_remove:
                 self.cart.remove(pid_to_remove)
-                self.update_cart_label()
+                self.cart_panel.refresh_line(pid_to_remove)
                 QMessageBox.information(self, "Item Removed", f"✅ {item} removed from cart.")
 
-    def save_sales(self, customer_name="Customer"):
-        sales_path = os.path.join("data", "sales.csv")
-        os.makedirs("data", exist_ok=True)
-        
+    @perf_monitor.timed("save_sales")
+    def save_sales(self, customer_name="Customer", on_done=None, on_error=None):
+        """
+        Commit the cart's stock changes, sales record and line items as one transaction
+
+        The commit is queued on the ordered write lane and only writes
+        storage; on_done receives {'sale_id', 'deltas', 'record'} on the GUI
+        thread once it is durable, and applies the deltas to the catalog there.
+        """
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        df_sale = pd.DataFrame([{
+        sale_record = {
             'datetime': now,
             'customer_name': customer_name,
             'cashier_name': self.cashier_name,
             'employee_id': self.employee_id,
-            'products': ",".join(self.cart)
-        }])
-        
-        if os.path.exists(sales_path) and os.stat(sales_path).st_size > 0:
-            try:
-                df_existing = pd.read_csv(sales_path)
-                df_sale = pd.concat([df_existing, df_sale], ignore_index=True)
-            except pd.errors.EmptyDataError:
-                pass
-        
-        df_sale.to_csv(sales_path, index=False)
+            'total': self.cart.subtotal
+        }
+        deltas = self.cart.stock_deltas()
+        return self.jobs.write(
+            commit_sale, self.storage, deltas, sale_record, self.cart.sale_items(),
+            name="commit sale", on_done=on_done, on_error=on_error
+        )
+
+    def closeEvent(self, event):
+        """Write pending stock changes to storage before exiting"""
+        # Let queued sale commits finish before the final stock checkpoint
+        self.jobs.wait()
+        perf_monitor.stop()
+        try:
+            self.storage.checkpoint()
+        except Exception as e:
+            print(f"[ERROR] Failed to save products on exit: {e}")
+        self.storage.release_till()
+        super().closeEvent(event)
+
+@perf_monitor.timed("commit_sale")
+def commit_sale(storage, deltas, sale_record, items):
+    """Write-lane job: commit one sale and report what was committed (no catalog access)"""
+    sale_id = storage.commit_sale(deltas, sale_record, items)
+    return {'sale_id': sale_id, 'deltas': deltas, 'record': sale_record}
+
+
+def print_text(text, font, printer):
+    """Worker job: QPainter may draw to a QPrinter outside the GUI thread"""
+    # Built here so the document belongs to the worker thread
+    document = QTextDocument()
+    document.setDefaultFont(font)
+    document.setPlainText(text)
+    document.print(printer)
 
 
 def main():
@@ -1194,19 +696,50 @@ def main():
     print("=" * 60)
     
     app = QApplication(sys.argv)
-    
-    # Show welcome screen first
-    welcome = WelcomeScreen()
+    apply_theme()
+
+    # Show welcome screen first; pandas, storage and crash recovery load
+    # in the background while it is on screen
+    with startup_trace.phase("welcome screen"):
+        from modules.welcome_screen import WelcomeScreen
+        welcome = WelcomeScreen()
+    warm_up()
+
+    def welcome_shown():
+        startup_trace.mark("welcome screen shown")
+        if os.environ.get("AKBAR_EXIT_AFTER_STARTUP"):
+            # Launch benchmark (build_exe_script.py --benchmark): quit once warmed up
+            wait_for_warm_up()
+            startup_trace.mark("warm-up finished")
+            welcome.reject()
+        startup_trace.report()
+
+    QTimer.singleShot(0, welcome_shown)
     result = welcome.exec()
     
     # If user selected cashier mode, start the cashier system
     if result == QDialog.DialogCode.Accepted and welcome.selected_mode == "cashier":
-        win = AkbarCashier()
+        wait_for_warm_up()
+        from modules.storage import get_storage
+        if not get_storage().acquire_till():
+            # Two tills on the same CSV files would checkpoint over each other's sales
+            QMessageBox.critical(None, "Till Already Running",
+                                 "❌ Another till is already using these data files.\n\n"
+                                 "Close it first, or use the SQLite backend to run several tills.")
+            activity_logger.close()
+            sys.exit(1)
+        with startup_trace.phase("cashier window"):
+            win = AkbarCashier()
         win.cashier_name = welcome.cashier_name
         win.employee_id = welcome.employee_id
         win.cashier_label.setText(f"👤 Cashier: {win.cashier_name} (ID: {win.employee_id})")
         win.show()
-        sys.exit(app.exec())
+        win.scan_input.setFocus()
+        # Build the checkout dialogs while the till is idle, before the first sale
+        QTimer.singleShot(0, win.build_checkout_dialogs)
+        exit_code = app.exec()
+        activity_logger.close()
+        sys.exit(exit_code)
     else:
         print("\n✅ Thank you for using Akbar Jaya Cashier System!")
         sys.exit(0)
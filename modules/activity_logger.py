@@ -1,76 +1,151 @@
 """
 LOGGING UTILITY
 Handles all logging activities for the cashier system
-Creates organized log files by date
+One JSON-lines file per day (logs/activity_YYYY-MM-DD.jsonl), rotated by size
+
+log_activity only formats the record and appends it to an in-memory buffer;
+a background thread writes the buffer to the open daily file every second
+(or sooner when it fills up). The buffer is flushed on shutdown.
 """
 
+import atexit
+import json
 import os
+import threading
 from datetime import datetime
 
 
+FLUSH_INTERVAL = 1.0         # seconds between background flushes
+FLUSH_LINES = 256            # flush early once this many records are waiting
+MAX_FILE_BYTES = 10 << 20    # rotate the daily file beyond 10 MB
+
+
 class ActivityLogger:
     """Logger for tracking system activities"""
-    
-    def __init__(self):
-        self.base_log_dir = "logs"
-        self._ensure_log_directory()
-    
-    def _ensure_log_directory(self):
-        """Ensure the logs directory exists"""
-        if not os.path.exists(self.base_log_dir):
-            os.makedirs(self.base_log_dir)
-    
-    def _get_date_folder(self):
-        """Get the folder path for today's date"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        date_folder = os.path.join(self.base_log_dir, today)
-        
-        # Create folder if it doesn't exist
-        if not os.path.exists(date_folder):
-            os.makedirs(date_folder)
-        
-        return date_folder
-    
-    def _get_log_file_path(self):
-        """Get the current log file path with timestamp"""
-        date_folder = self._get_date_folder()
-        timestamp = datetime.now().strftime("%H-%M-%S")
-        log_file = os.path.join(date_folder, f"activity_{timestamp}.log")
-        return log_file
-    
+
+    def __init__(self, base_log_dir="logs", flush_interval=FLUSH_INTERVAL, max_bytes=MAX_FILE_BYTES,
+                 prefix="activity"):
+        self.base_log_dir = base_log_dir
+        self.prefix = prefix
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self._buffer = []
+        self._lock = threading.Lock()        # guards the buffer
+        self._write_lock = threading.Lock()  # guards the open file
+        self._wake = threading.Event()
+        self._thread = None
+        self._closed = False
+        self._file = None
+        self._file_day = None
+        atexit.register(self.close)
+
+    def _get_log_file_path(self, day, part=0):
+        """Path of the daily log file; rotated parts get a numeric suffix"""
+        suffix = f".{part}" if part else ""
+        return os.path.join(self.base_log_dir, f"{self.prefix}_{day}{suffix}.jsonl")
+
+    def _start_flusher(self):
+        """Start the background flusher on first use (caller holds the buffer lock)"""
+        self._thread = threading.Thread(target=self._run, name="activity-log-flusher", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _open_for(self, day):
+        """Keep the file for `day` open, switching files at midnight"""
+        if self._file_day == day and self._file is not None:
+            return self._file
+        if self._file is not None:
+            self._file.close()
+        os.makedirs(self.base_log_dir, exist_ok=True)
+        self._file = open(self._get_log_file_path(day), "a", encoding="utf-8")
+        self._file_day = day
+        return self._file
+
+    def _rotate(self):
+        """Move a full daily file aside as <prefix>_<day>.<n>.jsonl"""
+        self._file.close()
+        self._file = None
+        part = 1
+        while os.path.exists(self._get_log_file_path(self._file_day, part)):
+            part += 1
+        os.replace(self._get_log_file_path(self._file_day),
+                   self._get_log_file_path(self._file_day, part))
+
+    def flush(self):
+        """Write all buffered records to disk"""
+        with self._lock:
+            pending, self._buffer = self._buffer, []
+        if not pending:
+            return
+
+        with self._write_lock:
+            try:
+                start = 0
+                while start < len(pending):
+                    # Records arrive in time order, so each day is one contiguous run
+                    day = pending[start][0]
+                    end = start
+                    while end < len(pending) and pending[end][0] == day:
+                        end += 1
+                    f = self._open_for(day)
+                    f.write("".join(line for _, line in pending[start:end]))
+                    f.flush()
+                    if f.tell() >= self.max_bytes:
+                        self._rotate()
+                    start = end
+            except Exception as e:
+                print(f"[ERROR] Failed to write log: {e}")
+
+    def close(self):
+        """Stop the flusher and write out everything still buffered"""
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.flush()
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
     def log_activity(self, activity_type, employee_id, employee_name, details):
         """
-        Log an activity to file
-        
+        Log an activity as one JSON line
+
         Args:
-            activity_type: Type of activity (LOGIN, STOCK_UPDATE, PRICE_UPDATE, SALE, etc.)
+            activity_type: Type of activity (LOGIN, STOCK_UPDATE, PRICE_UPDATE, BULK_PRICE_UPDATE, STOCK_DELIVERY, SALE, etc.)
             employee_id: Employee ID performing the action
             employee_name: Employee name
             details: Dictionary with activity details
         """
-        log_file = self._get_log_file_path()
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Format log entry
-        log_entry = f"\n{'='*80}\n"
-        log_entry += f"[{timestamp}] {activity_type}\n"
-        log_entry += f"Employee: {employee_name} (ID: {employee_id})\n"
-        log_entry += "-" * 80 + "\n"
-        
-        # Add details
-        for key, value in details.items():
-            log_entry += f"{key}: {value}\n"
-        
-        log_entry += "=" * 80 + "\n"
-        
-        # Write to file
-        try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-            print(f"[LOG] Activity logged: {activity_type}")
-        except Exception as e:
-            print(f"[ERROR] Failed to write log: {e}")
-    
+        self.write_record({
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "type": activity_type,
+            "employee_id": employee_id,
+            "employee_name": employee_name,
+            "details": details,
+        })
+
+    def write_record(self, record):
+        """Buffer one record (a dict with a 'timestamp') as a JSON line"""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+        with self._lock:
+            self._buffer.append((record["timestamp"][:10], line))
+            if not self._closed:
+                if self._thread is None:
+                    self._start_flusher()
+                elif len(self._buffer) >= FLUSH_LINES:
+                    self._wake.set()
+                return
+        # Records logged after shutdown are written straight away
+        self.flush()
+
     def log_login(self, employee_id, employee_name, role):
         """Log employee login"""
         details = {
@@ -79,7 +154,7 @@ class ActivityLogger:
             "Status": "Success"
         }
         self.log_activity("LOGIN", employee_id, employee_name, details)
-    
+
     def log_stock_update(self, employee_id, employee_name, product_id, product_name, old_stock, new_stock):
         """Log stock update"""
         details = {
@@ -91,7 +166,7 @@ class ActivityLogger:
             "Change": f"{new_stock - old_stock:+d}"
         }
         self.log_activity("STOCK_UPDATE", employee_id, employee_name, details)
-    
+
     def log_price_update(self, employee_id, employee_name, product_id, product_name, old_price, new_price):
         """Log price update"""
         details = {
@@ -103,7 +178,40 @@ class ActivityLogger:
             "Change": f"${new_price - old_price:+.2f}"
         }
         self.log_activity("PRICE_UPDATE", employee_id, employee_name, details)
-    
+
+    def log_bulk_price_update(self, employee_id, employee_name, rule, changes):
+        """
+        Log a batch of price changes as one record
+
+        changes is a list of (product_id, old_price, new_price); they are stored
+        as compact [product_id, old, new] triples.
+        """
+        details = {
+            "Action": "Bulk Price Update",
+            "Rule": rule,
+            "Products Changed": len(changes),
+            "Changes": [[pid, round(old, 2), round(new, 2)] for pid, old, new in changes]
+        }
+        self.log_activity("BULK_PRICE_UPDATE", employee_id, employee_name, details)
+
+    def log_stock_delivery(self, employee_id, employee_name, source, lines, rejected, changes):
+        """
+        Log an imported delivery note as one record
+
+        changes is a list of (product_id, units added, new stock); they are
+        stored as compact [product_id, added, stock] triples.
+        """
+        details = {
+            "Action": "Stock Delivery",
+            "Source": source,
+            "Lines": lines,
+            "Rejected Lines": rejected,
+            "Products Changed": len(changes),
+            "Units Added": sum(added for _, added, _ in changes),
+            "Changes": [[pid, int(added), int(stock)] for pid, added, stock in changes]
+        }
+        self.log_activity("STOCK_DELIVERY", employee_id, employee_name, details)
+
     def log_sale(self, employee_id, employee_name, customer_name, total_amount, items_count):
         """Log sale transaction"""
         details = {
@@ -114,7 +222,7 @@ class ActivityLogger:
             "Payment Status": "Completed"
         }
         self.log_activity("SALE", employee_id, employee_name, details)
-    
+
     def log_access_denied(self, employee_id, employee_name, role, attempted_action):
         """Log access denied attempts"""
         details = {
@@ -0,0 +1,115 @@
+"""
+BACKGROUND JOBS
+Runs disk I/O and heavy computation off the Qt GUI thread
+
+Two lanes:
+- run():   a QThreadPool for independent jobs (report pages, PDF rendering)
+- write(): a single worker; jobs run one at a time in submission order, so
+           sale commits never overtake each other and a read queued after a
+           write sees its result
+
+Callbacks (on_done, on_error) and JobRunner.progress are delivered by
+queued signals, so they always run on the GUI thread and may touch widgets.
+"""
+
+import traceback
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class JobSignals(QObject):
+    """Signals of one job, emitted from its worker thread"""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    progress = pyqtSignal(int)
+
+
+class Job(QRunnable):
+    """Calls fn(*args, **kwargs) on a pool thread and reports through signals"""
+
+    def __init__(self, name, fn, args, kwargs):
+        super().__init__()
+        self.setAutoDelete(False)  # JobRunner drops it once the callbacks ran
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = JobSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            print(f"[ERROR] Background job '{self.name}' failed: {e}")
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class JobRunner(QObject):
+    """Submits jobs to the worker lanes and tracks whether any are pending"""
+
+    busy_changed = pyqtSignal(bool)
+    progress = pyqtSignal(int)
+
+    def __init__(self, max_threads=4, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.write_pool = QThreadPool(self)
+        self.write_pool.setMaxThreadCount(1)
+        self._jobs = set()
+
+    @property
+    def busy(self):
+        return bool(self._jobs)
+
+    def run(self, fn, *args, name=None, on_done=None, on_error=None, with_progress=False, **kwargs):
+        """Run an independent job concurrently with others"""
+        return self._submit(self.pool, name, fn, args, kwargs, on_done, on_error, with_progress)
+
+    def write(self, fn, *args, name=None, on_done=None, on_error=None, with_progress=False, **kwargs):
+        """Queue a job on the ordered write lane"""
+        return self._submit(self.write_pool, name, fn, args, kwargs, on_done, on_error, with_progress)
+
+    def _submit(self, pool, name, fn, args, kwargs, on_done, on_error, with_progress):
+        job = Job(name or getattr(fn, "__name__", "job"), fn, args, kwargs)
+        if with_progress:
+            # fn(progress=...) reports 0-100 from the worker thread
+            job.kwargs['progress'] = job.signals.progress.emit
+            job.signals.progress.connect(self.progress)
+        job.signals.finished.connect(lambda result: self._finish(job, on_done, result))
+        job.signals.failed.connect(lambda error: self._finish(job, on_error, error))
+
+        self._jobs.add(job)
+        if len(self._jobs) == 1:
+            self.busy_changed.emit(True)
+        pool.start(job)
+        return job
+
+    def _finish(self, job, callback, value):
+        try:
+            if callback is not None:
+                callback(value)
+        finally:
+            self._jobs.discard(job)
+            if not self._jobs:
+                self.busy_changed.emit(False)
+
+    def wait(self, msecs=-1):
+        """Block until queued writes and running jobs are done (used on exit)"""
+        done = self.write_pool.waitForDone(msecs)
+        return self.pool.waitForDone(msecs) and done
+
+
+_job_runner = None
+
+
+def get_job_runner():
+    """Shared JobRunner for the application"""
+    global _job_runner
+    if _job_runner is None:
+        _job_runner = JobRunner()
+    return _job_runner
@@ -0,0 +1,96 @@
+"""
+BARCODE SCANNER
+Keyboard-wedge barcode entry for the cashier window
+
+A USB scanner "types" the code followed by Enter (some models send Tab).
+ScanInput keeps the characters in its own line edit buffer and emits one
+scanned(code) per terminator, so bursts of scans only queue key events and
+nothing is dropped while the previous code is being added to the cart.
+
+Codes are looked up in a dict built once per catalog load:
+- the product id itself (AJ001), case-insensitive
+- the optional 'barcode' column of products.csv (EAN/UPC numbers)
+
+A quantity prefix multiplies the scan: 5*AJ001 adds five units.
+"""
+
+import re
+
+from PyQt6.QtWidgets import QLineEdit
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
+
+
+_SCAN = re.compile(r"^(?:(\d+)\s*\*\s*)?(\S+)$")
+
+MAX_SCAN_QTY = 999
+
+
+def parse_scan(text):
+    """
+    Split scanner input into (qty, code)
+
+    Returns None when the text is not a code or its multiplier is out of range.
+    """
+    match = _SCAN.match(text.strip())
+    if match is None:
+        return None
+    qty = int(match.group(1)) if match.group(1) else 1
+    if not 1 <= qty <= MAX_SCAN_QTY:
+        return None
+    return qty, match.group(2)
+
+
+def _normalize(code):
+    return str(code).strip().upper()
+
+
+class BarcodeIndex:
+    """O(1) lookup from scanned code to product_id"""
+
+    def __init__(self, catalog=None):
+        self._codes = {}
+        if catalog is not None:
+            self.rebuild(catalog)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def rebuild(self, catalog):
+        """Index product ids and, when present, the barcode column"""
+        codes = {_normalize(product.product_id): product.product_id for product in catalog}
+        if 'barcode' in catalog.df.columns:
+            for pid, barcode in zip(catalog.df['product_id'], catalog.df['barcode']):
+                # Missing barcodes are NaN (CSV), which is the only value unequal to itself, or None (SQLite)
+                if barcode is not None and barcode == barcode and str(barcode).strip():
+                    codes[_normalize(barcode)] = pid
+        self._codes = codes
+
+    def lookup(self, code):
+        """product_id for a scanned code, or None when unknown"""
+        return self._codes.get(_normalize(code))
+
+
+class ScanInput(QLineEdit):
+    """Line edit that emits scanned(code) whenever Enter or Tab ends a code"""
+
+    scanned = pyqtSignal(str)
+
+    def event(self, event):
+        # Tab would otherwise move focus away mid-burst and the next scan's
+        # characters would land in another widget
+        if event.type() == QEvent.Type.KeyPress and event.key() in (Qt.Key.Key_Tab, Qt.Key.Key_Backtab):
+            self._submit()
+            return True
+        return super().event(event)
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self._submit()
+            return
+        super().keyPressEvent(event)
+
+    def _submit(self):
+        code = self.text()
+        self.clear()  # Free the buffer before handling, the next scan may already be queued
+        if code.strip():
+            self.scanned.emit(code)
@@ -0,0 +1,383 @@
+"""
+BENCHMARK SUITE
+Headless timings of the till's hot paths on synthetic data
+
+    python -m modules.benchmark --scale 1000 10000 100000 --out bench.json
+    python -m modules.benchmark --baseline bench.json        # regression check
+
+Each scale runs in its own subprocess, with the Qt offscreen platform, in a
+temporary directory holding one year of about `scale` synthetic sales from
+modules.data_generator, scale/10 products (at least 100) and 12 cashiers:
+
+- load_products          storage.load_products() into a ProductCatalog
+- add_to_cart            add_to_cart for a 500-line basket, then update_cart_label
+- generate_receipt_text  receipt for the 500-line basket
+- save_sales             one 20-line sale committed to storage
+- checkout               AkbarCashier.checkout with dialogs auto-accepted,
+                         until the background commit has been applied
+- report_rollup          report pages from the daily rollup (what the GUI uses)
+- report_full_scan       report summaries recomputed from all sales and items
+- stock_manager_open     StockManagerDialog built, shown and painted (stock
+                         grid over every product)
+- low_stock_restyle      every catalog button switched to low stock and back
+- stock_grid_save        GRID_EDITS stock cells edited in the stock manager,
+                         then saved with one storage update (and logged)
+- bulk_reprice           +1% on every product planned from the catalog and
+                         applied with one storage update and audit record
+- delivery_import        DELIVERY_LINES-line delivery note read in chunks,
+                         checked and added to stock in one commit
+
+Results are JSON (min/median/p95 ms per benchmark and scale); scales whose
+worker failed are listed under 'failed' and make the exit status 1. With
+--baseline the medians are compared with a stored run and the exit status
+is also 1 when any benchmark got slower than the tolerance, or when a
+benchmark of the baseline has no result for a scale that was run (or a
+scale has no baseline at all).
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from modules.data_generator import StoreDataGenerator
+
+
+BASKET_LINES = 500       # distinct products in the large-basket benchmarks
+SALE_LINES = 20          # lines per committed sale
+GRID_EDITS = 300         # stock levels entered in the stock manager per save
+DELIVERY_LINES = 100_000 # lines in the imported delivery note
+DEFAULT_TOLERANCE = 0.20
+NOISE_FLOOR_MS = 1.0     # smaller slowdowns are never reported
+
+
+def write_dataset(scale, backend, seed=0):
+    """Generate one year of about `scale` sales into data/ for the chosen backend"""
+    from modules.storage import CsvStorage, SqliteStorage, DATA_DIR, DB_FILENAME
+    end = datetime.now().date()
+    generator = StoreDataGenerator(
+        skus=max(100, scale // 10), start=end - timedelta(days=364), end=end,
+        sales_per_day=scale / 365, seed=seed
+    )
+    generator.products['stock'] = 1_000_000  # Never runs out during a benchmark
+    if backend == "sqlite":
+        storage = SqliteStorage(os.path.join(DATA_DIR, DB_FILENAME))
+    else:
+        storage = CsvStorage(DATA_DIR)
+    n_sales, n_items = generator.write(storage)
+    return generator.skus, n_sales, n_items
+
+
+# ----- timing -----
+
+def timed(fn, repeat, setup=None):
+    """Milliseconds for `repeat` calls of fn (setup runs untimed before each)"""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples = np.array(samples)
+    return {
+        'repeat': repeat,
+        'min_ms': round(float(samples.min()), 3),
+        'median_ms': round(float(np.median(samples)), 3),
+        'p95_ms': round(float(np.percentile(samples, 95)), 3),
+    }
+
+
+def run_scale(scale, backend, repeat):
+    """Benchmarks for one scale; runs inside the worker subprocess"""
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    os.environ["AKBAR_STORAGE"] = backend
+    workdir = tempfile.mkdtemp(prefix="akbar_bench_")
+    os.chdir(workdir)
+    try:
+        n_products, n_sales, n_items = write_dataset(scale, backend)
+
+        from PyQt6.QtWidgets import QApplication, QDialog, QMessageBox
+        from PyQt6.QtCore import QEventLoop
+        app = QApplication.instance() or QApplication([])
+
+        from modules.storage import get_storage
+        setup_start = time.perf_counter()
+        storage = get_storage()
+        storage.recover()  # start-up work: journal checks and rollup compaction
+        setup_ms = (time.perf_counter() - setup_start) * 1000
+
+        import main_prog_improved as main
+        from modules.catalog import ProductCatalog
+        from modules.report_engine import build_report_pages, summarize_sales
+        from receipt_improved import generate_receipt_text
+
+        # Checkout without anyone at the till; message boxes are reported, not shown
+        for box in ("information", "warning"):
+            setattr(QMessageBox, box, staticmethod(
+                lambda parent, title, text, *a, **k: print(f"[INFO] {title}: {text[:80]!r}", file=sys.stderr)))
+        main.LargePaymentDialog.exec = lambda self: (
+            setattr(self, 'payment_amount', 10 ** 9), QDialog.DialogCode.Accepted)[1]
+        main.LargeCustomerNameDialog.exec = lambda self: QDialog.DialogCode.Rejected
+        main.LargeCompletionDialog.exec = lambda self: QDialog.DialogCode.Accepted
+
+        win = main.AkbarCashier()
+        catalog = win.catalog
+        ids = [p.product_id for p in catalog]
+        basket = ids[:BASKET_LINES]
+        sale = ids[-SALE_LINES:]
+
+        def fill(product_ids):
+            win.cart.clear()
+            win.update_cart_label()
+            for pid in product_ids:
+                win.add_to_cart(pid)
+            win.update_cart_label()
+
+        def wait_for_jobs():
+            while win.jobs.busy:
+                app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 10)
+
+        def save_sale():
+            cart = win.cart
+            record = {'datetime': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                      'customer_name': "Bench", 'cashier_name': "Bench", 'employee_id': "000",
+                      'total': cart.subtotal}
+            deltas = cart.stock_deltas()
+            main.commit_sale(storage, deltas, record, cart.sale_items())
+            catalog.apply_stock_deltas(deltas)
+
+        def checkout():
+            win.checkout()
+            wait_for_jobs()
+
+        def full_scan():
+            summarize_sales(storage.load_sales(), storage.load_sale_items())
+
+        results = {
+            'load_products': timed(lambda: ProductCatalog(storage.load_products()), repeat),
+            'add_to_cart': timed(lambda: fill(basket), repeat),
+        }
+        fill(basket)
+        results['generate_receipt_text'] = timed(
+            lambda: generate_receipt_text(win.cart, catalog, payment_amount=0, change_amount=0), repeat)
+        results['save_sales'] = timed(save_sale, repeat * 2, setup=lambda: fill(sale))
+        results['checkout'] = timed(checkout, repeat * 2, setup=lambda: fill(sale))
+        results['report_rollup'] = timed(lambda: build_report_pages(storage.load_rollup(), catalog), repeat)
+        results['report_full_scan'] = timed(full_scan, max(1, repeat // 2))
+
+        # Widget construction and re-styling cost of the themed windows
+        from modules.stock_manager import StockManagerDialog
+
+        def open_stock_manager():
+            dialog = StockManagerDialog(win, "000", "Bench")
+            dialog.show()
+            app.processEvents()
+            dialog.close()
+            dialog.deleteLater()
+
+        # One product per catalog prefix; its stock decides the button's colour
+        first_of_prefix = {}
+        for pid in ids:
+            first_of_prefix.setdefault(pid[:2], pid)
+
+        def restyle_low_stock():
+            for stock in (0, 1_000_000):
+                for pid in first_of_prefix.values():
+                    catalog.set_stock(pid, stock)
+                win.apply_stock_changes(list(first_of_prefix.values()))
+                app.processEvents()
+
+        # A delivery entered in the stock grid: one save for all edited rows
+        from modules.stock_manager import STOCK_COLUMN
+        stock_dialog = StockManagerDialog(win, "000", "Bench")
+        grid = stock_dialog.model
+        edits = iter(range(1, 10 ** 6))
+
+        def enter_delivery():
+            k = next(edits)
+            for row in range(min(GRID_EDITS, grid.rowCount())):
+                grid.setData(grid.index(row, STOCK_COLUMN), (row + k) % 40 + 1)
+
+        results['stock_manager_open'] = timed(open_stock_manager, max(1, repeat // 2))
+        results['low_stock_restyle'] = timed(restyle_low_stock, repeat * 4)
+        results['stock_grid_save'] = timed(stock_dialog.save_changes, repeat, setup=enter_delivery)
+
+        # Whole-catalog repricing: vectorized plan, one write, one audit record
+        from modules.bulk_pricing import select_products, adjust_prices, apply_price_plan
+
+        def reprice_catalog():
+            products = storage.load_products()
+            plan = adjust_prices(products, select_products(products), percent=1)
+            apply_price_plan(storage, plan, "000", "Bench")
+
+        results['bulk_reprice'] = timed(reprice_catalog, repeat)
+
+        # A large delivery note; about 1 line in 1000 names an unknown product
+        from modules.delivery_import import read_delivery, apply_delivery
+        rng = np.random.default_rng(0)
+        note = pd.DataFrame({
+            'product_id': np.where(rng.random(DELIVERY_LINES) < 0.001, "XX00000",
+                                   rng.choice(np.array(ids), DELIVERY_LINES)),
+            'qty': rng.integers(1, 25, DELIVERY_LINES),
+        })
+        note.to_csv("delivery.csv", index=False)
+        del note
+
+        def import_delivery():
+            plan = read_delivery("delivery.csv", storage.load_products())
+            apply_delivery(storage, plan, "000", "Bench")
+
+        results['delivery_import'] = timed(import_delivery, max(1, repeat // 2))
+
+        win.close()
+        return {
+            'scale': scale,
+            'backend': backend,
+            'products': n_products,
+            'sales': n_sales,
+            'sale_lines': n_items,
+            'setup_ms': round(setup_ms, 1),
+            'results': results,
+        }
+    finally:
+        os.chdir(os.path.dirname(workdir))
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ----- driver -----
+
+def run_suite(scales, backend="csv", repeat=5):
+    """Run every scale in a fresh interpreter and collect the results"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    runs, failed = [], []
+    for scale in scales:
+        print(f"[INFO] Benchmarking {scale} sales ({backend})...", file=sys.stderr)
+        proc = subprocess.run(
+            [sys.executable, "-m", "modules.benchmark", "--worker", str(scale),
+             "--backend", backend, "--repeat", str(repeat)],
+            cwd=root, env=env, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            print(f"[ERROR] Scale {scale} failed:\n{proc.stderr[-2000:]}", file=sys.stderr)
+            failed.append({'scale': scale, 'backend': backend, 'error': proc.stderr[-2000:]})
+            continue
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return {
+        'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': runs,
+        'failed': failed,
+    }
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Rows of (scale, backend, name, base_ms, new_ms, change, slower), whether
+    any regressed, and the (scale, backend, name) of the baseline with no
+    current result (name is None for a scale missing from the baseline)
+    """
+    base = {(r['scale'], r['backend'], name): stats['median_ms']
+            for r in baseline['runs'] for name, stats in r['results'].items()}
+    ran = {(r['scale'], r['backend']) for r in current['runs']}
+    ran |= {(f['scale'], f['backend']) for f in current.get('failed', [])}
+    missing = [key for key in base
+               if key[:2] in ran and key[2] not in _results(current, *key[:2])]
+    missing += [(scale, backend, None) for scale, backend in sorted(ran)
+                if not any(key[:2] == (scale, backend) for key in base)]
+    rows, regressed = [], False
+    for run in current['runs']:
+        for name, stats in run['results'].items():
+            old = base.get((run['scale'], run['backend'], name))
+            if old is None:
+                continue
+            new = stats['median_ms']
+            change = (new - old) / old if old else 0.0
+            slower = change > tolerance and new - old > NOISE_FLOOR_MS
+            regressed |= slower
+            rows.append((run['scale'], run['backend'], name, old, new, change, slower))
+    return rows, regressed, missing
+
+
+def _results(suite, scale, backend):
+    """Benchmark results of one scale in a suite ({} when it did not run)"""
+    for run in suite['runs']:
+        if run['scale'] == scale and run['backend'] == backend:
+            return run['results']
+    return {}
+
+
+def print_results(suite):
+    for run in suite['runs']:
+        print(f"\n{run['sales']} sales / {run['products']} products / {run['sale_lines']} lines "
+              f"({run['backend']}, setup {run['setup_ms']:.0f} ms)")
+        print(f"  {'Benchmark':<24}{'min':>10}{'median':>10}{'p95':>10}  ms")
+        for name, s in run['results'].items():
+            print(f"  {name:<24}{s['min_ms']:>10.2f}{s['median_ms']:>10.2f}{s['p95_ms']:>10.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m modules.benchmark", description=__doc__.split("\n")[2])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1000, 10000],
+                        help="number of synthetic sales (1000 - 1000000)")
+    parser.add_argument("--backend", choices=["csv", "sqlite"], default="csv")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against a stored results file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed median slowdown before failing (0.2 = 20%%)")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        # Keep stdout for the JSON line; the app's own prints go to stderr
+        stdout, sys.stdout = sys.stdout, sys.stderr
+        result = run_scale(args.worker, args.backend, args.repeat)
+        stdout.write(json.dumps(result) + "\n")
+        return 0
+
+    suite = run_suite(args.scale, args.backend, args.repeat)
+    print_results(suite)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(suite, f, indent=2)
+        print(f"\n[INFO] Results written to {args.out}")
+
+    status = 0 if suite['runs'] else 1
+    if suite['failed']:
+        print(f"\n[ERROR] {len(suite['failed'])} scale(s) failed: "
+              f"{', '.join(str(f['scale']) for f in suite['failed'])}")
+        status = 1
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows, regressed, missing = compare(suite, baseline, args.tolerance)
+        print(f"\nAgainst {args.baseline} (tolerance {args.tolerance:.0%}):")
+        for scale, backend, name, old, new, change, slower in rows:
+            flag = "  [SLOWER]" if slower else ""
+            print(f"  {scale:>8} {backend:<7}{name:<24}{old:>10.2f} -> {new:>10.2f} ms  {change:+7.1%}{flag}")
+        for scale, backend, name in missing:
+            print(f"  {scale:>8} {backend:<7}{name or '(no baseline for this scale)':<24}  [MISSING]")
+        if regressed:
+            print("[WARN] Performance regression against baseline")
+            status = 1
+        if missing:
+            print("[WARN] Benchmarks missing from the run or the baseline")
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+BULK PRICING
+Catalog-wide repricing rules and supplier price lists
+
+A PricePlan is computed from the products DataFrame in one vectorized step
+and previewed before anything is written:
+
+    mask = select_products(products, category="Drink")
+    plan = adjust_prices(products, mask, percent=5)        # +5 %
+    plan = adjust_prices(products, mask, amount=-0.10)     # 10 cents off
+    plan = supplier_price_plan(products, "supplier.csv")   # product_id,price
+
+    apply_price_plan(get_storage(), plan, employee_id, employee_name)
+
+apply_price_plan writes every new price with one storage.update_products()
+call and records the whole batch as one audit record. Prices that would
+leave MIN_PRICE..MAX_PRICE, unknown products and unreadable supplier lines
+are listed in plan.rejected instead.
+"""
+
+import numpy as np
+import pandas as pd
+
+from modules.activity_logger import activity_logger
+
+
+MIN_PRICE = 0.01
+MAX_PRICE = 9999.99
+PLAN_COLUMNS = ["product_id", "name", "old_price", "new_price"]
+REJECT_COLUMNS = ["product_id", "reason"]
+
+
+class PricePlan:
+    """Proposed price changes (only products whose price actually changes)"""
+
+    def __init__(self, rule, changes, rejected=None):
+        self.rule = rule
+        self.changes = changes.reset_index(drop=True)
+        self.rejected = rejected if rejected is not None else pd.DataFrame(columns=REJECT_COLUMNS)
+
+    def __len__(self):
+        return len(self.changes)
+
+    def summary(self):
+        text = f"{self.rule}: {len(self.changes)} price(s) change"
+        if len(self.rejected):
+            text += f", {len(self.rejected)} rejected"
+        return text
+
+
+def select_products(products, category=None, prefix=None, product_ids=None):
+    """Boolean mask over products; the given criteria are combined with AND"""
+    mask = np.ones(len(products), dtype=bool)
+    if category is not None:
+        mask &= (products['category'].astype(str) == category).to_numpy()
+    if prefix is not None:
+        mask &= products['product_id'].astype(str).str.startswith(prefix).to_numpy()
+    if product_ids is not None:
+        mask &= products['product_id'].astype(str).isin(set(map(str, product_ids))).to_numpy()
+    return mask
+
+
+def _plan(rule, products, positions, new_prices):
+    """PricePlan for new_prices at row positions of products"""
+    old = products['price'].to_numpy(dtype=float)[positions].round(2)
+    new = np.round(new_prices, 2)
+    ids = products['product_id'].astype(str).to_numpy()[positions]
+
+    invalid = ~np.isfinite(new) | (new < MIN_PRICE) | (new > MAX_PRICE)
+    changed = ~invalid & (new != old)
+    rejected = pd.DataFrame({
+        'product_id': ids[invalid],
+        'reason': [f"price would be ${p:.2f}" for p in new[invalid]],
+    })
+    changes = pd.DataFrame({
+        'product_id': ids[changed],
+        'name': products['name'].astype(str).to_numpy()[positions][changed],
+        'old_price': old[changed],
+        'new_price': new[changed],
+    })
+    return PricePlan(rule, changes, rejected)
+
+
+def adjust_prices(products, mask, percent=None, amount=None, rule=None):
+    """
+    Change the price of every product in mask by a percentage or a fixed
+    amount (exactly one of them), rounded to cents
+    """
+    if (percent is None) == (amount is None):
+        raise ValueError("Give either percent or amount")
+    positions = np.flatnonzero(mask)
+    old = products['price'].to_numpy(dtype=float)[positions]
+    if percent is not None:
+        new = old * (1 + percent / 100)
+        rule = rule or f"{percent:+g}%"
+    else:
+        new = old + amount
+        rule = rule or f"{'+' if amount >= 0 else '-'}${abs(amount):.2f}"
+    return _plan(rule, products, positions, new)
+
+
+def supplier_price_plan(products, source, rule=None):
+    """
+    New prices from a supplier price list (path or file object) with
+    product_id and price columns; extra columns are ignored and a product
+    listed twice takes its last price
+    """
+    supplier = pd.read_csv(source, dtype=str, skipinitialspace=True)
+    supplier.columns = [str(c).strip().lower() for c in supplier.columns]
+    missing = {'product_id', 'price'} - set(supplier.columns)
+    if missing:
+        raise ValueError(f"Supplier file needs columns product_id and price (missing: {', '.join(sorted(missing))})")
+
+    ids = supplier['product_id'].fillna("").str.strip()
+    prices = pd.to_numeric(supplier['price'].str.strip(), errors='coerce')
+    # Hash index of the catalog: product_id -> row position
+    row_of = pd.Series(np.arange(len(products)), index=products['product_id'].astype(str))
+    row_of = row_of[~row_of.index.duplicated()]
+    positions = ids.map(row_of).fillna(-1).astype(int).to_numpy()
+
+    unknown = positions < 0
+    unreadable = ~unknown & prices.isna().to_numpy()
+    rejected = pd.DataFrame({
+        'product_id': pd.concat([ids[unknown], ids[unreadable]], ignore_index=True),
+        'reason': ["unknown product"] * int(unknown.sum()) + ["price is not a number"] * int(unreadable.sum()),
+    })
+
+    valid = ~unknown & ~unreadable
+    # Last line wins for a product listed twice
+    last = pd.Series(prices.to_numpy()[valid], index=positions[valid])
+    last = last[~last.index.duplicated(keep='last')]
+    plan = _plan(rule or "supplier price list", products, last.index.to_numpy(), last.to_numpy())
+    plan.rejected = pd.concat([rejected, plan.rejected], ignore_index=True)
+    return plan
+
+
+def apply_price_plan(storage, plan, employee_id, employee_name):
+    """Write a plan with one storage update and one audit record; returns the number of prices changed"""
+    if not len(plan):
+        return 0
+    new_prices = dict(zip(plan.changes['product_id'], plan.changes['new_price'].astype(float)))
+    applied = storage.update_products({pid: {'price': price} for pid, price in new_prices.items()})
+    changes = plan.changes[plan.changes['product_id'].isin(list(applied))]
+    activity_logger.log_bulk_price_update(
+        employee_id, employee_name, plan.rule,
+        list(zip(changes['product_id'], changes['old_price'].astype(float), changes['new_price'].astype(float)))
+    )
+    return len(changes)
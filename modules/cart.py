@@ -0,0 +1,124 @@
+"""
+SHOPPING CART
+Quantity-keyed cart with running totals
+Add, remove and set-quantity are O(1) regardless of basket size
+"""
+
+
+class CartLine:
+    """One product line in the cart"""
+
+    __slots__ = ("product_id", "name", "unit_price", "qty")
+
+    def __init__(self, product_id, name, unit_price, qty=0):
+        self.product_id = product_id
+        self.name = name
+        self.unit_price = unit_price
+        self.qty = qty
+
+    @property
+    def total(self):
+        return self.unit_price * self.qty
+
+
+class Cart:
+    """Shopping cart keyed by product_id; lines keep insertion order"""
+
+    def __init__(self):
+        self._lines = {}
+        self._subtotal_cents = 0  # Integer cents so the running total never drifts
+        self.item_count = 0
+
+    def __len__(self):
+        """Number of distinct product lines"""
+        return len(self._lines)
+
+    def __bool__(self):
+        return bool(self._lines)
+
+    def __iter__(self):
+        return iter(self._lines.values())
+
+    def __contains__(self, product_id):
+        return product_id in self._lines
+
+    @property
+    def subtotal(self):
+        return self._subtotal_cents / 100
+
+    def lines(self):
+        """Cart lines in the order products were first added"""
+        return list(self._lines.values())
+
+    def line(self, product_id):
+        """Return the line for product_id, or None"""
+        return self._lines.get(product_id)
+
+    def quantity(self, product_id):
+        """Quantity of product_id currently in the cart"""
+        line = self._lines.get(product_id)
+        return line.qty if line else 0
+
+    def _change(self, line, delta):
+        """Apply a quantity delta to a line and the running totals"""
+        line.qty += delta
+        self.item_count += delta
+        self._subtotal_cents += round(line.unit_price * 100) * delta
+        if line.qty <= 0:
+            del self._lines[line.product_id]
+
+    def add(self, product, qty=1):
+        """
+        Add qty units of a product
+
+        Args:
+            product: ProductRecord (or anything with product_id, name, price)
+            qty: Number of units to add
+        """
+        line = self._lines.get(product.product_id)
+        if line is None:
+            line = CartLine(product.product_id, product.name, product.price)
+            self._lines[product.product_id] = line
+        self._change(line, qty)
+        return line
+
+    def remove(self, product_id, qty=1):
+        """Remove up to qty units of product_id; returns units removed"""
+        line = self._lines.get(product_id)
+        if line is None:
+            return 0
+        qty = min(qty, line.qty)
+        self._change(line, -qty)
+        return qty
+
+    def set_quantity(self, product, qty):
+        """Set the quantity of a product line; 0 removes the line"""
+        line = self._lines.get(product.product_id)
+        if line is None:
+            if qty <= 0:
+                return None
+            return self.add(product, qty)
+        self._change(line, qty - line.qty)
+        return line if qty > 0 else None
+
+    def clear(self):
+        """Empty the cart"""
+        self._lines.clear()
+        self._subtotal_cents = 0
+        self.item_count = 0
+
+    def stock_deltas(self):
+        """Stock change per product for committing this cart (negative quantities)"""
+        return {pid: -line.qty for pid, line in self._lines.items()}
+
+    def sale_items(self):
+        """Line item records for the sales history, priced as charged"""
+        return [
+            {
+                'product_id': pid,
+                'qty': line.qty,
+                'unit_price_at_sale': line.unit_price,
+                'line_total': round(line.total, 2),
+            }
+            for pid, line in self._lines.items()
+        ]
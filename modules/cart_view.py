@@ -0,0 +1,148 @@
+"""
+CART PANEL
+Model/view display of the shopping cart
+Only the changed row and the totals footer are repainted on each add/remove
+"""
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFont
+
+
+class CartTableModel(QAbstractTableModel):
+    """Table model over a modules.cart.Cart"""
+
+    HEADERS = ["Item", "Qty", "Price", "Total"]
+
+    def __init__(self, cart, parent=None):
+        super().__init__(parent)
+        self.cart = cart
+        self._rows = []    # product_id per row
+        self._row_of = {}  # product_id -> row
+        self.reset()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        line = self.cart.line(self._rows[index.row()])
+        if line is None:
+            return None
+
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return line.name
+            if col == 1:
+                return str(line.qty)
+            if col == 2:
+                return f"${line.unit_price:.2f}"
+            return f"${line.total:.2f}"
+        if role == Qt.ItemDataRole.TextAlignmentRole and col > 0:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def row_of(self, product_id):
+        """Row showing product_id, or None"""
+        return self._row_of.get(product_id)
+
+    def line_changed(self, product_id):
+        """Sync one product's row after the cart changed"""
+        in_cart = product_id in self.cart
+        row = self._row_of.get(product_id)
+
+        if row is not None and in_cart:
+            self.dataChanged.emit(self.index(row, 1), self.index(row, len(self.HEADERS) - 1))
+        elif row is None and in_cart:
+            row = len(self._rows)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.append(product_id)
+            self._row_of[product_id] = row
+            self.endInsertRows()
+        elif row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            del self._row_of[product_id]
+            for pid in self._rows[row:]:
+                self._row_of[pid] -= 1
+            self.endRemoveRows()
+
+    def reset(self):
+        """Rebuild all rows from the cart"""
+        self.beginResetModel()
+        self._rows = [line.product_id for line in self.cart]
+        self._row_of = {pid: i for i, pid in enumerate(self._rows)}
+        self.endResetModel()
+
+
+class CartPanel(QWidget):
+    """Cart table with a totals footer"""
+
+    def __init__(self, cart, parent=None):
+        super().__init__(parent)
+        self.cart = cart
+        self.setObjectName("cartPanel")
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        title = QLabel("🛒 Shopping Cart:")
+        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        title.setObjectName("cartTitle")
+        layout.addWidget(title)
+
+        self.model = CartTableModel(cart, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setFont(QFont("Arial", 14))
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.table.verticalHeader().hide()
+        # Fixed row heights and section sizes avoid re-measuring every row on change
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(36)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for col in range(1, len(CartTableModel.HEADERS)):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(col, 90)
+        layout.addWidget(self.table, 1)
+
+        self.total_label = QLabel()
+        self.total_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.total_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.total_label.setObjectName("cartTotal")
+        layout.addWidget(self.total_label)
+        self.update_totals()
+
+    def update_totals(self):
+        """Refresh the footer from the cart's running totals"""
+        if not self.cart:
+            self.total_label.setText("(Empty)")
+        else:
+            self.total_label.setText(f"{self.cart.item_count} items    TOTAL: ${self.cart.subtotal:.2f}")
+
+    def refresh_line(self, product_id):
+        """Repaint one cart row and the footer"""
+        self.model.line_changed(product_id)
+        row = self.model.row_of(product_id)
+        if row is not None:
+            self.table.scrollTo(self.model.index(row, 0))
+        self.update_totals()
+
+    def refresh_all(self):
+        """Rebuild every row, e.g. after the cart was cleared"""
+        self.model.reset()
+        self.update_totals()
@@ -0,0 +1,108 @@
+"""
+PRODUCT CATALOG
+In-memory product index keyed by product_id
+Shared by the cashier window, the receipt generator and the sales report
+"""
+
+import numpy as np
+import pandas as pd
+
+
+PRODUCT_COLUMNS = ["product_id", "name", "category", "price", "stock"]
+
+
+class ProductRecord:
+    """Compact view of one product row"""
+
+    __slots__ = ("product_id", "name", "category", "price", "stock")
+
+    def __init__(self, product_id, name, category, price, stock):
+        self.product_id = product_id
+        self.name = name
+        self.category = category
+        self.price = price
+        self.stock = stock
+
+    def __repr__(self):
+        return f"ProductRecord({self.product_id!r}, {self.name!r}, price={self.price}, stock={self.stock})"
+
+
+class ProductCatalog:
+    """Hash index from product_id to ProductRecord with a vectorized stock view"""
+
+    def __init__(self, df=None):
+        if df is None:
+            df = pd.DataFrame(columns=PRODUCT_COLUMNS)
+        df = df.copy()
+
+        for col in PRODUCT_COLUMNS:
+            if col not in df.columns:
+                df[col] = "" if col in ("name", "category") else 0
+        df['product_id'] = df['product_id'].astype(str)
+        df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0.0)
+        df['stock'] = pd.to_numeric(df['stock'], errors='coerce').fillna(0).astype(int)
+        df = df.reset_index(drop=True)
+
+        self.df = df
+        self._build_index()
+
+    def _build_index(self):
+        """(Re)build the id -> record and id -> position lookups"""
+        ids = self.df['product_id'].tolist()
+        names = self.df['name'].astype(str).tolist()
+        categories = self.df['category'].astype(str).tolist()
+        prices = self.df['price'].to_numpy(dtype=float)
+        self.stock_array = self.df['stock'].to_numpy(dtype=np.int64, copy=True)
+
+        self._positions = {pid: i for i, pid in enumerate(ids)}
+        self._records = {
+            pid: ProductRecord(pid, names[i], categories[i],
+                               float(prices[i]), int(self.stock_array[i]))
+            for i, pid in enumerate(ids)
+        }
+        self._stock_col = self.df.columns.get_loc('stock')
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, product_id):
+        return product_id in self._records
+
+    def __getitem__(self, product_id):
+        return self._records[product_id]
+
+    def __iter__(self):
+        return iter(self._records.values())
+
+    def get(self, product_id, default=None):
+        """Return the record for product_id, or default when unknown"""
+        return self._records.get(product_id, default)
+
+    def positions(self, product_ids):
+        """Row positions for a sequence of product ids"""
+        pos = self._positions
+        return np.fromiter((pos[pid] for pid in product_ids), dtype=np.intp, count=len(product_ids))
+
+    def set_stock(self, product_id, new_stock):
+        """Update stock in the record, the stock view and the backing DataFrame"""
+        i = self._positions[product_id]
+        new_stock = int(new_stock)
+        self._records[product_id].stock = new_stock
+        self.stock_array[i] = new_stock
+        self.df.iat[i, self._stock_col] = new_stock
+
+    def apply_stock_deltas(self, deltas):
+        """
+        Apply several stock changes as one vectorized update
+
+        Args:
+            deltas: Dictionary of product_id -> stock change (negative for sales)
+        """
+        if not deltas:
+            return
+        pids = list(deltas)
+        pos = self.positions(pids)
+        self.stock_array[pos] += np.fromiter(deltas.values(), dtype=np.int64, count=len(pids))
+        self.df['stock'] = self.stock_array.copy()
+        for pid, i in zip(pids, pos):
+            self._records[pid].stock = int(self.stock_array[i])
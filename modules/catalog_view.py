@@ -0,0 +1,202 @@
+"""
+CATALOG VIEW
+Model/view product catalog dialog
+Products are painted as tiles by a delegate inside a QListView, so only the
+rows scrolled into view are drawn and no widget is created per product.
+One dialog instance is reused for every catalog prefix.
+"""
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QPushButton, QListView, QStyledItemDelegate,
+    QStyle, QAbstractItemView
+)
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRectF, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPainter
+
+
+LOW_STOCK_THRESHOLD = 5
+LOW_STOCK_COLOR = '#ef4444'
+CATEGORY_COLORS = {
+    'Drink': '#3b82f6',
+    'Food': '#10b981',
+    'Electronics': '#f59e0b',
+    'default': '#6366f1'
+}
+
+PRODUCT_ID_ROLE = Qt.ItemDataRole.UserRole
+TILE_COLOR_ROLE = Qt.ItemDataRole.UserRole + 1
+
+TILE_HEIGHT = 130
+
+
+def is_low_stock(stock):
+    return stock <= LOW_STOCK_THRESHOLD
+
+
+def tile_color(product):
+    """Tile colour for a ProductRecord: red when low on stock, else by category"""
+    if is_low_stock(product.stock):
+        return LOW_STOCK_COLOR
+    return CATEGORY_COLORS.get(product.category, CATEGORY_COLORS['default'])
+
+
+class CatalogListModel(QAbstractListModel):
+    """List model over the products of one catalog prefix (or a search result)"""
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._row_of = {}
+        self.prefix = None
+        self.set_catalog(catalog)
+
+    def set_catalog(self, catalog):
+        """Switch to a (re)loaded ProductCatalog and index its prefixes once"""
+        self.catalog = catalog
+        self._by_prefix = {}
+        for product in catalog:
+            self._by_prefix.setdefault(product.product_id[:2], []).append(product.product_id)
+        if self.prefix is not None:
+            self.set_prefix(self.prefix)
+
+    def set_prefix(self, prefix):
+        """Show the products whose id starts with prefix"""
+        self.prefix = prefix
+        self._show(self._by_prefix.get(prefix, []))
+
+    def set_product_ids(self, product_ids):
+        """Show an explicit list of products, e.g. search results"""
+        self.prefix = None
+        self._show(list(product_ids))
+
+    def _show(self, product_ids):
+        self.beginResetModel()
+        self._ids = product_ids
+        self._row_of = {pid: i for i, pid in enumerate(self._ids)}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        pid = self._ids[index.row()]
+        if role == PRODUCT_ID_ROLE:
+            return pid
+        product = self.catalog.get(pid)
+        if product is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (
+                f"🏷️ {product.product_id}\n"
+                f"📦 {product.name}\n"
+                f"💰 ${product.price:.2f}\n"
+                f"📊 Stock: {product.stock}"
+            )
+        if role == TILE_COLOR_ROLE:
+            return tile_color(product)
+        return None
+
+    def product_changed(self, product_id):
+        """Repaint one tile after its price or stock changed"""
+        row = self._row_of.get(product_id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+class ProductTileDelegate(QStyledItemDelegate):
+    """Paints a product as a rounded coloured tile"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = QFont("Arial", 14, QFont.Weight.Bold)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(option.rect.adjusted(4, 4, -4, -4))
+
+        color = QColor(index.data(TILE_COLOR_ROLE) or CATEGORY_COLORS['default'])
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            color = color.darker(115)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(rect, 10, 10)
+
+        painter.setPen(QColor("white"))
+        painter.setFont(self.font)
+        painter.drawText(rect.adjusted(15, 8, -15, -8),
+                         int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter),
+                         index.data() or "")
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), TILE_HEIGHT)
+
+
+class ProductTileView(QListView):
+    """List view painting product tiles; emits product_selected(product_id) on click"""
+
+    product_selected = pyqtSignal(str)
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(ProductTileDelegate(self))
+        # Uniform sizes let the view lay out thousands of rows without measuring each one
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.clicked.connect(self._on_clicked)
+
+    def _on_clicked(self, index):
+        pid = index.data(PRODUCT_ID_ROLE)
+        if pid:
+            self.product_selected.emit(pid)
+
+
+class CatalogDialog(QDialog):
+    """Reusable dialog listing the products of one catalog prefix"""
+
+    product_selected = pyqtSignal(str)
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.setGeometry(200, 200, 800, 600)
+        self.setObjectName("catalogDialog")
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        self.title = QLabel()
+        self.title.setObjectName("catalogTitle")
+        self.title.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        self.title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.title)
+
+        self.model = CatalogListModel(catalog, self)
+        self.view = ProductTileView(self.model)
+        self.view.product_selected.connect(self.product_selected)
+        layout.addWidget(self.view)
+
+        close_btn = QPushButton("❌ Close")
+        close_btn.setObjectName("catalogClose")
+        close_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        close_btn.setMinimumHeight(50)
+        close_btn.clicked.connect(self.close)
+        layout.addWidget(close_btn)
+
+    def set_catalog(self, catalog):
+        self.model.set_catalog(catalog)
+
+    def show_prefix(self, prefix):
+        """Point the dialog at one catalog prefix and run it"""
+        self.setWindowTitle(f"Catalog: {prefix}")
+        self.title.setText(f"📂 {prefix} Products")
+        self.model.set_prefix(prefix)
+        self.view.scrollToTop()
+        return self.exec()
@@ -0,0 +1,257 @@
+"""
+CHECKOUT DIALOGS
+Large payment, customer-name and completion dialogs for elderly customers
+
+Each dialog is built once per cashier window and reset before every
+checkout (reset() then exec()), so pressing Checkout only updates a few
+labels instead of rebuilding widget trees, fonts and stylesheets.
+
+They are styled by the application theme (modules.theme), which matches
+their widgets by object name inside each dialog (QDialog#paymentDialog ...).
+"""
+
+from PyQt6.QtWidgets import (
+    QApplication, QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QPushButton, QLineEdit, QMessageBox
+)
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QFont
+
+from modules.theme import apply_theme
+
+
+DEFAULT_CUSTOMER = "Customer"
+
+
+def _label(text, name, size, parent_layout):
+    label = QLabel(text)
+    label.setObjectName(name)
+    label.setFont(QFont("Arial", size, QFont.Weight.Bold))
+    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    parent_layout.addWidget(label)
+    return label
+
+
+def _panel(name):
+    """Container whose background and border come from the stylesheet"""
+    panel = QWidget()
+    panel.setObjectName(name)
+    panel.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+    layout = QVBoxLayout()
+    panel.setLayout(layout)
+    return panel, layout
+
+
+def _button(text, name, size, min_size, slot):
+    button = QPushButton(text)
+    button.setObjectName(name)
+    button.setFont(QFont("Arial", size, QFont.Weight.Bold))
+    button.setMinimumSize(min_size)
+    button.setCursor(Qt.CursorShape.PointingHandCursor)
+    button.clicked.connect(slot)
+    return button
+
+
+class CheckoutDialog(QDialog):
+    """Modal, screen-centred dialog that is reused for every checkout"""
+
+    def __init__(self, parent, name, title, height):
+        apply_theme()
+        super().__init__(parent)
+        self.setObjectName(name)
+        self.setWindowTitle(title)
+        self.resize(900, height)
+        self.setModal(True)
+
+    def showEvent(self, event):
+        self.center_on_screen()
+        super().showEvent(event)
+
+    def center_on_screen(self):
+        """Center the dialog on the current screen"""
+        screen = QApplication.primaryScreen()
+        if screen:
+            screen_geometry = screen.availableGeometry()
+            x = (screen_geometry.width() - self.width()) // 2
+            y = (screen_geometry.height() - self.height()) // 2
+            self.move(x, y)
+
+
+class LargePaymentDialog(CheckoutDialog):
+    """Large payment dialog for elderly customers with big text and buttons"""
+
+    def __init__(self, parent, total_amount=0.0):
+        super().__init__(parent, "paymentDialog", "Payment", 650)
+        self.total_amount = total_amount
+        self.payment_amount = 0.0
+        self.error_box = None  # Created on the first invalid entry, then reused
+
+        self.init_ui()
+        self.reset(total_amount)
+
+    def init_ui(self):
+        """Initialize payment dialog with large UI elements"""
+        layout = QVBoxLayout()
+        layout.setSpacing(20)  # Reduced spacing to fit everything
+        self.setLayout(layout)
+
+        _label("💳 PAYMENT", "title", 42, layout)
+        _label("TOTAL AMOUNT:", "totalCaption", 30, layout)
+        self.total_value = _label("", "totalValue", 60, layout)
+
+        input_container, input_layout = _panel("inputPanel")
+        _label("💵 Enter Payment Received:", "inputCaption", 24, input_layout)
+        self.payment_input = QLineEdit()
+        self.payment_input.setObjectName("paymentInput")
+        self.payment_input.setFont(QFont("Arial", 52, QFont.Weight.Bold))
+        self.payment_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.payment_input.setPlaceholderText("0.00")
+        input_layout.addWidget(self.payment_input)
+        layout.addWidget(input_container)
+
+        # Buttons - EXTRA LARGE
+        buttons_container = QWidget()
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(20)
+        buttons_container.setLayout(buttons_layout)
+        buttons_layout.addWidget(_button("✅\nCONFIRM\nPAYMENT", "confirmButton", 24,
+                                         QSize(350, 120), self.validate_payment))
+        buttons_layout.addWidget(_button("❌\nCANCEL", "cancelButton", 24,
+                                         QSize(350, 120), self.reject))
+        layout.addWidget(buttons_container)
+
+    def reset(self, total_amount):
+        """Prepare the dialog for a new checkout"""
+        self.total_amount = total_amount
+        self.payment_amount = 0.0
+        self.total_value.setText(f"${total_amount:.2f}")
+        self.payment_input.clear()
+        self.payment_input.setFocus()
+
+    def validate_payment(self):
+        """Validate payment amount"""
+        try:
+            payment = float(self.payment_input.text())
+        except ValueError:
+            self.show_error("Invalid Input", "⚠️ INVALID AMOUNT\n\nPlease enter a valid number!")
+            return
+
+        if payment < self.total_amount:
+            self.show_error("Insufficient Payment",
+                            f"⚠️ INSUFFICIENT PAYMENT\n\n"
+                            f"Required: ${self.total_amount:.2f}\n"
+                            f"Received: ${payment:.2f}\n\n"
+                            f"Please enter at least ${self.total_amount:.2f}")
+            return
+
+        self.payment_amount = payment
+        self.accept()
+
+    def show_error(self, title, text):
+        """Show a large warning in the reused message box"""
+        if self.error_box is None:
+            self.error_box = QMessageBox(self)
+            self.error_box.setObjectName("paymentError")
+            self.error_box.setIcon(QMessageBox.Icon.Warning)
+        self.error_box.setWindowTitle(title)
+        self.error_box.setText(text)
+        self.error_box.exec()
+        self.payment_input.setFocus()
+        self.payment_input.selectAll()
+
+
+class LargeCompletionDialog(CheckoutDialog):
+    """Large completion dialog showing payment and change for elderly customers"""
+
+    def __init__(self, parent, payment=0.0, change=0.0):
+        super().__init__(parent, "completionDialog", "Transaction Complete", 650)
+        self.init_ui()
+        self.reset(payment, change)
+
+    def init_ui(self):
+        """Initialize completion dialog with large UI elements"""
+        layout = QVBoxLayout()
+        layout.setSpacing(15)  # Reduced spacing to fit everything
+        self.setLayout(layout)
+
+        _label("✅ TRANSACTION\nCOMPLETE!", "title", 44, layout)
+
+        payment_container, payment_layout = _panel("paymentPanel")
+        _label("💵 Payment Received:", "caption", 26, payment_layout)
+        self.payment_value = _label("", "amount", 52, payment_layout)
+        layout.addWidget(payment_container)
+
+        change_container, change_layout = _panel("changePanel")
+        _label("💰 Change to Return:", "caption", 26, change_layout)
+        self.change_value = _label("", "amount", 56, change_layout)
+        layout.addWidget(change_container)
+
+        _label("🙏 Thank You!", "thankYou", 28, layout)
+
+        ok_btn = _button("✅\nOK", "okButton", 28, QSize(400, 120), self.accept)
+        layout.addWidget(ok_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+
+    def reset(self, payment, change):
+        """Show the amounts of the checkout that just finished"""
+        self.payment = payment
+        self.change = change
+        self.payment_value.setText(f"${payment:.2f}")
+        self.change_value.setText(f"${change:.2f}")
+
+
+class LargeCustomerNameDialog(CheckoutDialog):
+    """Large dialog for entering customer name - elderly-friendly"""
+
+    def __init__(self, parent):
+        super().__init__(parent, "customerNameDialog", "Customer Name", 600)
+        self.customer_name = DEFAULT_CUSTOMER
+        self.init_ui()
+        self.reset()
+
+    def init_ui(self):
+        """Initialize customer name dialog with large UI elements"""
+        layout = QVBoxLayout()
+        layout.setSpacing(30)
+        self.setLayout(layout)
+
+        _label("👤 CUSTOMER NAME", "title", 48, layout)
+        _label("Please enter the customer's name:", "instructions", 28, layout)
+
+        input_container, input_layout = _panel("inputPanel")
+        _label("📝 Customer Name:", "inputCaption", 28, input_layout)
+        self.name_input = QLineEdit()
+        self.name_input.setObjectName("nameInput")
+        self.name_input.setFont(QFont("Arial", 48, QFont.Weight.Bold))
+        self.name_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.name_input.setPlaceholderText("Enter name here...")
+        input_layout.addWidget(self.name_input)
+        layout.addWidget(input_container)
+
+        # Buttons - EXTRA LARGE
+        buttons_container = QWidget()
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(20)
+        buttons_container.setLayout(buttons_layout)
+        buttons_layout.addWidget(_button("✅\nOK", "okButton", 32,
+                                         QSize(350, 150), self.accept_name))
+        # Skip button (use default "Customer")
+        buttons_layout.addWidget(_button("⏭️\nSKIP\n(Use 'Customer')", "skipButton", 24,
+                                         QSize(350, 150), self.skip_name))
+        layout.addWidget(buttons_container)
+
+    def reset(self):
+        """Start from the default name, selected so typing replaces it"""
+        self.customer_name = DEFAULT_CUSTOMER
+        self.name_input.setText(DEFAULT_CUSTOMER)
+        self.name_input.setFocus()
+        self.name_input.selectAll()
+
+    def accept_name(self):
+        """Accept the entered name"""
+        self.customer_name = self.name_input.text().strip() or DEFAULT_CUSTOMER
+        self.accept()
+
+    def skip_name(self):
+        """Skip and use default 'Customer'"""
+        self.customer_name = DEFAULT_CUSTOMER
+        self.accept()
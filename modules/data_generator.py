@@ -0,0 +1,233 @@
+"""
+DATA GENERATOR
+Synthetic store data for load and soak testing
+
+    python -m modules.data_generator --out loadtest --skus 20000 \\
+        --start 2022-01-01 --end 2024-12-31 --sales-per-day 2000
+    python -m modules.data_generator --out loadtest --backend sqlite ...
+
+Writes products, users, sales, sale_items and the daily rollup through the
+storage backends (CsvStorage / SqliteStorage), so the result is exactly
+what the till itself would have recorded.
+
+- Catalog: SKU ids are a catalog prefix plus a number (AJ00001, PK00002...)
+- Popularity: items are drawn from a Zipf distribution over a shuffled
+  popularity ranking, so a few SKUs dominate the way they do in a shop
+- Baskets: 1 + Poisson(basket_mean - 1) lines, capped at max_basket
+- Shifts: every cashier works one shift; a sale is rung up by a cashier
+  on duty at its time. Weekends are busier.
+
+Sales are generated one day at a time and flushed every CHUNK_LINES line
+items, so memory stays bounded whatever the date range.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from modules.catalog import PRODUCT_COLUMNS
+from modules.sales_journal import SALES_COLUMNS, SALE_ITEM_COLUMNS, ISO_DATETIME
+
+
+CHUNK_LINES = 200_000     # line items buffered before a write
+PREFIXES = ("AJ", "PK", "MN", "ST", "BV", "KL", "RT", "DX")
+CATEGORIES = ("Drink", "Food", "Electronics", "Household")
+WORDS = ("Milo", "Maggi", "Sprite", "Rice", "Teh", "Kopi", "Gula", "Susu", "Roti", "Sabun",
+         "Sampo", "Minyak", "Garam", "Biskuit", "Air", "Mineral", "Baterai", "Lampu", "Kabel", "Mie")
+SHIFTS = (("Morning", 7, 15), ("Evening", 15, 23))
+WEEKDAY_LOAD = (0.9, 0.85, 0.9, 0.95, 1.1, 1.3, 1.2)   # Monday .. Sunday
+
+
+class StoreDataGenerator:
+    """Deterministic (seeded) generator of a store's catalog and sales history"""
+
+    def __init__(self, skus=5000, prefixes=PREFIXES, zipf=1.1, basket_mean=4.0, max_basket=40,
+                 cashiers=12, shifts=SHIFTS, start=date(2024, 1, 1), end=date(2024, 12, 31),
+                 sales_per_day=500, seed=0):
+        self.skus = skus
+        self.prefixes = tuple(prefixes)
+        self.zipf = zipf
+        self.basket_mean = basket_mean
+        self.max_basket = max_basket
+        self.cashiers = cashiers
+        self.shifts = tuple(shifts)
+        self.start = start
+        self.end = end
+        self.sales_per_day = sales_per_day
+        self.rng = np.random.default_rng(seed)
+        self._sale_counter = 0
+
+        self.products = self._make_products()
+        self.users, self._shift_cashiers = self._make_users()
+        # Zipf over a shuffled ranking: rank r is drawn with weight 1 / r**zipf
+        weights = 1.0 / np.arange(1, skus + 1) ** zipf
+        self._cdf = np.cumsum(weights) / weights.sum()
+        self._by_rank = self.rng.permutation(skus)
+
+    def _make_products(self):
+        n, rng = self.skus, self.rng
+        ids = [f"{self.prefixes[i % len(self.prefixes)]}{i + 1:05d}" for i in range(n)]
+        words = np.array(WORDS)
+        first = words[rng.integers(0, len(words), n)]
+        second = words[rng.integers(0, len(words), n)]
+        sizes = rng.integers(1, 999, n)
+        return pd.DataFrame({
+            'product_id': ids,
+            'name': [f"{a} {b} {s}" for a, b, s in zip(first, second, sizes)],
+            'category': np.array(CATEGORIES)[rng.integers(0, len(CATEGORIES), n)],
+            'price': np.round(rng.lognormal(1.2, 0.8, n).clip(0.5, 500), 2),
+            'stock': rng.integers(20, 500, n),
+        })[PRODUCT_COLUMNS]
+
+    def _make_users(self):
+        """One manager plus cashiers spread over the shifts"""
+        registered = datetime.combine(self.start, datetime.min.time()).strftime(ISO_DATETIME)
+        users = [{'employee_id': "ADMIN001", 'name': "Administrator", 'role': "Manager",
+                  'date_registered': registered, 'active': True}]
+        shift_cashiers = [[] for _ in self.shifts]
+        for i in range(self.cashiers):
+            name = f"Cashier {i + 1:02d}"
+            users.append({'employee_id': f"{200001 + i}", 'name': name, 'role': "Cashier",
+                          'date_registered': registered, 'active': True})
+            shift_cashiers[i % len(self.shifts)].append((f"{200001 + i}", name))
+        return users, shift_cashiers
+
+    def sample_products(self, n):
+        """n product positions drawn by Zipf popularity"""
+        ranks = np.searchsorted(self._cdf, self.rng.random(n), side="right")
+        return self._by_rank[np.minimum(ranks, self.skus - 1)]
+
+    def day_sales(self, day):
+        """(sales, items) DataFrames for one day, or None on a day without sales"""
+        rng = self.rng
+        n = int(rng.poisson(self.sales_per_day * WEEKDAY_LOAD[day.weekday()]))
+        if n == 0:
+            return None
+
+        # Time of day and the shift (and so the cashier) it falls in
+        shift = rng.integers(0, len(self.shifts), n)
+        starts = np.array([s[1] for s in self.shifts])[shift]
+        ends = np.array([s[2] for s in self.shifts])[shift]
+        seconds = np.sort(starts * 3600 + (rng.random(n) * (ends - starts) * 3600).astype(np.int64))
+        shift = np.searchsorted(np.array([s[1] for s in self.shifts]) * 3600, seconds, side="right") - 1
+        cashier_id = np.empty(n, dtype=object)
+        cashier_name = np.empty(n, dtype=object)
+        for k, staff in enumerate(self._shift_cashiers):
+            on_shift = np.flatnonzero(shift == k)
+            if not staff or not len(on_shift):
+                continue
+            pick = rng.integers(0, len(staff), len(on_shift))
+            cashier_id[on_shift] = [staff[p][0] for p in pick]
+            cashier_name[on_shift] = [staff[p][1] for p in pick]
+
+        stamps = pd.Timestamp(day) + pd.to_timedelta(seconds, unit="s")
+        sale_ids = np.array([f"{i:012x}" for i in range(self._sale_counter, self._sale_counter + n)])
+        self._sale_counter += n
+
+        # Baskets; the same SKU drawn twice becomes one line with a higher qty
+        lines = np.minimum(1 + rng.poisson(max(self.basket_mean - 1, 0), n), self.max_basket)
+        line_sale = np.repeat(np.arange(n), lines)
+        items = pd.DataFrame({
+            'sale': line_sale,
+            'pos': self.sample_products(len(line_sale)),
+            'qty': rng.integers(1, 4, len(line_sale)),
+        }).groupby(['sale', 'pos'], sort=False, as_index=False)['qty'].sum()
+        price = self.products['price'].to_numpy()[items['pos']]
+        items = pd.DataFrame({
+            'sale_id': sale_ids[items['sale']],
+            'product_id': self.products['product_id'].to_numpy()[items['pos']],
+            'qty': items['qty'].to_numpy(),
+            'unit_price_at_sale': price,
+            'line_total': np.round(items['qty'].to_numpy() * price, 2),
+            'sale': items['sale'].to_numpy(),
+        })
+
+        sales = pd.DataFrame({
+            'datetime': stamps.strftime(ISO_DATETIME),
+            'customer_name': [f"Customer {c}" for c in rng.zipf(1.5, n) % 5000],
+            'cashier_name': cashier_name,
+            'employee_id': cashier_id,
+            'sale_id': sale_ids,
+            'total': np.round(np.bincount(items['sale'], weights=items['line_total'], minlength=n), 2),
+        })
+        return sales[SALES_COLUMNS], items[SALE_ITEM_COLUMNS]
+
+    def iter_chunks(self, chunk_lines=CHUNK_LINES):
+        """Yield (sales, items) covering whole days, about chunk_lines items each"""
+        sales_parts, item_parts, buffered = [], [], 0
+        for day in pd.date_range(self.start, self.end, freq="D"):
+            generated = self.day_sales(day.date())
+            if generated is None:
+                continue
+            sales, items = generated
+            sales_parts.append(sales)
+            item_parts.append(items)
+            buffered += len(items)
+            if buffered >= chunk_lines:
+                yield pd.concat(sales_parts, ignore_index=True), pd.concat(item_parts, ignore_index=True)
+                sales_parts, item_parts, buffered = [], [], 0
+        if buffered:
+            yield pd.concat(sales_parts, ignore_index=True), pd.concat(item_parts, ignore_index=True)
+
+    def write(self, storage, chunk_lines=CHUNK_LINES):
+        """Write the catalog, users and the whole sales history to a storage backend"""
+        storage.save_products(self.products)
+        for user in self.users:
+            storage.add_user(user)
+
+        started = time.perf_counter()
+        n_sales = n_items = 0
+        for sales, items in self.iter_chunks(chunk_lines):
+            storage.append_history(sales, items)
+            n_sales += len(sales)
+            n_items += len(items)
+            print(f"[INFO] ... {sales['datetime'].iloc[-1][:10]}: {n_sales} sales, {n_items} lines "
+                  f"({n_items / max(time.perf_counter() - started, 1e-9):,.0f} lines/s)")
+        return n_sales, n_items
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m modules.data_generator",
+                                     description="Write a synthetic store history")
+    parser.add_argument("--out", default="loadtest", help="data directory to create")
+    parser.add_argument("--backend", choices=["csv", "sqlite"], default="csv")
+    parser.add_argument("--skus", type=int, default=5000)
+    parser.add_argument("--prefixes", default=",".join(PREFIXES), help="comma-separated catalog prefixes")
+    parser.add_argument("--zipf", type=float, default=1.1, help="popularity skew (> 0)")
+    parser.add_argument("--basket-mean", type=float, default=4.0)
+    parser.add_argument("--max-basket", type=int, default=40)
+    parser.add_argument("--cashiers", type=int, default=12)
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2024, 1, 1))
+    parser.add_argument("--end", type=date.fromisoformat, default=date(2024, 12, 31))
+    parser.add_argument("--sales-per-day", type=float, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.out) and os.listdir(args.out):
+        print(f"[ERROR] {args.out} is not empty; refusing to mix generated and real data")
+        return 1
+
+    from modules.storage import CsvStorage, SqliteStorage, DB_FILENAME
+    if args.backend == "sqlite":
+        storage = SqliteStorage(os.path.join(args.out, DB_FILENAME))
+    else:
+        storage = CsvStorage(args.out)
+
+    generator = StoreDataGenerator(
+        skus=args.skus, prefixes=args.prefixes.split(","), zipf=args.zipf,
+        basket_mean=args.basket_mean, max_basket=args.max_basket, cashiers=args.cashiers,
+        start=args.start, end=args.end, sales_per_day=args.sales_per_day, seed=args.seed
+    )
+    n_sales, n_items = generator.write(storage)
+    print(f"[INFO] Wrote {args.skus} products, {len(generator.users)} users, "
+          f"{n_sales} sales ({n_items} lines) to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
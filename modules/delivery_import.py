@@ -0,0 +1,208 @@
+"""
+DELIVERY IMPORT
+Supplier delivery notes (CSV) added to stock in one commit
+
+    python -m modules.delivery_import delivery.csv               # import
+    python -m modules.delivery_import delivery.csv --dry-run     # check only
+
+A delivery note needs product_id and qty columns (units delivered); other
+columns are ignored and a product listed on several lines gets the sum.
+The note is read CHUNK_LINES lines at a time and each chunk is checked
+against a hash index of the catalog, so memory is bounded by the catalog
+size, not by the length of the note. Lines with an unknown product or a
+quantity that is not a positive whole number are written to a report CSV
+(by default next to the note, as <note>.rejected.csv).
+
+Only after the whole note has been read are the increments applied, with
+one storage.adjust_stock() call (one products.csv write or one SQLite
+transaction) and one STOCK_DELIVERY audit record: a note that cannot be
+read changes nothing.
+
+With the CSV backend the import refuses to change stock while a till is
+running, or while a till left sales not yet saved to products.csv: the
+till keeps its own copy of the stock. Close the till first (or use the
+SQLite backend, which tills and the import can share).
+"""
+
+import argparse
+import csv
+import os
+import sys
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from modules.activity_logger import activity_logger
+
+
+CHUNK_LINES = 10_000
+TILL_RUNNING = ("A till is using the CSV data files or has sales not yet saved to products.csv; "
+                "close (or start and close) the till, then try again")
+REPORT_COLUMNS = ["line", "product_id", "qty", "reason"]
+
+
+class DeliveryPlan:
+    """Stock increments read from one delivery note"""
+
+    def __init__(self, source, report_path=None):
+        self.source = source
+        self.report_path = report_path
+        self.deltas = {}  # product_id -> units delivered
+        self.lines = 0
+        self.rejected = 0
+
+    def __len__(self):
+        return len(self.deltas)
+
+    @property
+    def units(self):
+        return sum(self.deltas.values())
+
+    def summary(self):
+        text = (f"{self.lines} line(s): {self.units} unit(s) for "
+                f"{len(self.deltas)} product(s)")
+        if self.rejected:
+            text += f", {self.rejected} rejected"
+        return text
+
+
+def default_report_path(path):
+    """<note>.rejected.csv next to the delivery note"""
+    return os.path.splitext(path)[0] + ".rejected.csv"
+
+
+class _RejectReport:
+    """Rejected lines streamed to a CSV file, created on the first reject"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.writer = None
+
+    def write(self, lines, ids, qtys, reasons):
+        if self.file is None:
+            self.file = open(self.path, "w", newline="", encoding="utf-8")
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(REPORT_COLUMNS)
+        self.writer.writerows(zip(lines, ids, qtys, reasons))
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+
+def _columns(header):
+    """Positions of product_id and qty in the header row"""
+    names = [str(name).strip().lower() for name in header]
+    missing = [col for col in ("product_id", "qty") if col not in names]
+    if missing:
+        raise ValueError(f"Delivery note needs columns product_id and qty (missing: {', '.join(missing)})")
+    return names.index("product_id"), names.index("qty")
+
+
+def read_delivery(path, products, report_path=None, chunk_lines=CHUNK_LINES):
+    """
+    Read and check a delivery note against the products DataFrame
+
+    Returns a DeliveryPlan; rejected lines are written to report_path
+    (default: default_report_path(path)).
+    """
+    report_path = report_path or default_report_path(path)
+    plan = DeliveryPlan(path, report_path)
+    # Hash index of the catalog
+    catalog = pd.Index(products['product_id'].astype(str).unique())
+    report = _RejectReport(report_path)
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            id_col, qty_col = _columns(next(reader, []))
+            width = max(id_col, qty_col) + 1
+            numbered = ((reader.line_num, row) for row in reader if row)
+            while True:
+                chunk = list(islice(numbered, chunk_lines))
+                if not chunk:
+                    break
+                _read_chunk(chunk, id_col, qty_col, width, catalog, plan, report)
+    finally:
+        report.close()
+    if not plan.rejected and os.path.exists(report_path):
+        os.remove(report_path)  # Stale report of an earlier import of this note
+    return plan
+
+
+def _read_chunk(chunk, id_col, qty_col, width, catalog, plan, report):
+    """Validate one chunk of (line number, row) and add its quantities to the plan"""
+    lines = np.array([line for line, _ in chunk])
+    rows = [row + [""] * (width - len(row)) for _, row in chunk]
+    ids = pd.Series([row[id_col].strip() for row in rows])
+    raw_qty = pd.Series([row[qty_col].strip() for row in rows])
+    qty = pd.to_numeric(raw_qty, errors='coerce')
+
+    # Rows without product id and quantity (e.g. ",," left by a spreadsheet) are skipped
+    blank = ((ids == "") & (raw_qty == "")).to_numpy()
+    missing = ~blank & (ids == "").to_numpy()
+    unknown = ~blank & ~missing & ~ids.isin(catalog).to_numpy()
+    whole = (np.isfinite(qty) & (qty > 0) & (qty == qty.round())).to_numpy()
+    bad_qty = ~blank & ~missing & ~unknown & ~whole
+    valid = ~blank & ~missing & ~unknown & ~bad_qty
+
+    plan.lines += int((~blank).sum())
+    rejected = missing | unknown | bad_qty
+    if rejected.any():
+        reasons = np.where(missing, "missing product id",
+                           np.where(unknown, "unknown product", "quantity is not a positive whole number"))
+        report.write(lines[rejected], ids[rejected], raw_qty[rejected], reasons[rejected])
+        plan.rejected += int(rejected.sum())
+
+    for product_id, units in qty[valid].groupby(ids[valid]).sum().items():
+        plan.deltas[product_id] = plan.deltas.get(product_id, 0) + int(units)
+
+
+def apply_delivery(storage, plan, employee_id, employee_name):
+    """Add a plan's units to stock with one storage update and one audit record; returns {product_id: new stock}"""
+    if not len(plan):
+        return {}
+    new_stock = storage.adjust_stock(plan.deltas)
+    activity_logger.log_stock_delivery(
+        employee_id, employee_name, os.path.basename(plan.source), plan.lines, plan.rejected,
+        [(pid, plan.deltas[pid], stock) for pid, stock in new_stock.items()]
+    )
+    return new_stock
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m modules.delivery_import",
+                                     description="Add a supplier delivery note to stock")
+    parser.add_argument("note", help="delivery CSV with product_id and qty columns")
+    parser.add_argument("--report", help="rejected lines CSV (default: <note>.rejected.csv)")
+    parser.add_argument("--dry-run", action="store_true", help="check the note without changing stock")
+    parser.add_argument("--employee-id", default="000")
+    parser.add_argument("--employee-name", default="Delivery Import")
+    args = parser.parse_args(argv)
+
+    from modules.storage import get_storage
+    storage = get_storage()
+    try:
+        plan = read_delivery(args.note, storage.load_products(), args.report)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"[ERROR] Could not read {args.note}: {e}")
+        return 1
+
+    print(f"[INFO] {args.note}: {plan.summary()}")
+    if plan.rejected:
+        print(f"[WARN] {plan.rejected} rejected line(s) written to {plan.report_path}")
+    if args.dry_run:
+        print("[INFO] Dry run: stock not changed")
+        return 0
+    if storage.till_running():
+        print(f"[ERROR] {TILL_RUNNING}")
+        return 1
+
+    new_stock = apply_delivery(storage, plan, args.employee_id, args.employee_name)
+    print(f"[INFO] Stock updated for {len(new_stock)} product(s) ({storage.name})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,6 @@ EMPLOYEE LOGIN DIALOG - WITH TRANSLATION SUPPORT
 Handles employee authentication and registration with role-based access
 """
 
-import os
 import pandas as pd
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
@@ -15,17 +14,20 @@ from datetime import datetime
 
 # Import translation system
 from modules.translations import LanguageManager, tr
+from modules.storage import get_storage
+from modules.theme import apply_theme
 
 
 class EmployeeLoginDialog(QDialog):
     """Dialog for employee login with name and ID - now with user database and role-based access"""
     
     def __init__(self, parent=None, for_management=False, required_action=None):
+        apply_theme()
         super().__init__(parent)
+        self.setObjectName("employeeLogin")
         self.setWindowTitle(tr('login_title'))
         self.resize(700, 550)  # Bigger window
         self.setMinimumSize(700, 550)
-        self.setStyleSheet("QDialog { background-color: #f8fafc; }")
         self.setModal(True)
         
         self.employee_name = tr('cashier_label')
@@ -45,39 +47,36 @@ class EmployeeLoginDialog(QDialog):
         self.center_on_screen()  # Center dialog on screen
     
     def load_users(self):
-        """Load users from CSV file"""
-        users_path = os.path.join("data", "users.csv")
-        os.makedirs("data", exist_ok=True)
+        """Load users from storage, creating the default supervisor on first run"""
+        storage = get_storage()
+        try:
+            users = storage.load_users()
+        except Exception as e:
+            print(f"[ERROR] Failed to load users: {e}")
+            return pd.DataFrame(columns=['employee_id', 'name', 'role', 'date_registered', 'active'])
         
-        if not os.path.exists(users_path) or os.stat(users_path).st_size == 0:
-            default_users = pd.DataFrame([{
+        if users.empty:
+            storage.add_user({
                 'employee_id': 'SUPER001',
                 'name': 'Supervisor',
                 'role': 'Supervisor',
                 'date_registered': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 'active': True
-            }])
-            default_users.to_csv(users_path, index=False)
-            return default_users
-        
-        try:
-            return pd.read_csv(users_path)
-        except Exception as e:
-            print(f"[ERROR] Failed to load users.csv: {e}")
-            return pd.DataFrame(columns=['employee_id', 'name', 'role', 'date_registered', 'active'])
+            })
+            users = storage.load_users()
+        return users
     
     def save_user(self, employee_id, name, role='Cashier'):
-        """Save new user to CSV"""
-        users_path = os.path.join("data", "users.csv")
-        new_user = pd.DataFrame([{
+        """Save new user to storage"""
+        new_user = {
             'employee_id': employee_id,
             'name': name,
             'role': role,
             'date_registered': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             'active': True
-        }])
-        self.users_df = pd.concat([self.users_df, new_user], ignore_index=True)
-        self.users_df.to_csv(users_path, index=False)
+        }
+        get_storage().add_user(new_user)
+        self.users_df = pd.concat([self.users_df, pd.DataFrame([new_user])], ignore_index=True)
         print(f"[INFO] New user registered: {name} (ID: {employee_id}, Role: {role})")
     
     def user_exists(self, employee_id):
@@ -121,78 +120,47 @@ class EmployeeLoginDialog(QDialog):
             subtitle_text = tr('login_subtitle')
         
         title = QLabel(title_text)
+        title.setObjectName("loginTitle")
         title.setFont(QFont("Arial", 24, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            color: #1e40af;
-            background-color: #dbeafe;
-            padding: 20px;
-            border-radius: 10px;
-        """)
         layout.addWidget(title)
         self.ui_elements['title'] = title
         
         subtitle = QLabel(subtitle_text)
+        subtitle.setObjectName("loginSubtitle")
         subtitle.setFont(QFont("Arial", 14))
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet("color: #64748b; margin: 10px;")
         layout.addWidget(subtitle)
         self.ui_elements['subtitle'] = subtitle
         
         # Form container
         form_container = QWidget()
-        form_container.setStyleSheet("""
-            QWidget {
-                background-color: #ffffff;
-                border-radius: 10px;
-                padding: 20px;
-            }
-        """)
+        form_container.setObjectName("loginForm")
         form_layout = QFormLayout()
         form_layout.setSpacing(15)
         form_container.setLayout(form_layout)
         
         # Name input
         self.name_input = QLineEdit()
+        self.name_input.setObjectName("loginInput")
         self.name_input.setFont(QFont("Arial", 14))
         self.name_input.setPlaceholderText(tr('employee_name_placeholder'))
-        self.name_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 2px solid #cbd5e1;
-                border-radius: 8px;
-                font-size: 16px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3b82f6;
-            }
-        """)
         
         name_label = QLabel(tr('employee_name_label'))
+        name_label.setObjectName("formLabel")
         name_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        name_label.setStyleSheet("color: #1e293b;")
         form_layout.addRow(name_label, self.name_input)
         self.ui_elements['name_label'] = name_label
         
         # ID input
         self.id_input = QLineEdit()
+        self.id_input.setObjectName("loginInput")
         self.id_input.setFont(QFont("Arial", 14))
         self.id_input.setPlaceholderText(tr('employee_id_placeholder'))
-        self.id_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 2px solid #cbd5e1;
-                border-radius: 8px;
-                font-size: 16px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3b82f6;
-            }
-        """)
         
         id_label = QLabel(tr('employee_id_label'))
+        id_label.setObjectName("formLabel")
         id_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        id_label.setStyleSheet("color: #1e293b;")
         form_layout.addRow(id_label, self.id_input)
         self.ui_elements['id_label'] = id_label
         
@@ -206,40 +174,20 @@ class EmployeeLoginDialog(QDialog):
         
         # Login button
         login_btn = QPushButton(tr('login_button'))
+        login_btn.setObjectName("loginButton")
         login_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         login_btn.setMinimumHeight(60)
         login_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        login_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10b981;
-                color: white;
-                border-radius: 10px;
-                padding: 15px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-        """)
         login_btn.clicked.connect(self.validate_and_accept)
         buttons_layout.addWidget(login_btn)
         self.ui_elements['login_btn'] = login_btn
         
         # Cancel button
         cancel_btn = QPushButton(tr('cancel_button'))
+        cancel_btn.setObjectName("loginCancelButton")
         cancel_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
         cancel_btn.setMinimumHeight(60)
         cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ef4444;
-                color: white;
-                border-radius: 10px;
-                padding: 15px;
-            }
-            QPushButton:hover {
-                background-color: #dc2626;
-            }
-        """)
         cancel_btn.clicked.connect(self.reject)
         buttons_layout.addWidget(cancel_btn)
         self.ui_elements['cancel_btn'] = cancel_btn
@@ -0,0 +1,240 @@
+"""
+PERF MONITOR
+Event-loop lag and slow-operation tracing for the cashier GUI
+
+- Heartbeat: a QTimer fires every HEARTBEAT_MS; how late each tick arrives
+  is the event-loop lag ("event_loop_lag" in the summary).
+- Watchdog: a daemon thread notices when the heartbeat has been silent for
+  longer than the slow threshold and samples the GUI thread's stack while
+  it is still blocked, so the perf log shows what froze the till.
+- Spans: handlers are wrapped with @perf_monitor.timed("name") or
+  `with perf_monitor.span("name")`; any span over the threshold is logged.
+
+Slow records go to logs/perf_YYYY-MM-DD.jsonl through a buffered
+ActivityLogger. Latencies are kept in log-scale histograms, so p50/p95/p99
+for a whole shift take constant memory.
+"""
+
+import functools
+import math
+import os
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from datetime import datetime
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView
+)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont
+
+from modules.activity_logger import ActivityLogger
+
+
+HEARTBEAT_MS = 20
+SLOW_MS = float(os.environ.get("AKBAR_SLOW_MS", 100))   # log operations slower than this
+STACK_DEPTH = 25          # frames kept per stack sample
+BUCKET_GROWTH = 1.05      # histogram resolution: 5% per bucket
+LAG_OPERATION = "event_loop_lag"
+
+
+class LatencyHistogram:
+    """Log-bucketed millisecond latencies with approximate percentiles"""
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        bucket = int(math.log(ms, BUCKET_GROWTH)) if ms > 0.01 else -100
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, pct):
+        """Upper edge of the bucket holding the pct-th percentile"""
+        if not self.count:
+            return 0.0
+        target = pct / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min(BUCKET_GROWTH ** (bucket + 1), self.max_ms)
+        return self.max_ms
+
+
+def _stack_lines(frame):
+    return [line.rstrip() for line in traceback.format_stack(frame, limit=STACK_DEPTH)]
+
+
+class PerfMonitor:
+    """Heartbeat, watchdog and per-operation latency statistics"""
+
+    def __init__(self, slow_ms=SLOW_MS, heartbeat_ms=HEARTBEAT_MS, base_log_dir="logs"):
+        self.slow_ms = slow_ms
+        self.heartbeat_ms = heartbeat_ms
+        self.log = ActivityLogger(base_log_dir, prefix="perf")
+        self.started_at = datetime.now()
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._timer = None
+        self._watchdog = None
+        self._running = False
+        self._gui_thread_id = None
+        self._last_beat = None
+        self._stall_sample = None   # stack sampled during the current stall
+
+    # ----- heartbeat and watchdog -----
+
+    def start(self):
+        """Start the heartbeat on the GUI thread (needs a QApplication)"""
+        if self._running:
+            return
+        self._running = True
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._beat)
+        self._timer.start(self.heartbeat_ms)
+        self._watchdog = threading.Thread(target=self._watch, name="perf-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        self._running = False
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        self.log.flush()
+
+    def _beat(self):
+        now = time.perf_counter()
+        lag_ms = max((now - self._last_beat) * 1000 - self.heartbeat_ms, 0.0)
+        self._last_beat = now
+        self.record(LAG_OPERATION, lag_ms)
+        sample, self._stall_sample = self._stall_sample, None
+        if lag_ms >= self.slow_ms:
+            self._log_slow(LAG_OPERATION, lag_ms, sample)
+
+    def _watch(self):
+        """Sample the GUI thread's stack once per stall"""
+        interval = max(self.slow_ms / 4000, 0.01)
+        while self._running:
+            time.sleep(interval)
+            silent_ms = (time.perf_counter() - self._last_beat) * 1000 - self.heartbeat_ms
+            if silent_ms >= self.slow_ms and self._stall_sample is None:
+                frame = sys._current_frames().get(self._gui_thread_id)
+                if frame is not None:
+                    self._stall_sample = _stack_lines(frame)
+
+    # ----- spans -----
+
+    def record(self, operation, ms):
+        with self._lock:
+            histogram = self._stats.get(operation)
+            if histogram is None:
+                histogram = self._stats[operation] = LatencyHistogram()
+            histogram.add(ms)
+
+    @contextmanager
+    def span(self, operation):
+        """Time a block; slow blocks are logged with the caller's stack"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            self.record(operation, ms)
+            if ms >= self.slow_ms:
+                on_gui = threading.get_ident() == self._gui_thread_id
+                # A stall sample taken meanwhile shows where the time went
+                sample = self._stall_sample if on_gui else None
+                self._log_slow(operation, ms, sample or _stack_lines(sys._getframe(2)))
+
+    def timed(self, operation):
+        """Decorator form of span()"""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(operation):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def _log_slow(self, operation, ms, stack):
+        self.log.write_record({
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "type": "SLOW_OPERATION",
+            "operation": operation,
+            "duration_ms": round(ms, 1),
+            "threshold_ms": self.slow_ms,
+            "thread": threading.current_thread().name,
+            "stack": stack or [],
+        })
+
+    # ----- summary -----
+
+    def summary(self):
+        """Rows of (operation, count, p50, p95, p99, max) in milliseconds"""
+        with self._lock:
+            return [
+                (op, h.count, h.percentile(50), h.percentile(95), h.percentile(99), h.max_ms)
+                for op, h in sorted(self._stats.items())
+            ]
+
+
+class PerfSummaryDialog(QDialog):
+    """Per-operation latency percentiles for the current shift"""
+
+    COLUMNS = ["Operation", "Count", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)"]
+
+    def __init__(self, monitor, parent=None):
+        super().__init__(parent)
+        self.monitor = monitor
+        self.setWindowTitle("Performance")
+        self.setMinimumSize(700, 400)
+        self.setObjectName("perfDialog")
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        title = QLabel(f"📈 Latency since {monitor.started_at.strftime('%H:%M')} "
+                       f"(slow > {monitor.slow_ms:g} ms)")
+        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setObjectName("perfTitle")
+        layout.addWidget(title)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setFont(QFont("Arial", 12))
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        refresh_btn.clicked.connect(self.refresh)
+        layout.addWidget(refresh_btn)
+        self.refresh()
+
+    def refresh(self):
+        rows = self.monitor.summary()
+        self.table.setRowCount(len(rows))
+        for r, (op, count, p50, p95, p99, max_ms) in enumerate(rows):
+            values = [op, str(count)] + [f"{v:.1f}" for v in (p50, p95, p99, max_ms)]
+            for c, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if c:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(r, c, item)
+
+
+# Global monitor; the cashier window starts it
+perf_monitor = PerfMonitor()
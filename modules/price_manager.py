@@ -1,199 +1,388 @@
 """
 PRICE MANAGER DIALOG
 Handles product price updates with logging
+
+Prices are edited in place in one table, or many at once: a percentage or
+fixed change for a category, a catalog prefix, the rows left by the filter
+or the selected rows, or a supplier price list (CSV with product_id and
+price). Every change is previewed in the table first; Apply writes them all
+with one storage update and one audit record (modules.bulk_pricing).
 """
 
 import os
+
 import pandas as pd
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QLabel, QInputDialog, QMessageBox, QScrollArea, QWidget
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox, QWidget,
+    QComboBox, QDoubleSpinBox, QFileDialog, QStyledItemDelegate, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from modules.activity_logger import activity_logger
+from modules.bulk_pricing import (
+    MIN_PRICE, MAX_PRICE, PLAN_COLUMNS, PricePlan, select_products, adjust_prices,
+    supplier_price_plan, apply_price_plan
+)
+from modules.product_grid import ProductGridModel, VALUE_COLUMN, create_grid_view
+from modules.storage import get_storage
+from modules.theme import apply_theme
+
+
+PRICE_COLUMN = VALUE_COLUMN
+
+SCOPE_ALL, SCOPE_CATEGORY, SCOPE_PREFIX, SCOPE_FILTERED, SCOPE_SELECTED = range(5)
+SCOPES = ["All products", "Category", "Catalog prefix", "Filtered rows", "Selected rows"]
+MODES = ["%", "$"]
+MAX_REJECTS_SHOWN = 10
+MANUAL_EDIT = "manual edit"
+
+
+class PriceTableModel(ProductGridModel):
+    """Product grid whose editable column is the price"""
+
+    HEADERS = ["Product ID", "Name", "Category", "Price"]
+
+    def __init__(self, products, parent=None):
+        super().__init__(products, [round(float(p), 2) for p in products['price'].fillna(0)], parent)
+        self.rules = {}  # row -> rule behind its pending price, for the audit record
+
+    def parse(self, value):
+        try:
+            value = round(float(value), 2)
+        except (TypeError, ValueError):
+            return None
+        return value if MIN_PRICE <= value <= MAX_PRICE else None
+
+    def format(self, value):
+        return f"${value:.2f}"
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        accepted = super().setData(index, value, role)
+        if accepted:
+            self.set_rule([index.row()], MANUAL_EDIT)
+        return accepted
+
+    def set_rule(self, rows, rule):
+        """Record the rule behind the pending prices of rows (the latest one wins)"""
+        for row in rows:
+            self.rules.pop(row, None)  # Re-inserted so the rules stay in the order they were made
+            self.rules[row] = rule
+
+    def pending_rules(self):
+        """Rules behind the prices still pending, oldest first, each once"""
+        return list(dict.fromkeys(rule for row, rule in self.rules.items() if row in self.pending))
+
+
+class PriceDelegate(QStyledItemDelegate):
+    """Spin box editor limited to valid prices"""
+
+    def createEditor(self, parent, option, index):
+        editor = QDoubleSpinBox(parent)
+        editor.setRange(MIN_PRICE, MAX_PRICE)
+        editor.setDecimals(2)
+        editor.setPrefix("$")
+        editor.setFont(QFont("Arial", 13, QFont.Weight.Bold))
+        return editor
 
 
 class PriceManagerDialog(QDialog):
     """Dialog for updating product prices"""
-    
+
     def __init__(self, parent=None, employee_id="000", employee_name="Unknown"):
+        apply_theme()
         super().__init__(parent)
+        self.setObjectName("priceManager")
         self.setWindowTitle("Price Manager")
-        self.setGeometry(250, 150, 800, 600)
-        self.setStyleSheet("QDialog { background-color: #f8fafc; }")
-        
+        self.setGeometry(250, 150, 900, 700)
+
         self.employee_id = employee_id
         self.employee_name = employee_name
-        
+
         self.products = self.load_products()
         self.init_ui()
-    
+
     def load_products(self):
-        """Load products from CSV"""
-        data_path = os.path.join("data", "products.csv")
+        """Load products from storage"""
         try:
-            df = pd.read_csv(data_path)
-            return df
-        except:
+            return get_storage().load_products()
+        except Exception:
             return pd.DataFrame(columns=["product_id", "name", "category", "price", "stock"])
-    
-    def save_products(self):
-        """Save products to CSV"""
-        data_path = os.path.join("data", "products.csv")
-        self.products.to_csv(data_path, index=False)
-    
+
     def init_ui(self):
         """Initialize price manager UI"""
         layout = QVBoxLayout()
         self.setLayout(layout)
-        
+
         # Title
         title = QLabel("💰 Price Management")
+        title.setObjectName("managerTitle")
         title.setFont(QFont("Arial", 24, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            color: #7c3aed;
-            background-color: #f3e8ff;
-            padding: 15px;
-            border-radius: 10px;
-            margin: 10px;
-        """)
         layout.addWidget(title)
-        
+
         # Show logged in user
         user_info = QLabel(f"👤 Logged in as: {self.employee_name} ({self.employee_id})")
+        user_info.setObjectName("managerUser")
         user_info.setFont(QFont("Arial", 12))
         user_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        user_info.setStyleSheet("color: #64748b; margin: 5px;")
         layout.addWidget(user_info)
-        
+
         # Instructions
-        instructions = QLabel("Click on a product to update its price:")
+        instructions = QLabel("Type a new price in the Price column, or change many prices at once:")
+        instructions.setObjectName("managerHint")
         instructions.setFont(QFont("Arial", 14))
-        instructions.setStyleSheet("color: #475569; margin: 10px;")
         layout.addWidget(instructions)
-        
-        # Scroll area for products
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
-        
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout()
-        scroll_widget.setLayout(scroll_layout)
-        scroll.setWidget(scroll_widget)
-        
-        # Create product buttons
-        for idx, row in self.products.iterrows():
-            product_widget = QWidget()
-            product_widget.setMinimumHeight(70)
-            product_widget.setMaximumHeight(70)
-            product_widget.setStyleSheet("""
-                QWidget {
-                    background-color: #ffffff;
-                    border: 2px solid #cbd5e1;
-                    border-radius: 8px;
-                    padding: 10px;
-                    margin: 5px;
-                }
-                QWidget:hover {
-                    border: 2px solid #8b5cf6;
-                }
-            """)
-            
-            h_layout = QHBoxLayout()
-            h_layout.setContentsMargins(10, 5, 10, 5)
-            product_widget.setLayout(h_layout)
-            
-            # Product info - ALL IN ONE LINE
-            info_label = QLabel(f"🏷️ {row['product_id']} - {row['name']}  |  💵 Price: ${float(row['price']):.2f}")
-            info_label.setFont(QFont("Arial", 13))
-            info_label.setStyleSheet("color: #1e293b;")
-            info_label.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-            h_layout.addWidget(info_label, 1)
-            
-            # Update button
-            update_btn = QPushButton("Update Price")
-            update_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            update_btn.setMinimumSize(QSize(140, 45))
-            update_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #8b5cf6;
-                    color: white;
-                    border-radius: 8px;
-                    padding: 10px 15px;
-                }
-                QPushButton:hover {
-                    background-color: #7c3aed;
-                }
-            """)
-            update_btn.clicked.connect(lambda _, i=idx: self.update_price(i))
-            h_layout.addWidget(update_btn)
-            
-            scroll_layout.addWidget(product_widget)
-        
-        layout.addWidget(scroll)
-        
+
+        layout.addWidget(self.create_bulk_panel())
+
+        # One table for all products; only the visible rows are painted
+        self.model = PriceTableModel(self.products, self)
+        self.search_input, self.proxy, self.table = create_grid_view(self.model, PriceDelegate())
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        layout.addWidget(self.search_input)
+        layout.addWidget(self.table, 1)
+
+        self.pending_label = QLabel()
+        self.pending_label.setObjectName("pendingStatus")
+        self.pending_label.setFont(QFont("Arial", 13, QFont.Weight.Bold))
+        self.pending_label.setWordWrap(True)
+        layout.addWidget(self.pending_label)
+        self.model.pending_changed.connect(self.update_pending)
+
+        buttons_layout = QHBoxLayout()
+        self.apply_btn = QPushButton("💾 Apply Prices")
+        self.apply_btn.setObjectName("saveButton")
+        self.apply_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.apply_btn.setMinimumHeight(50)
+        self.apply_btn.clicked.connect(self.apply_changes)
+        buttons_layout.addWidget(self.apply_btn)
+
+        self.discard_btn = QPushButton("↩️ Discard")
+        self.discard_btn.setObjectName("discardButton")
+        self.discard_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.discard_btn.setMinimumHeight(50)
+        self.discard_btn.clicked.connect(self.discard_changes)
+        buttons_layout.addWidget(self.discard_btn)
+
         # Close button
         close_btn = QPushButton("✅ Done")
+        close_btn.setObjectName("doneButton")
         close_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
         close_btn.setMinimumHeight(50)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10b981;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-        """)
         close_btn.clicked.connect(self.close)
-        layout.addWidget(close_btn)
-    
-    def update_price(self, index):
-        """Update price for a specific product"""
-        product = self.products.iloc[index]
-        current_price = float(product['price'])
-        
-        new_price, ok = QInputDialog.getDouble(
+        buttons_layout.addWidget(close_btn)
+        layout.addLayout(buttons_layout)
+
+        # Enter belongs to the grid editor and the filter box, never to a button
+        for button in self.findChildren(QPushButton):
+            button.setAutoDefault(False)
+        self.update_pending(0)
+
+    def create_bulk_panel(self):
+        """Scope, amount and preview controls for bulk price changes"""
+        panel = QWidget()
+        panel.setObjectName("bulkPanel")
+        panel.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        row = QHBoxLayout()
+        panel.setLayout(row)
+        font = QFont("Arial", 12)
+
+        caption = QLabel("Change")
+        caption.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        row.addWidget(caption)
+
+        self.scope_combo = QComboBox()
+        self.scope_combo.addItems(SCOPES)
+        self.scope_combo.setFont(font)
+        self.scope_combo.currentIndexChanged.connect(self.update_scope_values)
+        row.addWidget(self.scope_combo)
+
+        self.scope_value = QComboBox()
+        self.scope_value.setFont(font)
+        self.scope_value.setMinimumWidth(110)
+        row.addWidget(self.scope_value)
+
+        by_label = QLabel("by")
+        by_label.setFont(font)
+        row.addWidget(by_label)
+
+        self.amount_spin = QDoubleSpinBox()
+        self.amount_spin.setRange(-MAX_PRICE, MAX_PRICE)
+        self.amount_spin.setDecimals(2)
+        self.amount_spin.setFont(font)
+        row.addWidget(self.amount_spin)
+
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(MODES)
+        self.mode_combo.setFont(font)
+        row.addWidget(self.mode_combo)
+
+        preview_btn = QPushButton("👁️ Preview")
+        preview_btn.setObjectName("previewButton")
+        preview_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        preview_btn.clicked.connect(self.preview_bulk_change)
+        row.addWidget(preview_btn)
+
+        row.addStretch(1)
+
+        import_btn = QPushButton("📄 Supplier CSV...")
+        import_btn.setObjectName("importButton")
+        import_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        import_btn.clicked.connect(self.import_supplier_prices)
+        row.addWidget(import_btn)
+
+        self.update_scope_values(SCOPE_ALL)
+        return panel
+
+    def update_scope_values(self, scope):
+        """Offer the categories or prefixes the chosen scope needs"""
+        self.scope_value.clear()
+        if scope == SCOPE_CATEGORY:
+            self.scope_value.addItems(sorted(self.products['category'].astype(str).unique()))
+        elif scope == SCOPE_PREFIX:
+            self.scope_value.addItems(sorted(self.products['product_id'].astype(str).str[:2].unique()))
+        self.scope_value.setEnabled(scope in (SCOPE_CATEGORY, SCOPE_PREFIX))
+
+    def scope_mask(self):
+        """(mask over self.products, description) for the chosen scope"""
+        scope = self.scope_combo.currentIndex()
+        value = self.scope_value.currentText()
+        if scope == SCOPE_CATEGORY:
+            return select_products(self.products, category=value), f"category {value}"
+        if scope == SCOPE_PREFIX:
+            return select_products(self.products, prefix=value), f"prefix {value}"
+        if scope == SCOPE_FILTERED:
+            ids = [self.proxy.index(r, 0).data() for r in range(self.proxy.rowCount())]
+            return select_products(self.products, product_ids=ids), f"filter '{self.search_input.text()}'"
+        if scope == SCOPE_SELECTED:
+            rows = {self.proxy.mapToSource(i).row() for i in self.table.selectionModel().selectedRows()}
+            ids = [self.model.ids[r] for r in rows]
+            return select_products(self.products, product_ids=ids), "selected rows"
+        return select_products(self.products), "all products"
+
+    def preview_bulk_change(self):
+        """Show the bulk change in the table as pending edits"""
+        amount = self.amount_spin.value()
+        if amount == 0:
+            QMessageBox.information(self, "Bulk Price Change", "Enter the change first (e.g. 5 % or -0.10 $).")
+            return
+        mask, scope = self.scope_mask()
+        if not mask.any():
+            QMessageBox.information(self, "Bulk Price Change", f"No products in {scope}.")
+            return
+
+        if self.mode_combo.currentText() == "%":
+            plan = adjust_prices(self.products, mask, percent=amount)
+        else:
+            plan = adjust_prices(self.products, mask, amount=amount)
+        plan.rule = f"{scope} {plan.rule}"
+        self.show_plan(plan)
+
+    def import_supplier_prices(self):
+        """Preview the prices of a supplier price list"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Supplier Price List", "", "CSV files (*.csv);;All files (*)"
+        )
+        if not path:
+            return
+        try:
+            plan = supplier_price_plan(self.products, path, rule=f"supplier list {os.path.basename(path)}")
+        except Exception as e:
+            print(f"[ERROR] Failed to read supplier price list: {e}")
+            QMessageBox.warning(self, "Supplier Price List", f"❌ Could not read {os.path.basename(path)}:\n\n{e}")
+            return
+        self.show_plan(plan)
+
+    def show_plan(self, plan):
+        """Put a PricePlan into the pending buffer and report what it does"""
+        values = {
+            self.model.row_of[pid]: float(price)
+            for pid, price in zip(plan.changes['product_id'], plan.changes['new_price'])
+        }
+        self.model.set_pending(values)
+        self.model.set_rule(values, plan.rule)
+
+        text = f"👁️ {plan.summary()}."
+        if len(plan):
+            text += "\n\nChanged prices are highlighted; press Apply to save them."
+        if len(plan.rejected):
+            shown = plan.rejected.head(MAX_REJECTS_SHOWN)
+            text += "\n\nRejected:\n" + "\n".join(f"• {pid}: {reason}" for pid, reason in zip(shown['product_id'], shown['reason']))
+            if len(plan.rejected) > MAX_REJECTS_SHOWN:
+                text += f"\n… and {len(plan.rejected) - MAX_REJECTS_SHOWN} more"
+        QMessageBox.information(self, "Price Preview", text)
+
+    def update_pending(self, count):
+        """Show how many price changes are waiting to be applied"""
+        self.pending_label.setText(f"✏️ {count} price change(s) ready to apply" if count else "No unsaved changes")
+        self.apply_btn.setEnabled(count > 0)
+        self.discard_btn.setEnabled(count > 0)
+
+    def discard_changes(self):
+        self.model.discard()
+        self.model.rules.clear()
+
+    def apply_changes(self):
+        """
+        Write every pending price with one storage update and one audit record
+
+        A single price edited by hand is logged as PRICE_UPDATE, anything
+        else as one BULK_PRICE_UPDATE naming the rules behind the prices.
+        """
+        changes = self.model.pending_changes()
+        if not changes:
+            return True
+
+        rules = self.model.pending_rules()
+        try:
+            if len(changes) == 1 and rules == [MANUAL_EDIT]:
+                count = self.apply_single_edit(*changes[0][1:])
+            else:
+                plan = PricePlan("; ".join(rules), pd.DataFrame(
+                    [(pid, name, old, new) for _, pid, name, old, new in changes], columns=PLAN_COLUMNS
+                ))
+                count = apply_price_plan(get_storage(), plan, self.employee_id, self.employee_name)
+        except Exception as e:
+            print(f"[ERROR] Failed to save prices: {e}")
+            QMessageBox.critical(self, "Prices Not Saved", f"❌ Could not save the price changes:\n\n{e}")
+            return False
+
+        self.model.mark_saved([row for row, *_ in changes])
+        self.products['price'] = self.model.values
+        self.model.rules.clear()
+
+        QMessageBox.information(
             self,
-            "Update Price",
-            f"Product: {product['name']}\n"
-            f"Current Price: ${current_price:.2f}\n\n"
-            f"Enter new price:",
-            value=current_price,
-            min=0.01,
-            max=9999.99,
-            decimals=2
+            "Prices Updated",
+            f"✅ {count} price(s) updated.\n\n"
+            f"The change has been logged."
         )
-        
-        if ok and new_price != current_price:
-            # Update price
-            self.products.at[index, 'price'] = new_price
-            self.save_products()
-            
-            # Log the price update
-            activity_logger.log_price_update(
-                self.employee_id,
-                self.employee_name,
-                product['product_id'],
-                product['name'],
-                current_price,
-                new_price
-            )
-            
-            QMessageBox.information(
+        return True
+
+    def apply_single_edit(self, product_id, name, old_price, new_price):
+        """Write one hand-edited price; returns the number of prices changed"""
+        if not get_storage().update_products({product_id: {'price': new_price}}):
+            return 0
+        activity_logger.log_price_update(
+            self.employee_id, self.employee_name, product_id, name, old_price, new_price
+        )
+        return 1
+
+    def done(self, result):
+        """Ask before closing with unapplied changes (Done, Escape and the window button)"""
+        if self.model.pending:
+            answer = QMessageBox.question(
                 self,
-                "Price Updated",
-                f"✅ {product['name']}\n"
-                f"Price updated: ${current_price:.2f} → ${new_price:.2f}\n\n"
-                f"Change has been logged."
+                "Unsaved Changes",
+                f"You have {len(self.model.pending)} price change(s) not applied yet.\n\nApply them now?",
+                QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard
+                | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Save
             )
-            
-            # Refresh the dialog
-            self.close()
-            new_dialog = PriceManagerDialog(self.parent(), self.employee_id, self.employee_name)
-            new_dialog.exec()
+            if answer == QMessageBox.StandardButton.Cancel:
+                return
+            if answer == QMessageBox.StandardButton.Save and not self.apply_changes():
+                return
+            self.discard_changes()
+        super().done(result)
@@ -0,0 +1,203 @@
+"""
+PRODUCT GRID
+Editable product table shared by the stock and price managers
+
+ProductGridModel shows product id, name, category and one editable value
+column (stock or price). Edits go into a pending buffer (row -> new value),
+drawn highlighted as "old → new", until the dialog saves them all at once.
+Only the rows scrolled into view are painted, whatever the catalog size.
+"""
+
+from PyQt6.QtWidgets import QLineEdit, QTableView, QHeaderView, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, pyqtSignal
+from PyQt6.QtGui import QFont, QColor
+
+
+VALUE_COLUMN = 3
+PENDING_BACKGROUND = QColor("#fef3c7")
+
+
+class ProductGridModel(QAbstractTableModel):
+    """Products with one editable value column and a buffer of unsaved edits"""
+
+    HEADERS = ["Product ID", "Name", "Category", "Value"]
+
+    pending_changed = pyqtSignal(int)
+
+    def __init__(self, products, values, parent=None):
+        super().__init__(parent)
+        self.ids = products['product_id'].astype(str).tolist()
+        self.names = products['name'].astype(str).tolist()
+        self.categories = products['category'].astype(str).tolist()
+        self.values = list(values)
+        self.row_of = {pid: row for row, pid in enumerate(self.ids)}
+        self.pending = {}  # row -> new value
+        self.pending_font = QFont("Arial", 13, QFont.Weight.Bold)
+
+    # ----- per-column behaviour, overridden by the stock and price models -----
+
+    def parse(self, value):
+        """Valid value from editor input, or None to refuse the edit"""
+        return value
+
+    def format(self, value):
+        return str(value)
+
+    def row_background(self, row):
+        """Background of a row without pending edits"""
+        return None
+
+    # ----- Qt model -----
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() == VALUE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def value(self, row):
+        """Value shown for a row: the pending one if there is one"""
+        return self.pending.get(row, self.values[row])
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return self.ids[row]
+            if col == 1:
+                return self.names[row]
+            if col == 2:
+                return self.categories[row]
+            if row in self.pending:
+                return f"{self.format(self.values[row])} → {self.format(self.pending[row])}"
+            return self.format(self.values[row])
+        if role == Qt.ItemDataRole.EditRole and col == VALUE_COLUMN:
+            return self.value(row)
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if row in self.pending:
+                return PENDING_BACKGROUND
+            return self.row_background(row)
+        if role == Qt.ItemDataRole.FontRole and col == VALUE_COLUMN and row in self.pending:
+            return self.pending_font
+        if role == Qt.ItemDataRole.TextAlignmentRole and col == VALUE_COLUMN:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() != VALUE_COLUMN:
+            return False
+        value = self.parse(value)
+        if value is None:
+            return False
+
+        row = index.row()
+        if value == self.values[row]:
+            self.pending.pop(row, None)  # Edited back to the saved value
+        else:
+            self.pending[row] = value
+        self._rows_changed(row, row)
+        self.pending_changed.emit(len(self.pending))
+        return True
+
+    # ----- pending buffer -----
+
+    def _rows_changed(self, first, last):
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.HEADERS) - 1))
+
+    def set_pending(self, values):
+        """Add {row: new value} to the buffer in one go, e.g. a bulk preview"""
+        if not values:
+            return
+        for row, value in values.items():
+            if value == self.values[row]:
+                self.pending.pop(row, None)
+            else:
+                self.pending[row] = value
+        self._rows_changed(min(values), max(values))
+        self.pending_changed.emit(len(self.pending))
+
+    def pending_changes(self):
+        """(row, product_id, name, old value, new value) for every unsaved edit"""
+        return [(row, self.ids[row], self.names[row], self.values[row], new)
+                for row, new in sorted(self.pending.items())]
+
+    def mark_saved(self, rows):
+        """Make the pending values of rows the saved ones"""
+        rows = [row for row in rows if row in self.pending]
+        for row in rows:
+            self.values[row] = self.pending.pop(row)
+        if rows:
+            self._rows_changed(min(rows), max(rows))
+        self.pending_changed.emit(len(self.pending))
+
+    def update_values(self, values):
+        """Replace saved values {row: value} written elsewhere, e.g. by an import"""
+        if not values:
+            return
+        for row, value in values.items():
+            self.values[row] = value
+        self._rows_changed(min(values), max(values))
+
+    def discard(self):
+        """Drop every unsaved edit"""
+        rows = list(self.pending)
+        self.pending.clear()
+        if rows:
+            self._rows_changed(min(rows), max(rows))
+        self.pending_changed.emit(0)
+
+
+def create_grid_view(model, delegate, value_width=170):
+    """
+    Filter box, filter proxy and table view for a ProductGridModel
+
+    Returns (search_input, proxy, table); typing in a value cell starts the
+    delegate's editor straight away.
+    """
+    search_input = QLineEdit()
+    search_input.setObjectName("managerSearch")
+    search_input.setPlaceholderText("🔍 Filter by product ID, name or category...")
+    search_input.setFont(QFont("Arial", 13))
+    search_input.setClearButtonEnabled(True)
+
+    proxy = QSortFilterProxyModel(model)
+    proxy.setSourceModel(model)
+    proxy.setFilterKeyColumn(-1)
+    proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+    search_input.textChanged.connect(proxy.setFilterFixedString)
+
+    table = QTableView()
+    table.setObjectName("managerGrid")
+    table.setModel(proxy)
+    delegate.setParent(table)
+    table.setItemDelegateForColumn(VALUE_COLUMN, delegate)
+    table.setFont(QFont("Arial", 13))
+    table.setEditTriggers(
+        QAbstractItemView.EditTrigger.DoubleClicked
+        | QAbstractItemView.EditTrigger.EditKeyPressed
+        | QAbstractItemView.EditTrigger.AnyKeyPressed
+    )
+    table.verticalHeader().hide()
+    # Fixed row heights and section sizes avoid measuring every row
+    table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    table.verticalHeader().setDefaultSectionSize(40)
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+    header.resizeSection(0, 120)
+    header.resizeSection(2, 130)
+    header.resizeSection(VALUE_COLUMN, value_width)
+    return search_input, proxy, table
@@ -0,0 +1,175 @@
+"""
+PRODUCT SEARCH
+In-memory search-as-you-type over product ids and names
+
+- Prefix index: every id/name token of every product kept as sorted
+  (token, product_id) pairs. This is a flattened prefix trie: all tokens
+  starting with a query word form one contiguous slice found by bisect.
+- Trigram index over the distinct name words: a query word that starts
+  no token is corrected to its closest words before the prefix lookup
+
+Both indexes are built from the catalog whenever the till loads its
+products; price and stock do not change what a product matches.
+"""
+
+import bisect
+import heapq
+import itertools
+import re
+from operator import itemgetter
+
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+DEFAULT_LIMIT = 50
+MIN_FUZZY_LENGTH = 3     # shorter words are never typo-corrected
+MAX_GRAM_TOKENS = 500    # trigrams shared by more tokens are ignored for typos
+MAX_VARIANTS = 9         # corrected spellings tried per query
+SET_FILTER_SIZE = 256    # multi-word queries over broader slices filter by set intersection
+MIN_SIMILARITY = 0.4     # trigram Dice coefficient needed to count as a typo
+
+
+def tokens_of(product_id, name):
+    """Searchable tokens: the full id plus each word of id and name"""
+    product_id = str(product_id).lower()
+    tokens = {product_id}
+    tokens.update(_WORD.findall(product_id))
+    tokens.update(_WORD.findall(str(name).lower()))
+    return tokens
+
+
+def trigrams(words):
+    """Character trigrams of each word padded with spaces (' ab', 'abc', 'bc ')"""
+    grams = set()
+    for word in words:
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class ProductSearchIndex:
+    """Prefix + trigram index over a ProductCatalog"""
+
+    def __init__(self, catalog=None):
+        self._pairs = []          # sorted (token, product_id)
+        self._tokens = {}         # product_id -> tokens
+        self._vocabulary = set()  # word tokens in the trigram index
+        self._grams = {}          # trigram -> word tokens containing it
+        if catalog is not None:
+            self.rebuild(catalog)
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def rebuild(self, catalog):
+        """Index every product of the catalog from scratch"""
+        self._pairs = []
+        self._tokens = {}
+        self._vocabulary = set()
+        self._grams = {}
+        for product in catalog:
+            tokens = tokens_of(product.product_id, product.name)
+            self._tokens[product.product_id] = tokens
+            self._pairs.extend((token, product.product_id) for token in tokens)
+            self._add_vocabulary(tokens)
+        self._pairs.sort()
+
+    def _add_vocabulary(self, tokens):
+        for token in tokens:
+            if not token.isalpha() or token in self._vocabulary:
+                continue  # Ids and sizes are matched by prefix only
+            self._vocabulary.add(token)
+            for gram in trigrams([token]):
+                self._grams.setdefault(gram, set()).add(token)
+
+    def _slice(self, word):
+        """Bounds of the (token, product_id) pairs whose token starts with word"""
+        lo = bisect.bisect_left(self._pairs, (word,))
+        hi = bisect.bisect_left(self._pairs, (word + "\uffff",), lo)
+        return lo, hi
+
+    def _prefix_search(self, words, limit, seen):
+        """Products where every word starts some token, scanning the narrowest slice"""
+        bounds = {word: self._slice(word) for word in words}
+        key = min(words, key=lambda w: bounds[w][1] - bounds[w][0])
+        others = [w for w in words if w != key]
+        pairs = self._pairs
+        lo, hi = bounds[key]
+
+        allowed = None
+        if others and hi - lo > SET_FILTER_SIZE:
+            # Broad words: intersect id sets once instead of checking tokens per candidate
+            allowed = set.intersection(*(
+                set(map(itemgetter(1), pairs[slice(*bounds[w])])) for w in others
+            ))
+
+        results = []
+        for i in range(lo, hi):
+            pid = pairs[i][1]
+            if pid in seen:
+                continue
+            if allowed is not None:
+                if pid not in allowed:
+                    continue
+            elif others:
+                tokens = self._tokens[pid]
+                if not all(w in tokens or any(t.startswith(w) for t in tokens) for w in others):
+                    continue
+            seen.add(pid)
+            results.append(pid)
+            if len(results) >= limit:
+                break
+        return results
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """
+        Ranked product ids for a query
+
+        Prefix matches come first (exact token matches before longer
+        tokens, then alphabetically). Words that start no token at all are
+        treated as typos and replaced by their closest indexed tokens.
+        """
+        words = _WORD.findall(str(query).lower())
+        if not words:
+            return []
+
+        seen = set()
+        results = self._prefix_search(words, limit, seen)
+        if len(results) >= limit:
+            return results
+
+        # Typo tolerance: swap unmatched words for near tokens by shared trigrams
+        options = []
+        for word in words:
+            lo, hi = self._slice(word)
+            if hi > lo:
+                options.append([word])
+            elif len(word) >= MIN_FUZZY_LENGTH and word.isalpha():
+                options.append(self._corrections(word))
+            else:
+                options.append([])
+        if any(len(o) != 1 or o[0] != w for o, w in zip(options, words)) and all(options):
+            for variant in itertools.islice(itertools.product(*options), MAX_VARIANTS):
+                results.extend(self._prefix_search(list(variant), limit - len(results), seen))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def _corrections(self, word, count=3):
+        """Indexed tokens with a trigram similarity (Dice) of at least MIN_SIMILARITY, best first"""
+        grams = trigrams([word])
+        shared = {}
+        for gram in grams:
+            vocab = self._grams.get(gram, ())
+            if len(vocab) > MAX_GRAM_TOKENS:
+                continue  # Too common to tell tokens apart
+            for token in vocab:
+                shared[token] = shared.get(token, 0) + 1
+        # A padded word of length n has n trigrams
+        candidates = (
+            (2.0 * n / (len(grams) + len(token)), token)
+            for token, n in shared.items()
+            if n >= 2 and 2.0 * n / (len(grams) + len(token)) >= MIN_SIMILARITY
+        )
+        best = heapq.nsmallest(count, candidates, key=lambda c: (-c[0], c[1]))
+        return [token for _, token in best]
@@ -0,0 +1,107 @@
+"""
+REPORT ENGINE
+Daily sales report pages from pre-aggregated rollup rows
+The rollup (see modules.sales_rollup) already holds per-day product,
+cashier and customer totals, so building a report only touches one row
+per day and key regardless of how many sales were made.
+"""
+
+from datetime import date
+
+from modules.sales_rollup import build_rollup
+
+
+class DaySummary:
+    """Aggregated figures for one report page"""
+
+    __slots__ = ("day", "cashiers", "customers", "products", "top_products",
+                 "frequent_customers", "total_transactions", "total_revenue")
+
+    def __init__(self, day, cashiers, customers, products, top_products,
+                 frequent_customers, total_transactions, total_revenue):
+        self.day = day
+        self.cashiers = cashiers                      # names in order of first sale
+        self.customers = customers
+        self.products = products                      # [(product_id, qty, revenue)] in order of first sale
+        self.top_products = top_products              # up to 5 of the above, by qty
+        self.frequent_customers = frequent_customers  # up to 3 (customer, purchases)
+        self.total_transactions = total_transactions
+        self.total_revenue = total_revenue
+
+
+def summarize_rollup(rollup):
+    """
+    Build per-day summaries from daily rollup rows
+
+    Args:
+        rollup: DataFrame with day, kind, key, count, qty and revenue, one row
+                per (day, kind, key) in order of first sale
+
+    Returns:
+        List of DaySummary sorted by day
+    """
+    days = {}
+    for row in rollup.itertuples(index=False):
+        day = days.setdefault(row.day, {'product': [], 'cashier': [], 'customer': []})
+        day[row.kind].append((row.key, int(row.qty) if row.kind == 'product' else int(row.count),
+                              float(row.revenue)))
+
+    summaries = []
+    for day in sorted(days):
+        rows = days[day]
+        if not rows['cashier']:
+            continue
+        summaries.append(DaySummary(
+            date.fromisoformat(day),
+            [key for key, _, _ in rows['cashier']],
+            [key for key, _, _ in rows['customer']],
+            rows['product'],
+            sorted(rows['product'], key=lambda r: r[1], reverse=True)[:5],
+            [(key, count) for key, count, _ in
+             sorted(rows['customer'], key=lambda r: r[1], reverse=True)[:3]],
+            sum(count for _, count, _ in rows['cashier']),
+            sum(revenue for _, _, revenue in rows['product']),
+        ))
+    return summaries
+
+
+def summarize_sales(sales, items):
+    """Per-day summaries straight from sales and line items (no stored rollup)"""
+    return summarize_rollup(build_rollup(sales, items))
+
+
+def render_day_page(summary, catalog):
+    """Text of one report page; catalog supplies product names and stock left"""
+    page_text = f"📅 SALES REPORT - {summary.day}\n"
+    page_text += f"Cashiers: {', '.join(summary.cashiers)}\n"
+    page_text += f"Customers: {', '.join(summary.customers)}\n"
+    page_text += "-"*55 + "\n"
+    page_text += f"{'Product ID':10} {'Qty Sold':>10} {'Revenue($)':>12} {'Stock Left':>12}\n"
+    page_text += "-"*55 + "\n"
+    for pid, qty, total in summary.products:
+        product = catalog.get(pid)
+        stock_left = product.stock if product else 'N/A'
+        page_text += f"{pid:10} {qty:>10} {total:>12.2f} {str(stock_left):>12}\n"
+    page_text += "-"*55 + "\n"
+    page_text += f"Total Transactions: {summary.total_transactions}\n"
+    page_text += f"Total Revenue($): {summary.total_revenue:.2f}\n\n"
+
+    # --- Top 5 products ---
+    page_text += "🏆 Top-Selling Products:\n"
+    for pid, qty, _ in summary.top_products:
+        product = catalog.get(pid)
+        pname = product.name if product else pid
+        page_text += f"  - {pname} ({pid}): {qty} sold\n"
+    page_text += "\n"
+
+    # --- Frequent customers ---
+    page_text += "🙋 Frequent Customers:\n"
+    for cust, count in summary.frequent_customers:
+        page_text += f"  - {cust}: {count} purchases\n"
+
+    return page_text
+
+
+def build_report_pages(rollup, catalog):
+    """One text page per day with sales"""
+    return [render_day_page(summary, catalog) for summary in summarize_rollup(rollup)]
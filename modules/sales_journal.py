@@ -0,0 +1,231 @@
+"""
+SALES JOURNAL
+Append-only storage for completed sales (data/sales.csv) and their
+line items (data/sale_items.csv)
+Every checkout appends fsync'd lines instead of rewriting the files
+
+Limitations:
+- A torn last line or a legacy header is only repaired when the journal
+  is opened, and compaction runs once at start-up (maybe_compact); a
+  running till never rewrites the files.
+- tail() returns only the last RECENT_WINDOW bytes. Replay uses it to tell
+  which logged sales are already journaled, which relies on a logged
+  sale's rows being within that window. The WAL holds at most
+  CHECKPOINT_EVERY sales, so this holds unless those sales add more than
+  1 MB of rows; a sale older than the window would be journaled twice.
+"""
+
+import csv
+import io
+import os
+import pandas as pd
+
+
+SALES_COLUMNS = ["datetime", "customer_name", "cashier_name", "employee_id", "sale_id", "total"]
+SALE_ITEM_COLUMNS = ["sale_id", "product_id", "qty", "unit_price_at_sale", "line_total"]
+ISO_DATETIME = "%Y-%m-%d %H:%M:%S"
+# Replay looks for a logged sale in this much of the end of a journal (see above)
+RECENT_WINDOW = 1 << 20
+
+# Identifier columns that must not be parsed as numbers
+_TEXT_COLUMNS = ("employee_id", "sale_id", "product_id", "day", "key")
+
+# Appending in binary mode keeps Windows from translating line endings
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def parse_sale_datetimes(values):
+    """
+    Parse the mixed datetime formats found in sales history
+    ('11/1/2025 19:25', '2025-11-03 15:58:21'). Values without a date part
+    are treated as invalid instead of being read as today.
+    """
+    raw = pd.Series(values).astype(str)
+    # Everything written since the storage layer is ISO; only older rows need the slow path
+    parsed = pd.to_datetime(raw, errors='coerce', format=ISO_DATETIME)
+    rest = parsed.isna()
+    if rest.any():
+        other = raw[rest]
+        has_date = other.str.contains(r"\d[/-]\d", regex=True)
+        parsed[rest] = pd.to_datetime(other, errors='coerce', format='mixed').where(has_date)
+    return parsed
+
+
+class SalesJournal:
+    """Append-only journal of records backed by a CSV file"""
+
+    def __init__(self, path=os.path.join("data", "sales.csv"), columns=SALES_COLUMNS):
+        self.path = path
+        self.canonical_columns = list(columns)
+        self.columns = list(columns)
+        self.recovered_partial = False
+        self._open()
+
+    def _open(self):
+        """Create the journal if missing, read its header and repair a torn last line"""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        if not os.path.exists(self.path) or os.stat(self.path).st_size == 0:
+            self._write_bytes(self._format_row(self.columns))
+            return
+
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), None)
+        if header:
+            self.columns = header
+
+        self._recover_tail()
+
+    def _recover_tail(self):
+        """Complete or cut off a last line that was interrupted mid-write"""
+        with open(self.path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+
+            # Walk back to the start of the unterminated line
+            start = size
+            while start > 0:
+                step = min(4096, start)
+                f.seek(start - step)
+                chunk = f.read(step)
+                pos = chunk.rfind(b"\n")
+                if pos != -1:
+                    start = start - step + pos + 1
+                    break
+                start -= step
+
+            f.seek(start)
+            tail = f.read()
+
+            if self._is_complete_row(tail):
+                # The record made it to disk, only the terminator is missing
+                f.seek(0, os.SEEK_END)
+                f.write(b"\n")
+            else:
+                with open(self.path + ".partial", "ab") as partial:
+                    partial.write(tail + b"\n")
+                f.truncate(start)
+                self.recovered_partial = True
+                print(f"[WARN] Torn sales record moved to {self.path}.partial")
+
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _is_complete_row(self, raw):
+        """Check whether raw bytes hold exactly one full CSV record"""
+        try:
+            text = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+        if text.count('"') % 2:
+            return False
+        rows = list(csv.reader(io.StringIO(text)))
+        return len(rows) == 1 and len(rows[0]) == len(self.columns)
+
+    def _format_row(self, values):
+        """Encode one CSV line"""
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(values)
+        return buffer.getvalue().encode("utf-8")
+
+    def _write_bytes(self, data):
+        """Append bytes with a single write and flush them to disk"""
+        fd = os.open(self.path, _APPEND_FLAGS)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def append(self, record):
+        """
+        Append one record to the journal
+
+        Args:
+            record: Dictionary keyed by column name; unknown columns are left blank
+        """
+        self.append_many([record])
+
+    def append_many(self, records):
+        """Append several records with one write"""
+        if not records:
+            return
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for record in records:
+            writer.writerow(["" if record.get(col) is None else record.get(col) for col in self.columns])
+        self._write_bytes(buffer.getvalue().encode("utf-8"))
+
+    def append_frame(self, df):
+        """Append a DataFrame of records with one write (bulk loads)"""
+        if df.empty:
+            return
+        data = df.reindex(columns=self.columns).to_csv(index=False, header=False, lineterminator="\n")
+        self._write_bytes(data.encode("utf-8"))
+
+    def tail(self, window=RECENT_WINDOW):
+        """The last `window` bytes of the journal"""
+        if not os.path.exists(self.path):
+            return b""
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - window))
+            return f.read()
+
+    def _compacted_columns(self, header):
+        """Canonical columns plus the extra named ones of header ('Unnamed: 4' placeholders dropped)"""
+        extra = [c for c in header if c not in self.canonical_columns and not c.startswith("Unnamed:")]
+        return self.canonical_columns + extra
+
+    def needs_compaction(self):
+        """True when the file layout differs from what compact() would write"""
+        return self.recovered_partial or self.columns != self._compacted_columns(self.columns)
+
+    def compact(self):
+        """
+        Rewrite the journal with the canonical header
+        Empty placeholder columns (e.g. 'Unnamed: 4') are dropped, extra named
+        columns are kept. The new file replaces the old one atomically.
+        """
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            rows = [row for row in reader if any(cell.strip() for cell in row)]
+
+        columns = self._compacted_columns(header)
+        positions = {name: i for i, name in enumerate(header)}
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow([
+                    row[positions[c]] if c in positions and positions[c] < len(row) else ""
+                    for c in columns
+                ])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        self.columns = columns
+        self.recovered_partial = False
+        print(f"[INFO] {os.path.basename(self.path)} compacted: {len(rows)} records")
+
+    def maybe_compact(self):
+        """Compact once at start-up if needed, never on the checkout path"""
+        if self.needs_compaction():
+            try:
+                self.compact()
+            except Exception as e:
+                print(f"[ERROR] Failed to compact sales journal: {e}")
+
+    def read_dataframe(self):
+        """Load the whole journal for reporting"""
+        dtype = {col: str for col in _TEXT_COLUMNS if col in self.columns}
+        return pd.read_csv(self.path, dtype=dtype)
@@ -0,0 +1,151 @@
+"""
+SALES ROLLUP
+Pre-aggregated daily sales figures for reporting
+
+One row per (day, kind, key):
+- kind "product":  key = product_id, qty and revenue sold that day
+- kind "cashier":  key = cashier name, count = sales rung up
+- kind "customer": key = customer name, count = purchases
+
+Each committed sale appends its delta rows to data/daily_rollup.csv with a
+single write; start-up compaction folds them into one row per key, so the
+file grows with the number of days rather than the number of sales.
+"""
+
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from modules.sales_journal import SalesJournal, parse_sale_datetimes
+
+
+ROLLUP_COLUMNS = ["day", "kind", "key", "count", "qty", "revenue", "sale_id"]
+
+
+def sale_day(value):
+    """'YYYY-MM-DD' of a sale datetime, or None when it has no date"""
+    try:
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        parsed = parse_sale_datetimes([value]).iloc[0]
+        return None if pd.isna(parsed) else parsed.strftime("%Y-%m-%d")
+
+
+def _name(value):
+    return "Unknown" if value is None or pd.isna(value) or value == "" else str(value)
+
+
+def rollup_rows(sale_record, items):
+    """Delta rows contributed by one sale"""
+    day = sale_day(sale_record.get('datetime'))
+    if day is None:
+        return []
+    sale_id = sale_record.get('sale_id')
+    rows = [
+        {'day': day, 'kind': 'product', 'key': item['product_id'], 'count': 1,
+         'qty': int(item['qty']), 'revenue': float(item['line_total']), 'sale_id': sale_id}
+        for item in items
+    ]
+    for kind, field in (('cashier', 'cashier_name'), ('customer', 'customer_name')):
+        rows.append({'day': day, 'kind': kind, 'key': _name(sale_record.get(field)),
+                     'count': 1, 'qty': 0, 'revenue': 0.0, 'sale_id': sale_id})
+    return rows
+
+
+def build_rollup(sales, items):
+    """
+    Aggregate full sales history into rollup rows
+
+    Args:
+        sales: DataFrame with sale_id, datetime, customer_name and cashier_name
+        items: DataFrame of line items with sale_id, product_id, qty and line_total
+
+    Returns:
+        DataFrame with ROLLUP_COLUMNS (minus sale_id); keys keep order of first sale
+    """
+    sales = sales[['sale_id', 'datetime', 'customer_name', 'cashier_name']].copy()
+    sales['day'] = parse_sale_datetimes(sales['datetime']).dt.strftime("%Y-%m-%d").values
+    sales = sales.dropna(subset=['day'])
+    for col in ('customer_name', 'cashier_name'):
+        sales[col] = sales[col].fillna("Unknown").astype(str).replace("", "Unknown")
+
+    items = items[['sale_id', 'product_id', 'qty', 'line_total']].copy()
+    items['day'] = items['sale_id'].map(pd.Series(sales['day'].values, index=sales['sale_id'].values))
+    items = items.dropna(subset=['day'])
+    items['qty'] = pd.to_numeric(items['qty'], errors='coerce').fillna(0).astype(int)
+    items['line_total'] = pd.to_numeric(items['line_total'], errors='coerce').fillna(0.0)
+
+    frames = [
+        items.groupby(['day', 'product_id'], sort=False)
+        .agg(count=('qty', 'size'), qty=('qty', 'sum'), revenue=('line_total', 'sum'))
+        .reset_index().rename(columns={'product_id': 'key'})
+        .assign(kind='product')
+    ]
+    for kind, field in (('cashier', 'cashier_name'), ('customer', 'customer_name')):
+        frames.append(
+            sales.groupby(['day', field], sort=False).size().rename('count')
+            .reset_index().rename(columns={field: 'key'})
+            .assign(kind=kind, qty=0, revenue=0.0)
+        )
+    rollup = pd.concat(frames, ignore_index=True)
+    return rollup.sort_values('day', kind='stable')[ROLLUP_COLUMNS[:-1]].reset_index(drop=True)
+
+
+def fold_rollup(df):
+    """Sum delta rows into one row per (day, kind, key), keeping first-seen order"""
+    if df.empty:
+        return df.reindex(columns=ROLLUP_COLUMNS[:-1])
+    df = df.copy()
+    df['count'] = pd.to_numeric(df['count'], errors='coerce').fillna(0).astype(int)
+    df['qty'] = pd.to_numeric(df['qty'], errors='coerce').fillna(0).astype(int)
+    df['revenue'] = pd.to_numeric(df['revenue'], errors='coerce').fillna(0.0)
+    return (
+        df.groupby(['day', 'kind', 'key'], sort=False)[['count', 'qty', 'revenue']].sum()
+        .reset_index().sort_values('day', kind='stable').reset_index(drop=True)
+    )
+
+
+class SalesRollup:
+    """Daily rollup journal backed by data/daily_rollup.csv"""
+
+    def __init__(self, path=os.path.join("data", "daily_rollup.csv")):
+        self.path = path
+        self.exists = os.path.exists(path) and os.stat(path).st_size > 0
+        self.journal = SalesJournal(path, ROLLUP_COLUMNS)
+
+    def record(self, sale_record, items):
+        """Append one committed sale's contribution"""
+        self.journal.append_many(rollup_rows(sale_record, items))
+
+    def load(self, start_date=None, end_date=None):
+        """Folded rollup rows for days within [start_date, end_date]"""
+        df = self.journal.read_dataframe()
+        if start_date is not None:
+            df = df[df['day'] >= start_date.strftime("%Y-%m-%d")]
+        if end_date is not None:
+            df = df[df['day'] <= end_date.strftime("%Y-%m-%d")]
+        return fold_rollup(df)
+
+    def _write(self, df):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            df.reindex(columns=ROLLUP_COLUMNS).to_csv(f, index=False, lineterminator="\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.journal = SalesJournal(self.path, ROLLUP_COLUMNS)
+        self.exists = True
+
+    def compact(self):
+        """Fold per-sale delta rows into one row per key (start-up only)"""
+        df = self.journal.read_dataframe()
+        if df['sale_id'].notna().any() or self.journal.needs_compaction():
+            self._write(fold_rollup(df))
+
+    def rebuild(self, sales, items):
+        """Replace the rollup with one aggregated from full sales history"""
+        rollup = build_rollup(sales, items)
+        self._write(rollup)
+        print(f"[INFO] Rebuilt daily rollup: {len(rollup)} rows")
+        return len(rollup)
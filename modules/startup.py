@@ -0,0 +1,95 @@
+"""
+STARTUP
+Cold-start trace and background warm-up for the cashier program
+
+The welcome screen only needs PyQt6 and the translations. pandas, the
+storage layer and crash recovery are loaded by warm_up() on a background
+thread while the welcome screen is on screen; the first dialog that needs
+them simply waits for the import to finish.
+
+startup_trace records how long each phase took. It is printed at start-up
+when AKBAR_STARTUP_TRACE=1 (the total is always printed).
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupTrace:
+    """Named, timed start-up phases"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []   # (name, ms, thread name)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def add(self, name, ms):
+        with self._lock:
+            self.phases.append((name, ms, threading.current_thread().name))
+
+    def mark(self, name):
+        """Record the time elapsed since start-up as a milestone"""
+        self.add(name, (time.perf_counter() - self.started) * 1000)
+
+    def report(self, verbose=None):
+        if verbose is None:
+            verbose = os.environ.get("AKBAR_STARTUP_TRACE", "") not in ("", "0")
+        with self._lock:
+            phases = list(self.phases)
+        if verbose:
+            print("[INFO] Start-up trace (ms):")
+            for name, ms, thread in phases:
+                where = "" if thread == "MainThread" else f"  [{thread}]"
+                print(f"         {ms:9.1f}  {name}{where}")
+        shown = [ms for name, ms, _ in phases if name == "welcome screen shown"]
+        if shown:
+            print(f"[INFO] Welcome screen shown after {shown[0]:.0f} ms")
+
+
+# Created on import; main_prog_improved imports this module first
+startup_trace = StartupTrace()
+
+_warm_up_thread = None
+
+
+def _warm_up():
+    try:
+        with startup_trace.phase("import pandas"):
+            import pandas  # noqa: F401
+        with startup_trace.phase("import storage and catalog"):
+            from modules.storage import get_storage
+            import modules.catalog  # noqa: F401
+        with startup_trace.phase("storage recovery"):
+            # Finish any checkout interrupted by a crash before anything reads products
+            get_storage().recover()
+        with startup_trace.phase("import login and managers"):
+            import modules.employee_login  # noqa: F401
+            import modules.stock_manager  # noqa: F401
+            import modules.price_manager  # noqa: F401
+    except Exception as e:
+        print(f"[ERROR] Start-up warm-up failed: {e}", file=sys.stderr)
+
+
+def warm_up():
+    """Start loading pandas and the storage layer in the background"""
+    global _warm_up_thread
+    if _warm_up_thread is None:
+        _warm_up_thread = threading.Thread(target=_warm_up, name="warm-up", daemon=True)
+        _warm_up_thread.start()
+
+
+def wait_for_warm_up():
+    """Block until warm_up() has finished (no-op if it was never started)"""
+    if _warm_up_thread is not None:
+        _warm_up_thread.join()
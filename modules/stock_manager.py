@@ -1,207 +1,285 @@
 """
 STOCK MANAGER DIALOG
 Handles product stock updates with logging
+
+Stock levels are edited in place in one table (type a number in the Stock
+column). Edits wait in a pending-changes buffer, highlighted, until Save
+writes them all with one storage update; every changed product is still
+logged as its own stock update.
+
+Import Delivery adds a supplier delivery note (CSV with product_id and qty)
+to stock in one commit after a confirmation (modules.delivery_import).
 """
 
+import csv
 import os
+
 import pandas as pd
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QLabel, QInputDialog, QMessageBox, QScrollArea, QWidget
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox,
+    QStyledItemDelegate, QSpinBox, QAbstractItemView, QFileDialog
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QColor
 from modules.activity_logger import activity_logger
+from modules.catalog_view import is_low_stock
+from modules.delivery_import import TILL_RUNNING, read_delivery, apply_delivery
+from modules.product_grid import ProductGridModel, VALUE_COLUMN, create_grid_view
+from modules.storage import get_storage
+from modules.theme import apply_theme
+
+
+MAX_STOCK = 9999
+STOCK_COLUMN = VALUE_COLUMN
+
+LOW_STOCK_BACKGROUND = QColor("#fecaca")
+
+
+class StockTableModel(ProductGridModel):
+    """Product grid whose editable column is the stock level"""
+
+    HEADERS = ["Product ID", "Name", "Category", "Stock"]
+
+    def __init__(self, products, parent=None):
+        super().__init__(products, [int(s) for s in products['stock'].fillna(0)], parent)
+
+    def parse(self, value):
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        return value if 0 <= value <= MAX_STOCK else None
+
+    def row_background(self, row):
+        return LOW_STOCK_BACKGROUND if is_low_stock(self.values[row]) else None
+
+
+class StockDelegate(QStyledItemDelegate):
+    """Spin box editor limited to valid stock levels"""
+
+    def createEditor(self, parent, option, index):
+        editor = QSpinBox(parent)
+        editor.setRange(0, MAX_STOCK)
+        editor.setFont(QFont("Arial", 13, QFont.Weight.Bold))
+        return editor
 
 
 class StockManagerDialog(QDialog):
     """Dialog for updating product stock"""
-    
+
     def __init__(self, parent=None, employee_id="000", employee_name="Unknown"):
+        apply_theme()
         super().__init__(parent)
+        self.setObjectName("stockManager")
         self.setWindowTitle("Stock Manager")
         self.setGeometry(250, 150, 800, 600)
-        self.setStyleSheet("QDialog { background-color: #f8fafc; }")
-        
+
         self.employee_id = employee_id
         self.employee_name = employee_name
-        
+
         self.products = self.load_products()
         self.init_ui()
-    
+
     def load_products(self):
-        """Load products from CSV"""
-        data_path = os.path.join("data", "products.csv")
+        """Load products from storage"""
         try:
-            df = pd.read_csv(data_path)
-            return df
-        except:
+            return get_storage().load_products()
+        except Exception:
             return pd.DataFrame(columns=["product_id", "name", "category", "price", "stock"])
-    
-    def save_products(self):
-        """Save products to CSV"""
-        data_path = os.path.join("data", "products.csv")
-        self.products.to_csv(data_path, index=False)
-    
+
     def init_ui(self):
         """Initialize stock manager UI"""
         layout = QVBoxLayout()
         self.setLayout(layout)
-        
+
         # Title
         title = QLabel("📦 Stock Management")
+        title.setObjectName("managerTitle")
         title.setFont(QFont("Arial", 24, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            color: #1e40af;
-            background-color: #dbeafe;
-            padding: 15px;
-            border-radius: 10px;
-            margin: 10px;
-        """)
         layout.addWidget(title)
-        
+
         # Show logged in user
         user_info = QLabel(f"👤 Logged in as: {self.employee_name} ({self.employee_id})")
+        user_info.setObjectName("managerUser")
         user_info.setFont(QFont("Arial", 12))
         user_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        user_info.setStyleSheet("color: #64748b; margin: 5px;")
         layout.addWidget(user_info)
-        
+
         # Instructions
-        instructions = QLabel("Click on a product to update its stock level:")
+        instructions = QLabel("Type the new stock level in the Stock column, then press Save:")
+        instructions.setObjectName("managerHint")
         instructions.setFont(QFont("Arial", 14))
-        instructions.setStyleSheet("color: #475569; margin: 10px;")
         layout.addWidget(instructions)
-        
-        # Scroll area for products
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
-        
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout()
-        scroll_widget.setLayout(scroll_layout)
-        scroll.setWidget(scroll_widget)
-        
-        # Create product buttons
-        for idx, row in self.products.iterrows():
-            product_widget = QWidget()
-            product_widget.setMinimumHeight(70)
-            product_widget.setMaximumHeight(70)
-            
-            # Determine color based on stock
-            if int(row['stock']) <= 5:
-                bg_color = "#fecaca"  # Light red
-                border_color = "#ef4444"
-            else:
-                bg_color = "#ffffff"
-                border_color = "#cbd5e1"
-            
-            product_widget.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {bg_color};
-                    border: 2px solid {border_color};
-                    border-radius: 8px;
-                    padding: 10px;
-                    margin: 5px;
-                }}
-                QWidget:hover {{
-                    border: 2px solid #3b82f6;
-                }}
-            """)
-            
-            h_layout = QHBoxLayout()
-            h_layout.setContentsMargins(10, 5, 10, 5)
-            product_widget.setLayout(h_layout)
-            
-            # Product info - ALL IN ONE LINE
-            info_label = QLabel(f"🏷️ {row['product_id']} - {row['name']}  |  📊 Stock: {int(row['stock'])}")
-            info_label.setFont(QFont("Arial", 13))
-            info_label.setStyleSheet("color: #1e293b;")
-            info_label.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-            h_layout.addWidget(info_label, 1)
-            
-            # Update button
-            update_btn = QPushButton("Update Stock")
-            update_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-            update_btn.setMinimumSize(QSize(140, 45))
-            update_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3b82f6;
-                    color: white;
-                    border-radius: 8px;
-                    padding: 10px 15px;
-                }
-                QPushButton:hover {
-                    background-color: #2563eb;
-                }
-            """)
-            update_btn.clicked.connect(lambda _, i=idx: self.update_stock(i))
-            h_layout.addWidget(update_btn)
-            
-            scroll_layout.addWidget(product_widget)
-        
-        layout.addWidget(scroll)
-        
+
+        # One table for all products; only the visible rows are painted
+        self.model = StockTableModel(self.products, self)
+        self.search_input, self.proxy, self.table = create_grid_view(self.model, StockDelegate())
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        layout.addWidget(self.search_input)
+        layout.addWidget(self.table, 1)
+
+        self.pending_label = QLabel()
+        self.pending_label.setObjectName("pendingStatus")
+        self.pending_label.setFont(QFont("Arial", 13, QFont.Weight.Bold))
+        layout.addWidget(self.pending_label)
+        self.model.pending_changed.connect(self.update_pending)
+
+        buttons_layout = QHBoxLayout()
+        import_btn = QPushButton("📄 Import Delivery...")
+        import_btn.setObjectName("importButton")
+        import_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        import_btn.setMinimumHeight(50)
+        import_btn.clicked.connect(self.import_delivery)
+        buttons_layout.addWidget(import_btn)
+
+        self.save_btn = QPushButton("💾 Save Changes")
+        self.save_btn.setObjectName("saveButton")
+        self.save_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.save_btn.setMinimumHeight(50)
+        self.save_btn.clicked.connect(self.save_changes)
+        buttons_layout.addWidget(self.save_btn)
+
+        self.discard_btn = QPushButton("↩️ Discard")
+        self.discard_btn.setObjectName("discardButton")
+        self.discard_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.discard_btn.setMinimumHeight(50)
+        self.discard_btn.clicked.connect(self.model.discard)
+        buttons_layout.addWidget(self.discard_btn)
+
         # Close button
         close_btn = QPushButton("✅ Done")
+        close_btn.setObjectName("doneButton")
         close_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
         close_btn.setMinimumHeight(50)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10b981;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-        """)
         close_btn.clicked.connect(self.close)
-        layout.addWidget(close_btn)
-    
-    def update_stock(self, index):
-        """Update stock for a specific product"""
-        product = self.products.iloc[index]
-        current_stock = int(product['stock'])
-        
-        new_stock, ok = QInputDialog.getInt(
-            self,
-            "Update Stock",
-            f"Product: {product['name']}\n"
-            f"Current Stock: {current_stock}\n\n"
-            f"Enter new stock level:",
-            value=current_stock,
-            min=0,
-            max=9999
-        )
-        
-        if ok and new_stock != current_stock:
-            # Update stock
-            self.products.at[index, 'stock'] = new_stock
-            self.save_products()
-            
-            # Log the stock update
+        buttons_layout.addWidget(close_btn)
+        layout.addLayout(buttons_layout)
+
+        # Enter belongs to the grid editor and the filter box, never to a button
+        for button in self.findChildren(QPushButton):
+            button.setAutoDefault(False)
+        self.update_pending(0)
+        if self.model.rowCount():
+            self.table.setCurrentIndex(self.proxy.index(0, STOCK_COLUMN))
+        self.table.setFocus()
+
+    def update_pending(self, count):
+        """Show how many edits are waiting to be saved"""
+        self.pending_label.setText(f"✏️ {count} unsaved change(s)" if count else "No unsaved changes")
+        self.save_btn.setEnabled(count > 0)
+        self.discard_btn.setEnabled(count > 0)
+
+    def save_changes(self):
+        """Write every pending edit with one storage update and log each product"""
+        changes = self.model.pending_changes()
+        if not changes:
+            return True
+
+        storage = get_storage()
+        if storage.till_running():
+            # The grid does not show the till's unsaved sales; its next checkpoint
+            # would subtract them again from the counts entered here
+            QMessageBox.warning(self, "Stock Not Saved", f"❌ {TILL_RUNNING}.")
+            return False
+        try:
+            applied = storage.update_products(
+                {pid: {'stock': new_stock} for _, pid, _, _, new_stock in changes}
+            )
+        except Exception as e:
+            print(f"[ERROR] Failed to save stock changes: {e}")
+            QMessageBox.critical(self, "Stock Not Saved", f"❌ Could not save the stock changes:\n\n{e}")
+            return False
+
+        saved = [change for change in changes if change[1] in applied]
+        for _, pid, name, old_stock, new_stock in saved:
             activity_logger.log_stock_update(
                 self.employee_id,
                 self.employee_name,
-                product['product_id'],
-                product['name'],
-                current_stock,
+                pid,
+                name,
+                old_stock,
                 new_stock
             )
-            
+        self.model.mark_saved([row for row, *_ in saved])
+
+        QMessageBox.information(
+            self,
+            "Stock Updated",
+            f"✅ {len(saved)} stock level(s) updated.\n\n"
+            f"Changes have been logged."
+        )
+        return True
+
+    def import_delivery(self):
+        """Add a supplier delivery note to stock after showing what it contains"""
+        if self.model.pending:
             QMessageBox.information(
+                self, "Unsaved Changes",
+                "Save or discard the unsaved stock changes before importing a delivery."
+            )
+            return
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Delivery Note", "", "CSV files (*.csv);;All files (*)"
+        )
+        if not path:
+            return
+
+        storage = get_storage()
+        if storage.till_running():
+            QMessageBox.warning(self, "Delivery Note", f"❌ {TILL_RUNNING}.")
+            return
+        try:
+            plan = read_delivery(path, storage.load_products())
+        except (OSError, ValueError, csv.Error) as e:
+            print(f"[ERROR] Failed to read delivery note: {e}")
+            QMessageBox.warning(self, "Delivery Note", f"❌ Could not read {os.path.basename(path)}:\n\n{e}")
+            return
+
+        text = f"📄 {os.path.basename(path)}: {plan.summary()}."
+        if plan.rejected:
+            text += f"\n\nRejected lines are listed in:\n{plan.report_path}"
+        if not len(plan):
+            QMessageBox.warning(self, "Delivery Note", text + "\n\nNothing to add to stock.")
+            return
+        answer = QMessageBox.question(
+            self, "Import Delivery", text + "\n\nAdd these units to stock?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+
+        try:
+            new_stock = apply_delivery(storage, plan, self.employee_id, self.employee_name)
+        except Exception as e:
+            print(f"[ERROR] Failed to import delivery: {e}")
+            QMessageBox.critical(self, "Stock Not Saved", f"❌ Could not add the delivery to stock:\n\n{e}")
+            return
+        self.model.update_values({
+            self.model.row_of[pid]: stock for pid, stock in new_stock.items() if pid in self.model.row_of
+        })
+        QMessageBox.information(
+            self,
+            "Stock Updated",
+            f"✅ {len(new_stock)} stock level(s) updated from the delivery.\n\n"
+            f"The delivery has been logged."
+        )
+
+    def done(self, result):
+        """Ask before closing with unsaved edits (Done, Escape and the window button)"""
+        if self.model.pending:
+            answer = QMessageBox.question(
                 self,
-                "Stock Updated",
-                f"✅ {product['name']}\n"
-                f"Stock updated: {current_stock} → {new_stock}\n\n"
-                f"Change has been logged."
+                "Unsaved Changes",
+                f"You have {len(self.model.pending)} unsaved stock change(s).\n\nSave them now?",
+                QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard
+                | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Save
             )
-            
-            # Refresh the dialog
-            self.close()
-            new_dialog = StockManagerDialog(self.parent(), self.employee_id, self.employee_name)
-            new_dialog.exec()
+            if answer == QMessageBox.StandardButton.Cancel:
+                return
+            if answer == QMessageBox.StandardButton.Save and not self.save_changes():
+                return
+            self.model.discard()
+        super().done(result)
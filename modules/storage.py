@@ -0,0 +1,793 @@
+"""
+STORAGE LAYER
+Single access point for products, sales (with line items) and users
+
+Two interchangeable backends:
+- CsvStorage:    data/products.csv, data/sales.csv, data/sale_items.csv,
+                 data/daily_rollup.csv, data/users.csv (default)
+- SqliteStorage: data/akbar_jaya.db in WAL mode with indexed tables, so
+                 point lookups and single-row writes stay fast regardless
+                 of history size and two tills can share one database file
+
+The backend is picked by the AKBAR_STORAGE environment variable
+("csv" or "sqlite"); without it SQLite is used once the database exists.
+
+Command line:
+    python -m modules.storage import           # one-shot CSV -> SQLite import
+    python -m modules.storage export           # SQLite -> CSV export
+    python -m modules.storage rebuild-rollup   # backfill the daily report rollup
+"""
+
+import csv
+import os
+import sqlite3
+import sys
+import threading
+import pandas as pd
+
+from modules.catalog import PRODUCT_COLUMNS
+from modules.sales_journal import (
+    SalesJournal, SALES_COLUMNS, SALE_ITEM_COLUMNS, ISO_DATETIME, parse_sale_datetimes
+)
+from modules.sales_rollup import SalesRollup, build_rollup, rollup_rows
+from modules.transaction_log import CheckoutTransactionLog, new_sale_id
+
+
+DATA_DIR = "data"
+DB_FILENAME = "akbar_jaya.db"
+USER_COLUMNS = ["employee_id", "name", "role", "date_registered", "active"]
+# products.csv may also carry a barcode column (EAN/UPC, kept as text)
+TABLE_PRODUCT_COLUMNS = PRODUCT_COLUMNS + ["barcode"]
+
+SAMPLE_PRODUCTS = """product_id,name,category,price,stock
+AJ001,Milo 3-in-1,Drink,1.80,25
+AJ002,Maggi Curry,Food,3.50,40
+AJ003,Sprite Can,Drink,1.60,30
+AJ004,Rice 5kg,Food,13.50,10
+AJ005,Battery AA,Electronics,2.00,15
+"""
+
+
+def _atomic_to_csv(df, path):
+    """Write a DataFrame to CSV through a temp file + rename"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        df.to_csv(f, index=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def legacy_sale_items(products, prices):
+    """
+    Turn a legacy comma-joined 'products' string ("AJ001,AJ001,AJ002") into
+    line items. The price at the time of sale was never recorded, so the
+    given (current) prices are the best available; unknown products get 0.
+    """
+    counts = {}
+    for pid in str(products).split(','):
+        pid = pid.strip()
+        if pid:
+            counts[pid] = counts.get(pid, 0) + 1
+    items = []
+    for pid, qty in counts.items():
+        price = float(prices.get(pid, 0.0))
+        items.append({
+            'product_id': pid,
+            'qty': qty,
+            'unit_price_at_sale': price,
+            'line_total': round(price * qty, 2),
+        })
+    return items
+
+
+def _clean(value):
+    """NaN -> None, everything else to str"""
+    return None if pd.isna(value) else str(value)
+
+
+def _filter_sales_by_date(df, start_date=None, end_date=None):
+    """Keep sales whose datetime falls within [start_date, end_date]"""
+    if df.empty or (start_date is None and end_date is None):
+        return df
+    dates = parse_sale_datetimes(df['datetime']).dt.date
+    mask = dates.notna()
+    if start_date is not None:
+        mask &= dates >= start_date
+    if end_date is not None:
+        mask &= dates <= end_date
+    return df.loc[mask]
+
+
+class CsvStorage:
+    """Storage backed by the CSV files in data/"""
+
+    name = "csv"
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
+        os.makedirs(data_dir, exist_ok=True)
+        self.products_path = os.path.join(data_dir, "products.csv")
+        self.sales_path = os.path.join(data_dir, "sales.csv")
+        self.items_path = os.path.join(data_dir, "sale_items.csv")
+        self.rollup_path = os.path.join(data_dir, "daily_rollup.csv")
+        self.users_path = os.path.join(data_dir, "users.csv")
+        self._open_journals()
+
+    def _open_journals(self):
+        self.sales_journal = SalesJournal(self.sales_path, SALES_COLUMNS)
+        self.items_journal = SalesJournal(self.items_path, SALE_ITEM_COLUMNS)
+        self.rollup = SalesRollup(self.rollup_path)
+        self.transaction_log = CheckoutTransactionLog(
+            self.sales_journal, self.items_journal, self.products_path,
+            wal_path=os.path.join(self.data_dir, "checkout.wal"), rollup=self.rollup
+        )
+
+    def recover(self):
+        """
+        Replay interrupted checkouts, tidy the journals and migrate old sales (start-up only)
+
+        Skipped while another process holds the till lock: its WAL and
+        journals are in use and its own checkpoints keep them consistent.
+        """
+        log = self.transaction_log
+        held = log.holding()
+        if not log.acquire():
+            print("[INFO] Another till is using the data files; crash recovery skipped")
+            return
+        try:
+            self._recover()
+        finally:
+            if not held:
+                log.release()
+
+    def _recover(self):
+        rollup_missing = not self.rollup.exists
+        self.transaction_log.replay()
+        self.sales_journal.maybe_compact()
+        self.items_journal.maybe_compact()
+        if 'products' in self.sales_journal.columns:
+            self._migrate_product_strings()
+        if rollup_missing:
+            self.rebuild_rollup()
+        else:
+            self.rollup.compact()
+
+    def _migrate_product_strings(self):
+        """
+        One-time migration of comma-joined 'products' sales into sale_items.csv
+        Each step is idempotent, so an interrupted migration simply resumes.
+        """
+        with open(self.sales_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = [row + [""] * (len(header) - len(row)) for row in reader]
+        col = {name: i for i, name in enumerate(header)}
+
+        # 1) Every sale needs an id before items can reference it
+        if any(not row[col['sale_id']] for row in rows):
+            for row in rows:
+                if not row[col['sale_id']]:
+                    row[col['sale_id']] = new_sale_id()
+            self._write_sales_rows(header, rows)
+
+        # 2) Line items for sales that do not have any yet
+        existing = self.items_journal.read_dataframe()
+        totals = existing.groupby('sale_id')['line_total'].sum().to_dict() if not existing.empty else {}
+        products = self.load_products()
+        prices = dict(zip(products['product_id'].astype(str),
+                          pd.to_numeric(products['price'], errors='coerce').fillna(0.0)))
+        new_items = []
+        for row in rows:
+            sale_id = row[col['sale_id']]
+            if sale_id in totals:
+                continue
+            items = legacy_sale_items(row[col['products']], prices)
+            totals[sale_id] = sum(item['line_total'] for item in items)
+            new_items.extend(dict(item, sale_id=sale_id) for item in items)
+        self.items_journal.append_many(new_items)
+
+        # 3) Drop the products column and fill in sale totals
+        for row in rows:
+            if not row[col['total']]:
+                row[col['total']] = f"{totals.get(row[col['sale_id']], 0.0):.2f}"
+        keep = [i for i, name in enumerate(header) if name != 'products']
+        self._write_sales_rows([header[i] for i in keep], [[row[i] for i in keep] for row in rows])
+
+        self._open_journals()
+        print(f"[INFO] Migrated {len(rows)} sales to line items ({len(new_items)} new item rows)")
+
+    def _write_sales_rows(self, header, rows):
+        tmp_path = self.sales_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(header)
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.sales_path)
+
+    # ----- products -----
+
+    def load_products(self):
+        if not os.path.exists(self.products_path) or os.stat(self.products_path).st_size == 0:
+            with open(self.products_path, "w", encoding="utf-8") as f:
+                f.write(SAMPLE_PRODUCTS)
+        try:
+            # Read barcodes as text so they are not turned into floats ("...931.0")
+            return pd.read_csv(self.products_path, dtype={'barcode': str})
+        except Exception as e:
+            print(f"[ERROR] Failed to load products.csv: {e}")
+            return pd.DataFrame(columns=PRODUCT_COLUMNS)
+
+    def save_products(self, df):
+        _atomic_to_csv(df, self.products_path)
+
+    def update_product(self, product_id, **fields):
+        """Change fields (e.g. stock=10, price=2.5) of one product"""
+        df = self.load_products()
+        mask = df['product_id'].astype(str) == str(product_id)
+        for field, value in fields.items():
+            df.loc[mask, field] = value
+        self.save_products(df)
+
+    def update_products(self, changes):
+        """
+        Apply {product_id: {field: value}} for many products with one
+        products.csv write; unknown product ids are ignored
+        """
+        df = self.load_products()
+        row_of = {pid: i for i, pid in enumerate(df['product_id'].astype(str))}
+        columns = {}  # field -> (row labels, values)
+        applied = {}
+        for product_id, fields in changes.items():
+            row = row_of.get(str(product_id))
+            if row is None:
+                continue
+            for field, value in fields.items():
+                rows, values = columns.setdefault(field, ([], []))
+                rows.append(df.index[row])
+                values.append(value)
+            applied[product_id] = fields
+        if not applied:
+            return applied
+        for field, (rows, values) in columns.items():
+            df.loc[rows, field] = values
+        self.save_products(df)
+        return applied
+
+    def adjust_stock(self, deltas):
+        """
+        Add {product_id: delta} to the stock levels with one products.csv
+        write; returns {product_id: new stock}, unknown product ids are ignored
+        """
+        df = self.load_products()
+        ids = df['product_id'].astype(str)
+        delta = ids.map({str(pid): int(d) for pid, d in deltas.items()})
+        hit = delta.notna()
+        if not hit.any():
+            return {}
+        stock = pd.to_numeric(df['stock'], errors='coerce').fillna(0).astype(int)
+        df['stock'] = stock.where(~hit, stock + delta.fillna(0).astype(int))
+        self.save_products(df)
+        new_stock = dict(zip(ids[hit], df.loc[hit, 'stock'].astype(int).tolist()))
+        return new_stock
+
+    # ----- sales -----
+
+    def has_sales(self):
+        return os.path.exists(self.sales_path) and os.stat(self.sales_path).st_size > 0
+
+    def load_sales(self, start_date=None, end_date=None):
+        return _filter_sales_by_date(self.sales_journal.read_dataframe(), start_date, end_date)
+
+    def load_sale_items(self, start_date=None, end_date=None):
+        """Line items joined with their sale's datetime, customer and cashier"""
+        sales = self.load_sales(start_date, end_date)
+        items = self.items_journal.read_dataframe()
+        return items.merge(
+            sales[['sale_id', 'datetime', 'customer_name', 'cashier_name']],
+            on='sale_id', how='inner'
+        )
+
+    def load_rollup(self, start_date=None, end_date=None):
+        """Daily rollup rows (day, kind, key, count, qty, revenue) for the date range"""
+        return self.rollup.load(start_date, end_date)
+
+    def rebuild_rollup(self):
+        """Backfill the daily rollup from sales.csv and sale_items.csv"""
+        return self.rollup.rebuild(self.sales_journal.read_dataframe(),
+                                   self.items_journal.read_dataframe())
+
+    def append_history(self, sales, items):
+        """
+        Bulk-append past sales and their line items (DataFrames) with their
+        rollup rows, e.g. from the data generator. Stock is not touched.
+        """
+        self.items_journal.append_frame(items)
+        self.sales_journal.append_frame(sales)
+        self.rollup.journal.append_frame(build_rollup(sales, items))
+        self.rollup.exists = True
+
+    def commit_sale(self, deltas, sale_record, items=()):
+        """Commit stock deltas, the sales record and its items together; returns sale_id"""
+        return self.transaction_log.commit(deltas, sale_record, items)
+
+    def checkpoint(self):
+        """Add the stock changes of sales logged since the last checkpoint to products.csv"""
+        self.transaction_log.checkpoint()
+
+    def acquire_till(self):
+        """Claim the checkout WAL for this till; False when another till already has it"""
+        return self.transaction_log.acquire()
+
+    def release_till(self):
+        self.transaction_log.release()
+
+    def till_running(self):
+        """True while a till uses these files, or left sales not yet in products.csv"""
+        return self.transaction_log.in_use()
+
+    # ----- users -----
+
+    def load_users(self):
+        if not os.path.exists(self.users_path) or os.stat(self.users_path).st_size == 0:
+            return pd.DataFrame(columns=USER_COLUMNS)
+        try:
+            return pd.read_csv(self.users_path, dtype={'employee_id': str})
+        except Exception as e:
+            print(f"[ERROR] Failed to load users.csv: {e}")
+            return pd.DataFrame(columns=USER_COLUMNS)
+
+    def add_user(self, user):
+        users = pd.concat([self.load_users(), pd.DataFrame([user])], ignore_index=True)
+        _atomic_to_csv(users, self.users_path)
+
+
+class SqliteStorage:
+    """Storage backed by an SQLite database in WAL mode"""
+
+    name = "sqlite"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS products (
+            product_id TEXT PRIMARY KEY,
+            name       TEXT NOT NULL DEFAULT '',
+            category   TEXT NOT NULL DEFAULT '',
+            price      REAL NOT NULL DEFAULT 0,
+            stock      INTEGER NOT NULL DEFAULT 0,
+            barcode    TEXT
+        );
+        CREATE TABLE IF NOT EXISTS sales (
+            sale_id       TEXT PRIMARY KEY,
+            datetime      TEXT NOT NULL,
+            customer_name TEXT,
+            cashier_name  TEXT,
+            employee_id   TEXT,
+            total         REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_sales_datetime ON sales(datetime);
+        CREATE TABLE IF NOT EXISTS sale_items (
+            sale_id            TEXT NOT NULL,
+            product_id         TEXT NOT NULL,
+            qty                INTEGER NOT NULL,
+            unit_price_at_sale REAL NOT NULL,
+            line_total         REAL NOT NULL,
+            PRIMARY KEY (sale_id, product_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_sale_items_product ON sale_items(product_id);
+        CREATE TABLE IF NOT EXISTS daily_rollup (
+            day     TEXT NOT NULL,
+            kind    TEXT NOT NULL,
+            key     TEXT NOT NULL,
+            count   INTEGER NOT NULL DEFAULT 0,
+            qty     INTEGER NOT NULL DEFAULT 0,
+            revenue REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, kind, key)
+        );
+        CREATE TABLE IF NOT EXISTS users (
+            employee_id     TEXT PRIMARY KEY,
+            name            TEXT NOT NULL,
+            role            TEXT NOT NULL,
+            date_registered TEXT,
+            active          INTEGER NOT NULL DEFAULT 1
+        );
+    """
+
+    # Fixed SQL text so sqlite3's statement cache reuses the compiled statements
+    SQL_ADJUST_STOCK = "UPDATE products SET stock = stock + ? WHERE product_id = ?"
+    SQL_INSERT_SALE = (
+        "INSERT INTO sales (sale_id, datetime, customer_name, cashier_name, employee_id, total) "
+        "VALUES (:sale_id, :datetime, :customer_name, :cashier_name, :employee_id, :total)"
+    )
+    SQL_INSERT_ITEM = (
+        "INSERT INTO sale_items (sale_id, product_id, qty, unit_price_at_sale, line_total) "
+        "VALUES (:sale_id, :product_id, :qty, :unit_price_at_sale, :line_total)"
+    )
+    SQL_UPSERT_ROLLUP = (
+        "INSERT INTO daily_rollup (day, kind, key, count, qty, revenue) "
+        "VALUES (:day, :kind, :key, :count, :qty, :revenue) "
+        "ON CONFLICT(day, kind, key) DO UPDATE SET count = count + excluded.count, "
+        "qty = qty + excluded.qty, revenue = revenue + excluded.revenue"
+    )
+    SQL_INSERT_USER = (
+        "INSERT OR REPLACE INTO users (employee_id, name, role, date_registered, active) "
+        "VALUES (:employee_id, :name, :role, :date_registered, :active)"
+    )
+    SQL_UPSERT_PRODUCT = (
+        "INSERT INTO products (product_id, name, category, price, stock, barcode) "
+        "VALUES (:product_id, :name, :category, :price, :stock, :barcode) "
+        "ON CONFLICT(product_id) DO UPDATE SET name = excluded.name, "
+        "category = excluded.category, price = excluded.price, stock = excluded.stock, "
+        "barcode = excluded.barcode"
+    )
+
+    def __init__(self, db_path=os.path.join(DATA_DIR, DB_FILENAME)):
+        self.db_path = db_path
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, timeout=10, isolation_level=None,
+                                    check_same_thread=False, cached_statements=64)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=10000")
+        self.conn.executescript(self.SCHEMA)
+        self._upgrade_schema()
+        if self.has_sales() and self.conn.execute("SELECT 1 FROM daily_rollup LIMIT 1").fetchone() is None:
+            self.rebuild_rollup()
+
+    def _upgrade_schema(self):
+        """Migrate databases created without products.barcode or with the comma-joined sales.products column"""
+        product_columns = {row[1] for row in self.conn.execute("PRAGMA table_info(products)")}
+        if 'barcode' not in product_columns:
+            self.conn.execute("ALTER TABLE products ADD COLUMN barcode TEXT")
+
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(sales)")}
+        if 'total' not in columns:
+            self.conn.execute("ALTER TABLE sales ADD COLUMN total REAL")
+        if 'products' not in columns:
+            return
+
+        legacy = self.conn.execute(
+            "SELECT sale_id, products FROM sales WHERE products != '' "
+            "AND sale_id NOT IN (SELECT sale_id FROM sale_items)"
+        ).fetchall()
+        if not legacy:
+            return
+        prices = dict(self.conn.execute("SELECT product_id, price FROM products").fetchall())
+        items, totals = [], []
+        for sale_id, products in legacy:
+            sale_items = legacy_sale_items(products, prices)
+            items.extend(dict(item, sale_id=sale_id) for item in sale_items)
+            totals.append((round(sum(i['line_total'] for i in sale_items), 2), sale_id))
+        self._write([
+            (self.SQL_INSERT_ITEM, items, True),
+            ("UPDATE sales SET products = '', total = ? WHERE sale_id = ?", totals, True),
+        ])
+        print(f"[INFO] Migrated {len(legacy)} sales to line items")
+
+    def recover(self):
+        """SQLite recovers its own WAL on open; nothing to replay"""
+        return 0
+
+    def _query_df(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def _write(self, statements):
+        """
+        Run (sql, params, many) statements in one IMMEDIATE transaction
+        IMMEDIATE takes the write lock up front so two tills never interleave a sale
+        """
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params, many in statements:
+                    if many:
+                        cur.executemany(sql, params)
+                    else:
+                        cur.execute(sql, params)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _date_range(column, start_date, end_date):
+        """WHERE clause and params for an ISO datetime column"""
+        clauses, params = [], []
+        if start_date is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(start_date.strftime("%Y-%m-%d"))
+        if end_date is not None:
+            clauses.append(f"{column} < date(?, '+1 day')")
+            params.append(end_date.strftime("%Y-%m-%d"))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    # ----- products -----
+
+    def load_products(self):
+        return self._query_df(
+            "SELECT product_id, name, category, price, stock, barcode FROM products ORDER BY rowid"
+        )
+
+    def get_product(self, product_id):
+        """Point lookup by primary key; returns a dict or None"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT product_id, name, category, price, stock, barcode FROM products WHERE product_id = ?",
+                (product_id,)
+            ).fetchone()
+        return dict(zip(TABLE_PRODUCT_COLUMNS, row)) if row else None
+
+    def save_products(self, df):
+        records = df.reindex(columns=TABLE_PRODUCT_COLUMNS).to_dict("records")
+        for record in records:
+            record['barcode'] = _clean(record['barcode'])
+        self._write([(self.SQL_UPSERT_PRODUCT, records, True)])
+
+    def update_product(self, product_id, **fields):
+        """Change fields (e.g. stock=10, price=2.5) of one product"""
+        allowed = [f for f in fields if f in PRODUCT_COLUMNS and f != 'product_id']
+        if not allowed:
+            return
+        assignments = ", ".join(f"{f} = ?" for f in allowed)
+        params = [fields[f] for f in allowed] + [product_id]
+        self._write([(f"UPDATE products SET {assignments} WHERE product_id = ?", params, False)])
+
+    def update_products(self, changes):
+        """
+        Apply {product_id: {field: value}} for many products in one
+        transaction; unknown product ids are ignored
+        """
+        with self._lock:
+            known = {row[0] for row in self.conn.execute("SELECT product_id FROM products")}
+        applied, by_fields = {}, {}
+        for product_id, fields in changes.items():
+            allowed = tuple(f for f in fields if f in PRODUCT_COLUMNS and f != 'product_id')
+            if not allowed or str(product_id) not in known:
+                continue
+            by_fields.setdefault(allowed, []).append([fields[f] for f in allowed] + [str(product_id)])
+            applied[product_id] = {f: fields[f] for f in allowed}
+        if not applied:
+            return applied
+        self._write([
+            (f"UPDATE products SET {', '.join(f'{f} = ?' for f in allowed)} WHERE product_id = ?", params, True)
+            for allowed, params in by_fields.items()
+        ])
+        return applied
+
+    def adjust_stock(self, deltas):
+        """
+        Add {product_id: delta} to the stock levels in one transaction;
+        returns {product_id: new stock}, unknown product ids are ignored
+        """
+        with self._lock:
+            known = {row[0] for row in self.conn.execute("SELECT product_id FROM products")}
+        params = [(int(delta), str(pid)) for pid, delta in deltas.items() if str(pid) in known]
+        if not params:
+            return {}
+        self._write([(self.SQL_ADJUST_STOCK, params, True)])
+        with self._lock:
+            stock = dict(self.conn.execute("SELECT product_id, stock FROM products"))
+        new_stock = {pid: stock[pid] for _, pid in params}
+        return new_stock
+
+    # ----- sales -----
+
+    def has_sales(self):
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM sales LIMIT 1").fetchone() is not None
+
+    def load_sales(self, start_date=None, end_date=None):
+        where, params = self._date_range("datetime", start_date, end_date)
+        return self._query_df(
+            "SELECT datetime, customer_name, cashier_name, employee_id, sale_id, total "
+            "FROM sales" + where + " ORDER BY datetime", params
+        )
+
+    def load_sale_items(self, start_date=None, end_date=None):
+        """Line items joined with their sale's datetime, customer and cashier"""
+        where, params = self._date_range("s.datetime", start_date, end_date)
+        return self._query_df(
+            "SELECT i.sale_id, i.product_id, i.qty, i.unit_price_at_sale, i.line_total, "
+            "s.datetime, s.customer_name, s.cashier_name "
+            "FROM sale_items i JOIN sales s ON s.sale_id = i.sale_id" + where +
+            " ORDER BY s.datetime", params
+        )
+
+    def load_rollup(self, start_date=None, end_date=None):
+        """Daily rollup rows (day, kind, key, count, qty, revenue) for the date range"""
+        clauses, params = [], []
+        if start_date is not None:
+            clauses.append("day >= ?")
+            params.append(start_date.strftime("%Y-%m-%d"))
+        if end_date is not None:
+            clauses.append("day <= ?")
+            params.append(end_date.strftime("%Y-%m-%d"))
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        # rowid keeps the order in which keys first appeared each day
+        return self._query_df(
+            "SELECT day, kind, key, count, qty, revenue FROM daily_rollup" + where +
+            " ORDER BY day, rowid", params
+        )
+
+    def rebuild_rollup(self):
+        """Backfill the daily rollup from the sales and sale_items tables"""
+        rollup = build_rollup(self.load_sales(), self.load_sale_items())
+        self._write([
+            ("DELETE FROM daily_rollup", (), False),
+            (self.SQL_UPSERT_ROLLUP, rollup.to_dict("records"), True),
+        ])
+        print(f"[INFO] Rebuilt daily rollup: {len(rollup)} rows")
+        return len(rollup)
+
+    def append_history(self, sales, items):
+        """Bulk-append past sales and line items (DataFrames) and their rollup in one transaction"""
+        self._write([
+            (self.SQL_INSERT_SALE, sales.reindex(columns=SALES_COLUMNS).to_dict("records"), True),
+            (self.SQL_INSERT_ITEM, items.reindex(columns=SALE_ITEM_COLUMNS).to_dict("records"), True),
+            (self.SQL_UPSERT_ROLLUP, build_rollup(sales, items).to_dict("records"), True),
+        ])
+
+    def commit_sale(self, deltas, sale_record, items=()):
+        """Commit stock deltas, the sales record, its items and the rollup in one SQLite transaction"""
+        sale_id = sale_record.setdefault('sale_id', new_sale_id())
+        record = {col: sale_record.get(col) for col in SALES_COLUMNS}
+        record['employee_id'] = None if record['employee_id'] is None else str(record['employee_id'])
+        items = [dict(item, sale_id=sale_id) for item in items]
+        self._write([
+            (self.SQL_ADJUST_STOCK, [(delta, pid) for pid, delta in deltas.items()], True),
+            (self.SQL_INSERT_SALE, record, False),
+            (self.SQL_INSERT_ITEM, items, True),
+            (self.SQL_UPSERT_ROLLUP, rollup_rows(sale_record, items), True),
+        ])
+        return sale_id
+
+    def checkpoint(self):
+        """Stock is already durable in the database"""
+        return None
+
+    def acquire_till(self):
+        """Any number of tills can share the database"""
+        return True
+
+    def release_till(self):
+        return None
+
+    def till_running(self):
+        """SQLite serializes writers, so other tools never need to wait for a till"""
+        return False
+
+    # ----- users -----
+
+    def load_users(self):
+        df = self._query_df(
+            "SELECT employee_id, name, role, date_registered, active FROM users ORDER BY rowid"
+        )
+        df['active'] = df['active'].astype(bool)
+        return df
+
+    def add_user(self, user):
+        record = {col: user.get(col) for col in USER_COLUMNS}
+        record['employee_id'] = str(record['employee_id'])
+        record['active'] = 1 if record.get('active', True) else 0
+        self._write([(self.SQL_INSERT_USER, record, False)])
+
+    # ----- CSV import / export -----
+
+    def import_csv(self, data_dir=DATA_DIR):
+        """One-shot import of products.csv, users.csv, sales.csv and sale_items.csv"""
+        csv_store = CsvStorage(data_dir)
+        csv_store.recover()  # also migrates legacy 'products' strings to line items
+
+        products = csv_store.load_products()
+        products['product_id'] = products['product_id'].astype(str)
+        products['price'] = pd.to_numeric(products['price'], errors='coerce').fillna(0.0)
+        products['stock'] = pd.to_numeric(products['stock'], errors='coerce').fillna(0).astype(int)
+        for col in ('name', 'category'):
+            products[col] = products[col].fillna("").astype(str)
+        products = products.reindex(columns=TABLE_PRODUCT_COLUMNS)
+        products['barcode'] = [_clean(code) for code in products['barcode']]
+
+        users = csv_store.load_users()
+        user_records = []
+        for user in users.to_dict("records"):
+            user_records.append({
+                'employee_id': str(user['employee_id']),
+                'name': str(user['name']),
+                'role': str(user['role']),
+                'date_registered': _clean(user.get('date_registered')),
+                'active': 0 if str(user.get('active')).strip().lower() in ('false', '0') else 1,
+            })
+
+        sales = csv_store.sales_journal.read_dataframe()
+        # Store ISO datetimes so date-range queries can use the index
+        parsed = parse_sale_datetimes(sales['datetime'])
+        iso = parsed.dt.strftime(ISO_DATETIME)
+        sales['datetime'] = iso.where(parsed.notna(), sales['datetime'].astype(str))
+        sale_records = []
+        for sale in sales.to_dict("records"):
+            emp = _clean(sale.get('employee_id'))
+            # Older rows were written by pandas as floats ("123456.0")
+            if emp and emp.endswith(".0") and emp[:-2].isdigit():
+                emp = emp[:-2]
+            total = pd.to_numeric(sale.get('total'), errors='coerce')
+            sale_records.append({
+                'sale_id': sale['sale_id'],
+                'datetime': sale['datetime'],
+                'customer_name': _clean(sale.get('customer_name')),
+                'cashier_name': _clean(sale.get('cashier_name')),
+                'employee_id': emp,
+                'total': None if pd.isna(total) else float(total),
+            })
+
+        items = csv_store.items_journal.read_dataframe()
+        item_records = [{
+            'sale_id': str(item['sale_id']),
+            'product_id': str(item['product_id']),
+            'qty': int(item['qty']),
+            'unit_price_at_sale': float(item['unit_price_at_sale']),
+            'line_total': float(item['line_total']),
+        } for item in items.to_dict("records")]
+
+        self._write([
+            (self.SQL_UPSERT_PRODUCT, products.to_dict("records"), True),
+            (self.SQL_INSERT_USER, user_records, True),
+            (self.SQL_INSERT_SALE.replace("INSERT", "INSERT OR IGNORE", 1), sale_records, True),
+            (self.SQL_INSERT_ITEM.replace("INSERT", "INSERT OR IGNORE", 1), item_records, True),
+        ])
+        print(f"[INFO] Imported {len(products)} products, {len(user_records)} users, "
+              f"{len(sale_records)} sales ({len(item_records)} items) into {self.db_path}")
+        self.rebuild_rollup()
+
+    def export_csv(self, data_dir=DATA_DIR):
+        """Write the database back out as CSV files"""
+        os.makedirs(data_dir, exist_ok=True)
+        _atomic_to_csv(self.load_products(), os.path.join(data_dir, "products.csv"))
+        _atomic_to_csv(self.load_users(), os.path.join(data_dir, "users.csv"))
+        _atomic_to_csv(self.load_sales()[SALES_COLUMNS], os.path.join(data_dir, "sales.csv"))
+        _atomic_to_csv(self.load_sale_items()[SALE_ITEM_COLUMNS], os.path.join(data_dir, "sale_items.csv"))
+        print(f"[INFO] Exported {self.db_path} to {data_dir}/")
+
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage():
+    """Return the process-wide storage backend (safe to call from the warm-up thread)"""
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            backend = os.environ.get("AKBAR_STORAGE", "").strip().lower()
+            db_path = os.path.join(DATA_DIR, DB_FILENAME)
+            if backend == "sqlite" or (backend != "csv" and os.path.exists(db_path)):
+                _storage = SqliteStorage(db_path)
+            else:
+                _storage = CsvStorage()
+        return _storage
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else ""
+    if command == "import":
+        SqliteStorage().import_csv()
+    elif command == "export":
+        SqliteStorage().export_csv()
+    elif command == "rebuild-rollup":
+        storage = get_storage()
+        storage.recover()
+        storage.rebuild_rollup()
+    else:
+        print("Usage: python -m modules.storage [import|export|rebuild-rollup]")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,632 @@
+"""
+THEME
+One application stylesheet for every window of the cashier program
+
+Widgets no longer carry their own setStyleSheet() strings. They get an
+object name (and, for state, a dynamic property) and are matched by the
+rules below, which Qt parses once when apply_theme() installs them:
+
+    button.setObjectName("prefixButton")
+    button.setProperty("category", "Drink")
+    set_state(button, "lowStock", True)     # restyle without re-parsing
+
+Rules written as `#container, #container *` style a panel together with
+everything inside it, the way the old selector-less per-widget sheets did.
+"""
+
+from PyQt6.QtWidgets import QApplication
+
+from modules.catalog_view import CATEGORY_COLORS, LOW_STOCK_COLOR
+
+
+BACKGROUND = "#f8fafc"
+
+
+def _category_rules():
+    """Catalog button colour per product category (plus the low-stock red)"""
+    rules = [f'QPushButton#prefixButton {{ background-color: {CATEGORY_COLORS["default"]}; }}']
+    for category, color in CATEGORY_COLORS.items():
+        if category != 'default':
+            rules.append(f'QPushButton#prefixButton[category="{category}"] {{ background-color: {color}; }}')
+    rules.append(f'QPushButton#prefixButton[lowStock="true"] {{ background-color: {LOW_STOCK_COLOR}; }}')
+    return "\n    ".join(rules)
+
+
+CASHIER_WINDOW_STYLE = f"""
+    QMainWindow#cashierWindow, #cashierMain, #cashierMain * {{
+        background-color: {BACKGROUND};
+    }}
+    #productArea, #productArea *, #cartArea, #cartArea * {{
+        background-color: #ffffff;
+        border-radius: 10px;
+        padding: 10px;
+    }}
+    #cartArea, #cartArea * {{
+        padding: 15px;
+    }}
+    #cartPanel, #cartPanel * {{
+        background-color: {BACKGROUND};
+    }}
+    #cartPanel QTableView {{
+        border: 2px solid #cbd5e1;
+        border-radius: 8px;
+        color: #1e40af;
+        gridline-color: #e2e8f0;
+    }}
+    #cartPanel QHeaderView::section {{
+        background-color: #dbeafe;
+        color: #1e40af;
+        padding: 6px;
+        border: none;
+        font-weight: bold;
+    }}
+    QLabel#cartTitle {{
+        color: #1e40af;
+        padding: 5px;
+    }}
+    QLabel#cartTotal {{
+        color: #1e40af;
+        padding: 8px;
+        border-top: 2px solid #cbd5e1;
+    }}
+
+    QLabel#appTitle {{
+        color: #1e3a8a;
+        background-color: #dbeafe;
+        padding: 20px;
+        border-radius: 10px;
+        margin: 5px;
+    }}
+    QLabel#clock {{
+        color: #059669;
+        padding: 5px;
+    }}
+    QLabel#cashierBadge {{
+        color: #7c3aed;
+        background-color: #f3e8ff;
+        padding: 10px;
+        border-radius: 8px;
+        margin: 5px;
+    }}
+    QLabel#sectionTitle {{
+        color: #1e40af;
+        background-color: #dbeafe;
+        padding: 10px;
+        border-radius: 8px;
+        margin: 5px;
+    }}
+    QScrollArea#productScroll {{
+        border: none;
+    }}
+
+    QLineEdit#searchInput {{
+        border: 2px solid #cbd5e1;
+        border-radius: 8px;
+        padding: 8px;
+        color: #1e40af;
+        background-color: {BACKGROUND};
+    }}
+    QLineEdit#searchInput:focus {{
+        border: 2px solid #3b82f6;
+    }}
+    QLineEdit#scanInput {{
+        border: 2px solid #10b981;
+        border-radius: 8px;
+        padding: 8px;
+        color: #065f46;
+        background-color: #ecfdf5;
+    }}
+    QLineEdit#scanInput:focus {{
+        border: 3px solid #059669;
+    }}
+    QLabel#scanStatus {{
+        color: #6b7280;
+        padding: 2px;
+    }}
+    QLabel#scanStatus[state="ok"] {{
+        color: #059669;
+    }}
+    QLabel#scanStatus[state="error"] {{
+        color: #dc2626;
+    }}
+    QTextEdit#receipt {{
+        background-color: {BACKGROUND};
+        border: 2px solid #cbd5e1;
+        border-radius: 8px;
+        padding: 10px;
+    }}
+
+    QPushButton#prefixButton {{
+        color: white;
+        border: none;
+        border-radius: 15px;
+        padding: 10px;
+    }}
+    {_category_rules()}
+
+    QPushButton#checkoutButton, QPushButton#cancelItemButton, QPushButton#printButton,
+    QPushButton#pdfButton, QPushButton#reportButton {{
+        color: white;
+        border-radius: 12px;
+        padding: 10px;
+    }}
+    QPushButton#checkoutButton {{ background-color: #10b981; }}
+    QPushButton#checkoutButton:hover {{ background-color: #059669; }}
+    QPushButton#cancelItemButton {{ background-color: #ef4444; }}
+    QPushButton#cancelItemButton:hover {{ background-color: #dc2626; }}
+    QPushButton#printButton {{ background-color: #3b82f6; }}
+    QPushButton#printButton:hover {{ background-color: #2563eb; }}
+    QPushButton#pdfButton {{ background-color: #8b5cf6; }}
+    QPushButton#pdfButton:hover {{ background-color: #7c3aed; }}
+    QPushButton#reportButton {{ background-color: #f59e0b; }}
+    QPushButton#reportButton:hover {{ background-color: #d97706; }}
+"""
+
+WELCOME_STYLE = f"""
+    QDialog#welcomeScreen, QDialog#welcomeScreen QDialog {{
+        background-color: {BACKGROUND};
+    }}
+    QScrollArea#welcomeScroll {{
+        border: none;
+        background-color: {BACKGROUND};
+    }}
+
+    #languagePanel, #languagePanel * {{
+        background-color: rgba(255, 255, 255, 0.95);
+        border-radius: 12px;
+        padding: 10px;
+        border: 2px solid #cbd5e1;
+    }}
+    QLabel#languageLabel {{
+        color: #1e40af;
+        background: transparent;
+        border: none;
+    }}
+    QPushButton#flagButton {{
+        background-color: #ffffff;
+        color: #1e40af;
+        border: 3px solid #cbd5e1;
+        border-radius: 10px;
+        padding: 5px;
+    }}
+    QPushButton#flagButton:hover {{
+        background-color: #eff6ff;
+        border: 3px solid #3b82f6;
+    }}
+    QPushButton#flagButton[selected="true"] {{
+        background-color: #3b82f6;
+        color: white;
+        border: 3px solid #1e40af;
+        font-weight: bold;
+    }}
+    QPushButton#flagButton[selected="true"]:hover {{
+        background-color: #2563eb;
+    }}
+
+    #welcomeBanner, #welcomeBanner * {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #1e3a8a, stop:1 #3b82f6);
+        border-radius: 15px;
+        padding: 30px;
+    }}
+    QLabel#welcomeTitle {{
+        color: white;
+    }}
+    QLabel#welcomeSubtitle {{
+        color: #dbeafe;
+        margin-top: 10px;
+    }}
+    QLabel#welcomeMessage {{
+        color: #1e40af;
+        margin: 20px;
+    }}
+
+    QPushButton#cashierOption, QPushButton#stockOption, QPushButton#priceOption {{
+        color: white;
+        border-radius: 12px;
+        text-align: left;
+        padding: 20px;
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QPushButton#cashierOption {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #10b981, stop:1 #059669);
+    }}
+    QPushButton#cashierOption:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #059669, stop:1 #047857);
+    }}
+    QPushButton#stockOption {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #3b82f6, stop:1 #2563eb);
+    }}
+    QPushButton#stockOption:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #2563eb, stop:1 #1d4ed8);
+    }}
+    QPushButton#priceOption {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #8b5cf6, stop:1 #7c3aed);
+    }}
+    QPushButton#priceOption:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #7c3aed, stop:1 #6d28d9);
+    }}
+    QLabel#optionTitle {{
+        color: white;
+    }}
+    QLabel#optionDesc {{
+        margin-top: 5px;
+    }}
+    QPushButton#cashierOption QLabel#optionDesc {{ color: #d1fae5; }}
+    QPushButton#stockOption QLabel#optionDesc {{ color: #dbeafe; }}
+    QPushButton#priceOption QLabel#optionDesc {{ color: #ede9fe; }}
+
+    QLabel#guidelines {{
+        background-color: #fef3c7;
+        color: #78350f;
+        padding: 20px;
+        border-radius: 10px;
+        border: 2px solid #fbbf24;
+    }}
+    QLabel#welcomeFooter {{
+        color: #64748b;
+        margin-top: 10px;
+    }}
+    QPushButton#exitButton {{
+        background-color: #ef4444;
+        color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }}
+    QPushButton#exitButton:hover {{
+        background-color: #dc2626;
+    }}
+"""
+
+LOGIN_STYLE = f"""
+    QDialog#employeeLogin, QDialog#employeeLogin QDialog {{
+        background-color: {BACKGROUND};
+    }}
+    QLabel#loginTitle {{
+        color: #1e40af;
+        background-color: #dbeafe;
+        padding: 20px;
+        border-radius: 10px;
+    }}
+    QLabel#loginSubtitle {{
+        color: #64748b;
+        margin: 10px;
+    }}
+    #loginForm, #loginForm * {{
+        background-color: #ffffff;
+        border-radius: 10px;
+        padding: 20px;
+    }}
+    QLabel#formLabel {{
+        color: #1e293b;
+    }}
+    QLineEdit#loginInput {{
+        padding: 12px;
+        border: 2px solid #cbd5e1;
+        border-radius: 8px;
+        font-size: 16px;
+    }}
+    QLineEdit#loginInput:focus {{
+        border: 2px solid #3b82f6;
+    }}
+    QPushButton#loginButton, QPushButton#loginCancelButton {{
+        color: white;
+        border-radius: 10px;
+        padding: 15px;
+    }}
+    QPushButton#loginButton {{ background-color: #10b981; }}
+    QPushButton#loginButton:hover {{ background-color: #059669; }}
+    QPushButton#loginCancelButton {{ background-color: #ef4444; }}
+    QPushButton#loginCancelButton:hover {{ background-color: #dc2626; }}
+"""
+
+MANAGER_STYLE = f"""
+    QDialog#stockManager, QDialog#stockManager QDialog,
+    QDialog#priceManager, QDialog#priceManager QDialog {{
+        background-color: {BACKGROUND};
+    }}
+    QLabel#managerTitle {{
+        padding: 15px;
+        border-radius: 10px;
+        margin: 10px;
+    }}
+    QDialog#stockManager QLabel#managerTitle {{
+        color: #1e40af;
+        background-color: #dbeafe;
+    }}
+    QDialog#priceManager QLabel#managerTitle {{
+        color: #7c3aed;
+        background-color: #f3e8ff;
+    }}
+    QLabel#managerUser {{
+        color: #64748b;
+        margin: 5px;
+    }}
+    QLabel#managerHint {{
+        color: #475569;
+        margin: 10px;
+    }}
+    QScrollArea#managerScroll {{
+        border: none;
+    }}
+
+    QWidget#bulkPanel {{
+        background-color: #f3e8ff;
+        border: 2px solid #c4b5fd;
+        border-radius: 10px;
+        margin: 0px 10px;
+    }}
+    QWidget#bulkPanel QLabel {{
+        color: #5b21b6;
+    }}
+    QWidget#bulkPanel QComboBox, QWidget#bulkPanel QDoubleSpinBox {{
+        background-color: #ffffff;
+        color: #1e293b;
+        border: 2px solid #c4b5fd;
+        border-radius: 6px;
+        padding: 4px 6px;
+    }}
+    QPushButton#previewButton, QPushButton#importButton {{
+        color: white;
+        border-radius: 8px;
+        padding: 8px 12px;
+    }}
+    QPushButton#previewButton {{ background-color: #8b5cf6; }}
+    QPushButton#previewButton:hover {{ background-color: #7c3aed; }}
+    QPushButton#importButton {{ background-color: #0ea5e9; }}
+    QPushButton#importButton:hover {{ background-color: #0284c7; }}
+
+    QLineEdit#managerSearch {{
+        border: 2px solid #cbd5e1;
+        border-radius: 8px;
+        padding: 8px;
+        margin: 0px 10px;
+        color: #1e293b;
+        background-color: #ffffff;
+    }}
+    QLineEdit#managerSearch:focus {{
+        border: 2px solid #3b82f6;
+    }}
+    QTableView#managerGrid {{
+        border: 2px solid #cbd5e1;
+        border-radius: 8px;
+        margin: 0px 10px;
+        color: #1e293b;
+        background-color: #ffffff;
+        gridline-color: #e2e8f0;
+        selection-background-color: #bfdbfe;
+        selection-color: #1e293b;
+    }}
+    QTableView#managerGrid QHeaderView::section {{
+        background-color: #dbeafe;
+        color: #1e40af;
+        padding: 6px;
+        border: none;
+        font-weight: bold;
+    }}
+    QLabel#pendingStatus {{
+        color: #b45309;
+        margin: 5px 10px;
+    }}
+    QPushButton#saveButton, QPushButton#discardButton {{
+        color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }}
+    QPushButton#saveButton {{ background-color: #3b82f6; }}
+    QPushButton#saveButton:hover {{ background-color: #2563eb; }}
+    QPushButton#discardButton {{ background-color: #6b7280; }}
+    QPushButton#discardButton:hover {{ background-color: #4b5563; }}
+    QPushButton#saveButton:disabled, QPushButton#discardButton:disabled {{
+        background-color: #cbd5e1;
+    }}
+    QPushButton#doneButton {{
+        background-color: #10b981;
+        color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }}
+    QPushButton#doneButton:hover {{
+        background-color: #059669;
+    }}
+"""
+
+CHECKOUT_DIALOG_STYLE = """
+    QDialog#paymentDialog, QDialog#customerNameDialog, QDialog#completionDialog,
+    QMessageBox#paymentError {
+        background-color: #f8fafc;
+    }
+    QMessageBox#paymentError, QMessageBox#paymentError QLabel {
+        font-size: 24px;
+    }
+    QMessageBox#paymentError QLabel {
+        min-width: 500px;
+    }
+
+    QDialog#paymentDialog QLabel#title, QDialog#completionDialog QLabel#title {
+        color: white;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #10b981, stop:1 #059669);
+        padding: 25px;
+        border-radius: 15px;
+    }
+    QDialog#completionDialog QLabel#title {
+        padding: 30px;
+        border-radius: 20px;
+    }
+    QDialog#customerNameDialog QLabel#title {
+        color: white;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #3b82f6, stop:1 #2563eb);
+        padding: 40px;
+        border-radius: 15px;
+    }
+
+    QWidget#inputPanel, QWidget#inputPanel QLabel {
+        background-color: #ffffff;
+        border-radius: 15px;
+        padding: 30px;
+        border: 3px solid #cbd5e1;
+    }
+    QWidget#inputPanel QLabel#inputCaption {
+        color: #1e293b;
+        margin-bottom: 15px;
+    }
+    QDialog#customerNameDialog QWidget#inputPanel QLabel#inputCaption {
+        margin-bottom: 20px;
+    }
+    QLineEdit#paymentInput, QLineEdit#nameInput {
+        padding: 20px;
+        border: 5px solid #3b82f6;
+        border-radius: 15px;
+        background-color: #eff6ff;
+        color: #1e40af;
+    }
+    QLineEdit#nameInput {
+        padding: 30px;
+    }
+    QLineEdit#paymentInput:focus, QLineEdit#nameInput:focus {
+        border: 5px solid #10b981;
+        background-color: #d1fae5;
+    }
+
+    QLabel#totalCaption {
+        color: #1e40af;
+        margin-top: 10px;
+    }
+    QLabel#totalValue {
+        color: #dc2626;
+        background-color: #fee2e2;
+        padding: 20px;
+        border-radius: 15px;
+        border: 5px solid #ef4444;
+    }
+    QLabel#instructions {
+        color: #1e40af;
+        margin: 20px;
+    }
+
+    QWidget#paymentPanel, QWidget#paymentPanel QLabel {
+        background-color: #dbeafe;
+        border-radius: 15px;
+        padding: 20px;
+        border: 4px solid #3b82f6;
+    }
+    QWidget#paymentPanel QLabel {
+        color: #1e40af;
+    }
+    QWidget#changePanel, QWidget#changePanel QLabel {
+        background-color: #d1fae5;
+        border-radius: 15px;
+        padding: 20px;
+        border: 4px solid #10b981;
+    }
+    QWidget#changePanel QLabel {
+        color: #047857;
+    }
+    QWidget#paymentPanel QLabel#amount, QWidget#changePanel QLabel#amount {
+        margin: 8px;
+    }
+    QLabel#thankYou {
+        color: #6366f1;
+        margin: 12px;
+    }
+
+    QPushButton#confirmButton, QPushButton#cancelButton, QPushButton#okButton,
+    QPushButton#skipButton {
+        color: white;
+        border-radius: 20px;
+        padding: 15px;
+    }
+    QDialog#customerNameDialog QPushButton {
+        padding: 20px;
+    }
+    QPushButton#confirmButton, QDialog#customerNameDialog QPushButton#okButton {
+        background-color: #10b981;
+    }
+    QPushButton#confirmButton:hover, QDialog#customerNameDialog QPushButton#okButton:hover {
+        background-color: #059669;
+    }
+    QPushButton#cancelButton {
+        background-color: #ef4444;
+    }
+    QPushButton#cancelButton:hover {
+        background-color: #dc2626;
+    }
+    QPushButton#okButton {
+        background-color: #3b82f6;
+    }
+    QPushButton#okButton:hover {
+        background-color: #2563eb;
+    }
+    QPushButton#skipButton {
+        background-color: #6b7280;
+    }
+    QPushButton#skipButton:hover {
+        background-color: #4b5563;
+    }
+"""
+
+CASHIER_DIALOG_STYLE = f"""
+    QDialog#catalogDialog, QDialog#perfDialog {{
+        background-color: {BACKGROUND};
+    }}
+    QLabel#catalogTitle {{
+        color: #1e40af;
+        background-color: #dbeafe;
+        padding: 15px;
+        border-radius: 10px;
+        margin: 10px;
+    }}
+    QDialog#catalogDialog QListView {{
+        border: none;
+        background-color: transparent;
+    }}
+    QLabel#perfTitle {{
+        color: #1e40af;
+        padding: 8px;
+    }}
+
+    QPushButton#catalogClose, QPushButton#reportGenerate, QPushButton#reportCancel {{
+        color: white;
+        border-radius: 8px;
+        padding: 10px;
+    }}
+    QPushButton#catalogClose {{ background-color: #6b7280; }}
+    QPushButton#catalogClose:hover {{ background-color: #4b5563; }}
+    QPushButton#reportGenerate {{ background-color: #10b981; }}
+    QPushButton#reportGenerate:hover {{ background-color: #059669; }}
+    QPushButton#reportCancel {{ background-color: #ef4444; }}
+    QPushButton#reportCancel:hover {{ background-color: #dc2626; }}
+"""
+
+APP_STYLESHEET = (CASHIER_WINDOW_STYLE + WELCOME_STYLE + LOGIN_STYLE + MANAGER_STYLE + CHECKOUT_DIALOG_STYLE
+                  + CASHIER_DIALOG_STYLE)
+
+_applied = False
+
+
+def apply_theme():
+    """Install APP_STYLESHEET on the application (once; later calls do nothing)"""
+    global _applied
+    app = QApplication.instance()
+    if _applied or app is None:
+        return
+    app.setStyleSheet(APP_STYLESHEET)
+    _applied = True
+
+
+def set_state(widget, name, value):
+    """
+    Switch a widget to another themed state by dynamic property
+
+    Only this widget is re-polished against the already parsed stylesheet;
+    nothing happens when the property already has that value.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
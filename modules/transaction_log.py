@@ -0,0 +1,247 @@
+"""
+CHECKOUT TRANSACTION LOG
+Write-ahead log that makes a sale's stock changes and sales record atomic
+
+A checkout writes ONE fsync'd JSON line to data/checkout.wal holding the
+grouped per-SKU stock deltas, the sales record and its line items. The
+daily rollup is updated right after the journals. That line is the commit
+point: a sale whose journal append fails afterwards still stands, and its
+journal rows are added at the next checkpoint. On start-up any logged
+transactions are replayed.
+
+products.csv is only rewritten at checkpoints (every few sales, on close,
+after replay), and only when sales were logged since the last one. The
+logged deltas are added to a freshly read products.csv, so stock changed
+by another tool in the meantime (a delivery import, a manual fix) is kept.
+A checkpoint never applies a delta twice, even if it is interrupted:
+
+1. products.csv plus the deltas is written to products.csv.tmp
+2. the WAL is renamed to checkout.wal.ckpt (its deltas now live in the tmp file)
+3. products.csv.tmp replaces products.csv
+4. checkout.wal.ckpt is deleted
+
+A running till holds an OS lock on data/checkout.lock (released by the OS
+if the till dies), so other tools can tell the WAL is in use.
+"""
+
+import json
+import os
+import uuid
+
+import pandas as pd
+
+
+CHECKPOINT_EVERY = 25
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _try_lock(f):
+    """Non-blocking exclusive lock on an open file; False when another process holds it"""
+    f.seek(0)
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def new_sale_id():
+    """Unique id linking a sale's WAL entry and its sales journal row"""
+    return uuid.uuid4().hex[:12]
+
+
+class CheckoutTransactionLog:
+    """Write-ahead log for checkout commits"""
+
+    def __init__(self, sales_journal, items_journal, products_path=os.path.join("data", "products.csv"),
+                 wal_path=os.path.join("data", "checkout.wal"), rollup=None):
+        self.sales_journal = sales_journal
+        self.items_journal = items_journal
+        self.rollup = rollup
+        self.products_path = products_path
+        self.wal_path = wal_path
+        self.checkpoint_path = wal_path + ".ckpt"
+        self.lock_path = os.path.join(os.path.dirname(wal_path), "checkout.lock")
+        self.pending = 0  # Sales logged since the last checkpoint
+        self.unjournaled = False  # A logged sale may be missing from the journals
+        self._lock_file = None
+
+    def acquire(self):
+        """Hold the WAL for this till until release(); False when another till holds it"""
+        if self._lock_file is not None:
+            return True
+        f = open(self.lock_path, "a+b")
+        if not _try_lock(f):
+            f.close()
+            return False
+        self._lock_file = f
+        return True
+
+    def holding(self):
+        """True while this process holds the WAL"""
+        return self._lock_file is not None
+
+    def release(self):
+        if self._lock_file is not None:
+            self._lock_file.close()  # Closing the file drops the lock
+            self._lock_file = None
+
+    def in_use(self):
+        """True while a till holds the WAL or it has sales not yet in products.csv"""
+        if self.holding():
+            return True
+        with open(self.lock_path, "a+b") as f:
+            if not _try_lock(f):
+                return True
+        unsaved = os.path.exists(self.wal_path) and os.path.getsize(self.wal_path) > 0
+        return unsaved or os.path.exists(self.checkpoint_path)
+
+    def _read_entries(self):
+        """Committed WAL entries; a torn final line is an uncommitted sale and is ignored"""
+        if not os.path.exists(self.wal_path):
+            return []
+        entries = []
+        with open(self.wal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print("[WARN] Ignoring torn checkout WAL entry")
+        return entries
+
+    def commit(self, deltas, sale_record, items=()):
+        """
+        Commit a sale: log its stock deltas and append the sale and its items
+        Only files are written; the caller applies the deltas to its catalog.
+
+        Args:
+            deltas: Dictionary of product_id -> stock change (negative for sales)
+            sale_record: Sales journal record; a sale_id is added if missing
+            items: Line item records (product_id, qty, unit_price_at_sale, line_total)
+        """
+        sale_id = sale_record.setdefault('sale_id', new_sale_id())
+        items = [dict(item, sale_id=sale_id) for item in items]
+        entry = {
+            'sale_id': sale_id,
+            'deltas': deltas,
+            'sale': sale_record,
+            'items': items,
+        }
+        data = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+
+        fd = os.open(self.wal_path, _APPEND_FLAGS)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        # The sale is committed from here on: a failed journal append must not
+        # make the caller retry it, the next checkpoint adds the missing rows
+        self.pending += 1
+        try:
+            # Items first: a sale row in the journal implies its items are there too
+            self.items_journal.append_many(items)
+            self.sales_journal.append(sale_record)
+            if self.rollup is not None:
+                self.rollup.record(sale_record, items)
+        except Exception as e:
+            self.unjournaled = True
+            print(f"[ERROR] Sale {sale_id} committed but not journaled yet: {e}")
+
+        if self.pending >= CHECKPOINT_EVERY:
+            try:
+                self.checkpoint()
+            except Exception as e:
+                # The sale is committed in the WAL; the next checkpoint or replay applies it
+                print(f"[ERROR] Stock checkpoint failed: {e}")
+        return sale_id
+
+    def checkpoint(self):
+        """Add the deltas logged since the last checkpoint to products.csv and clear the WAL"""
+        if not self.pending:
+            return
+        self._checkpoint(self._read_entries())
+
+    def _journal_missing(self, entries):
+        """Append the journal and rollup rows of logged sales that are not there yet"""
+        sales = self.sales_journal.tail()
+        items = self.items_journal.tail()
+        rollup = self.rollup.journal.tail() if self.rollup is not None else b""
+        for entry in entries:
+            sale = entry.get('sale')
+            sale_id = sale.get('sale_id', '') if sale else ''
+            if not sale_id:
+                continue
+            key = sale_id.encode("utf-8")
+            if key not in sales:
+                if key not in items:
+                    self.items_journal.append_many(entry.get('items', []))
+                self.sales_journal.append(sale)
+            if self.rollup is not None and key not in rollup:
+                self.rollup.record(sale, entry.get('items', []))
+        self.unjournaled = False
+
+    def _checkpoint(self, entries):
+        if entries and self.unjournaled:
+            self._journal_missing(entries)
+        if entries:
+            totals = {}
+            for entry in entries:
+                for pid, delta in entry.get('deltas', {}).items():
+                    totals[pid] = totals.get(pid, 0) + int(delta)
+
+            products = pd.read_csv(self.products_path, dtype={'product_id': str, 'barcode': str})
+            delta = products['product_id'].map(totals).fillna(0).astype(int)
+            stock = pd.to_numeric(products['stock'], errors='coerce').fillna(0).astype(int)
+            products['stock'] = stock + delta
+
+            tmp_path = self.products_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                products.to_csv(f, index=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(self.wal_path, self.checkpoint_path)
+            os.replace(tmp_path, self.products_path)
+            os.remove(self.checkpoint_path)
+        self.pending = 0
+
+    def _finish_checkpoint(self):
+        """Complete or undo a checkpoint interrupted by a crash"""
+        tmp_path = self.products_path + ".tmp"
+        if os.path.exists(self.checkpoint_path):
+            # The WAL was moved aside, so the tmp file (if still there) holds its deltas
+            if os.path.exists(tmp_path):
+                os.replace(tmp_path, self.products_path)
+            os.remove(self.checkpoint_path)
+        elif os.path.exists(tmp_path):
+            # Interrupted before the WAL was moved: the WAL still has the deltas
+            os.remove(tmp_path)
+
+    def replay(self):
+        """
+        Re-apply logged transactions after a crash or unclean exit
+        The WAL only holds deltas not yet in products.csv, so replay is idempotent.
+
+        Returns:
+            Number of transactions replayed
+        """
+        self._finish_checkpoint()
+        entries = self._read_entries()
+        if not entries:
+            return 0
+
+        # A crash or a failed append can leave any logged sale out of the journals
+        self._journal_missing(entries)
+        self._checkpoint(entries)
+        print(f"[INFO] Replayed {len(entries)} checkout transaction(s) from {self.wal_path}")
+        return len(entries)
@@ -13,8 +13,6 @@ FEATURES:
 - Activity logging
 """
 
-import os
-import pandas as pd
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QScrollArea, QWidget
@@ -25,11 +23,18 @@ from datetime import datetime
 
 # Import translation system
 from modules.translations import LanguageManager, tr
+from modules.theme import apply_theme, set_state
 
-# Import helper dialogs from separate modules
-from modules.employee_login import EmployeeLoginDialog
-from modules.stock_manager import StockManagerDialog
-from modules.price_manager import PriceManagerDialog
+# The login and manager dialogs (and with them pandas and the storage layer)
+# are imported on first use so the welcome screen appears straight away
+from modules.startup import wait_for_warm_up
+
+
+def _login_dialog(*args, **kwargs):
+    """EmployeeLoginDialog, once the background warm-up (crash recovery) is done"""
+    wait_for_warm_up()
+    from modules.employee_login import EmployeeLoginDialog
+    return EmployeeLoginDialog(*args, **kwargs)
 
 
 class FlagButton(QPushButton):
@@ -37,6 +42,7 @@ class FlagButton(QPushButton):
     
     def __init__(self, flag_emoji, text, parent=None):
         super().__init__(parent)
+        self.setObjectName("flagButton")  # Colours and the selected state come from the theme
         self.flag_emoji = flag_emoji
         self.flag_text = text
         self.setMinimumSize(QSize(120, 60))
@@ -46,61 +52,20 @@ class FlagButton(QPushButton):
         # Set text
         self.setText(f"{flag_emoji}\n{text}")
         self.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        
-        # Default style (not selected)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #ffffff;
-                color: #1e40af;
-                border: 3px solid #cbd5e1;
-                border-radius: 10px;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background-color: #eff6ff;
-                border: 3px solid #3b82f6;
-            }
-        """)
-    
+
     def set_selected(self, selected):
         """Highlight button when selected"""
-        if selected:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #3b82f6;
-                    color: white;
-                    border: 3px solid #1e40af;
-                    border-radius: 10px;
-                    padding: 5px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #2563eb;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffffff;
-                    color: #1e40af;
-                    border: 3px solid #cbd5e1;
-                    border-radius: 10px;
-                    padding: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #eff6ff;
-                    border: 3px solid #3b82f6;
-                }
-            """)
+        set_state(self, "selected", selected)
 
 
 class WelcomeScreen(QDialog):
     """Welcome screen with system options and role-based access"""
     
     def __init__(self, parent=None):
+        apply_theme()
         super().__init__(parent)
+        self.setObjectName("welcomeScreen")
         self.setWindowTitle("Akbar Jaya Cashier System - Welcome")
-        self.setStyleSheet("QDialog { background-color: #f8fafc; }")
         self.setModal(True)
         
         self.selected_mode = None
@@ -130,10 +95,10 @@ class WelcomeScreen(QDialog):
         
         # Create scroll area for all content
         scroll = QScrollArea()
+        scroll.setObjectName("welcomeScroll")
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: #f8fafc; }")
         
         # Content widget inside scroll area
         content_widget = QWidget()
@@ -147,20 +112,15 @@ class WelcomeScreen(QDialog):
         
         # Language selector at top-right (fixed position overlay)
         lang_container = QWidget(self)
-        lang_container.setStyleSheet("""
-            background-color: rgba(255, 255, 255, 0.95);
-            border-radius: 12px;
-            padding: 10px;
-            border: 2px solid #cbd5e1;
-        """)
+        lang_container.setObjectName("languagePanel")
         lang_layout = QVBoxLayout()
         lang_layout.setSpacing(5)
         lang_container.setLayout(lang_layout)
         
         lang_label = QLabel(tr('language_selector'))
+        lang_label.setObjectName("languageLabel")
         lang_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
         lang_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lang_label.setStyleSheet("color: #1e40af; background: transparent; border: none;")
         lang_layout.addWidget(lang_label)
         self.ui_elements['language_selector'] = lang_label
         
@@ -191,26 +151,21 @@ class WelcomeScreen(QDialog):
         
         # Logo/Title Section
         title_container = QWidget()
-        title_container.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #1e3a8a, stop:1 #3b82f6);
-            border-radius: 15px;
-            padding: 30px;
-        """)
+        title_container.setObjectName("welcomeBanner")
         title_layout = QVBoxLayout()
         title_container.setLayout(title_layout)
         
         title = QLabel(tr('welcome_title'))
+        title.setObjectName("welcomeTitle")
         title.setFont(QFont("Arial", 48, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("color: white;")
         title_layout.addWidget(title)
         self.ui_elements['title'] = title
         
         subtitle = QLabel(tr('welcome_subtitle'))
+        subtitle.setObjectName("welcomeSubtitle")
         subtitle.setFont(QFont("Arial", 20))
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet("color: #dbeafe; margin-top: 10px;")
         title_layout.addWidget(subtitle)
         self.ui_elements['subtitle'] = subtitle
         
@@ -218,9 +173,9 @@ class WelcomeScreen(QDialog):
         
         # Welcome message
         welcome_msg = QLabel(tr('welcome_message'))
+        welcome_msg.setObjectName("welcomeMessage")
         welcome_msg.setFont(QFont("Arial", 18, QFont.Weight.Bold))
         welcome_msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        welcome_msg.setStyleSheet("color: #1e40af; margin: 20px;")
         layout.addWidget(welcome_msg)
         self.ui_elements['welcome'] = welcome_msg
         
@@ -232,36 +187,21 @@ class WelcomeScreen(QDialog):
         
         # Button 1: Start as Cashier
         cashier_btn = QPushButton()
+        cashier_btn.setObjectName("cashierOption")
         cashier_btn.setMinimumHeight(120)
         cashier_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cashier_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #10b981, stop:1 #059669);
-                color: white;
-                border-radius: 12px;
-                text-align: left;
-                padding: 20px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #059669, stop:1 #047857);
-            }
-        """)
         
         cashier_content = QVBoxLayout()
         cashier_content.setSpacing(8)
         cashier_title = QLabel(tr('cashier_option_title'))
+        cashier_title.setObjectName("optionTitle")
         cashier_title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
-        cashier_title.setStyleSheet("color: white;")
         cashier_title.setWordWrap(True)
         self.ui_elements['cashier_title'] = cashier_title
         
         cashier_desc = QLabel(tr('cashier_option_desc'))
+        cashier_desc.setObjectName("optionDesc")
         cashier_desc.setFont(QFont("Arial", 14))
-        cashier_desc.setStyleSheet("color: #d1fae5; margin-top: 5px;")
         cashier_desc.setWordWrap(True)
         self.ui_elements['cashier_desc'] = cashier_desc
         
@@ -273,36 +213,21 @@ class WelcomeScreen(QDialog):
         
         # Button 2: Update Stock
         stock_btn = QPushButton()
+        stock_btn.setObjectName("stockOption")
         stock_btn.setMinimumHeight(120)
         stock_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        stock_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3b82f6, stop:1 #2563eb);
-                color: white;
-                border-radius: 12px;
-                text-align: left;
-                padding: 20px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2563eb, stop:1 #1d4ed8);
-            }
-        """)
         
         stock_content = QVBoxLayout()
         stock_content.setSpacing(8)
         stock_title = QLabel(tr('stock_option_title'))
+        stock_title.setObjectName("optionTitle")
         stock_title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
-        stock_title.setStyleSheet("color: white;")
         stock_title.setWordWrap(True)
         self.ui_elements['stock_title'] = stock_title
         
         stock_desc = QLabel(tr('stock_option_desc'))
+        stock_desc.setObjectName("optionDesc")
         stock_desc.setFont(QFont("Arial", 14))
-        stock_desc.setStyleSheet("color: #dbeafe; margin-top: 5px;")
         stock_desc.setWordWrap(True)
         self.ui_elements['stock_desc'] = stock_desc
         
@@ -314,36 +239,21 @@ class WelcomeScreen(QDialog):
         
         # Button 3: Update Prices
         price_btn = QPushButton()
+        price_btn.setObjectName("priceOption")
         price_btn.setMinimumHeight(120)
         price_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        price_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #8b5cf6, stop:1 #7c3aed);
-                color: white;
-                border-radius: 12px;
-                text-align: left;
-                padding: 20px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #7c3aed, stop:1 #6d28d9);
-            }
-        """)
         
         price_content = QVBoxLayout()
         price_content.setSpacing(8)
         price_title = QLabel(tr('price_option_title'))
+        price_title.setObjectName("optionTitle")
         price_title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
-        price_title.setStyleSheet("color: white;")
         price_title.setWordWrap(True)
         self.ui_elements['price_title'] = price_title
         
         price_desc = QLabel(tr('price_option_desc'))
+        price_desc.setObjectName("optionDesc")
         price_desc.setFont(QFont("Arial", 14))
-        price_desc.setStyleSheet("color: #ede9fe; margin-top: 5px;")
         price_desc.setWordWrap(True)
         self.ui_elements['price_desc'] = price_desc
         
@@ -357,14 +267,8 @@ class WelcomeScreen(QDialog):
         
         # Guidelines section
         guidelines = QLabel(tr('welcome_guidelines'))
+        guidelines.setObjectName("guidelines")
         guidelines.setFont(QFont("Arial", 13))
-        guidelines.setStyleSheet("""
-            background-color: #fef3c7;
-            color: #78350f;
-            padding: 20px;
-            border-radius: 10px;
-            border: 2px solid #fbbf24;
-        """)
         guidelines.setWordWrap(True)
         guidelines.setTextFormat(Qt.TextFormat.RichText)
         layout.addWidget(guidelines)
@@ -376,29 +280,19 @@ class WelcomeScreen(QDialog):
         footer_container.setLayout(footer_layout)
         
         footer = QLabel(tr('welcome_footer'))
+        footer.setObjectName("welcomeFooter")
         footer.setFont(QFont("Arial", 11))
         footer.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        footer.setStyleSheet("color: #64748b; margin-top: 10px;")
         footer_layout.addWidget(footer, 1)
         self.ui_elements['footer'] = footer
         
         # Exit fullscreen button
         exit_btn = QPushButton(tr('exit_button'))
+        exit_btn.setObjectName("exitButton")
         exit_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
         exit_btn.setMinimumHeight(40)
         exit_btn.setMaximumWidth(120)
         exit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        exit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ef4444;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #dc2626;
-            }
-        """)
         exit_btn.clicked.connect(self.reject)
         footer_layout.addWidget(exit_btn)
         self.ui_elements['exit_btn'] = exit_btn
@@ -446,7 +340,7 @@ class WelcomeScreen(QDialog):
     def start_cashier_mode(self):
         """Start the cashier mode after asking name and employee ID"""
         # Create a custom dialog for name and ID input with role check
-        login_dialog = EmployeeLoginDialog(self, required_action="cashier")
+        login_dialog = _login_dialog(self, required_action="cashier")
         result = login_dialog.exec()
         
         if result == QDialog.DialogCode.Accepted:
@@ -459,10 +353,11 @@ class WelcomeScreen(QDialog):
     def open_stock_manager(self):
         """Open the stock management dialog after employee verification"""
         # Require employee login with stock_update permission
-        login_dialog = EmployeeLoginDialog(self, for_management=True, required_action="stock_update")
+        login_dialog = _login_dialog(self, for_management=True, required_action="stock_update")
         result = login_dialog.exec()
         
         if result == QDialog.DialogCode.Accepted:
+            from modules.stock_manager import StockManagerDialog
             dialog = StockManagerDialog(
                 self,
                 login_dialog.employee_id,
@@ -473,10 +368,11 @@ class WelcomeScreen(QDialog):
     def open_price_manager(self):
         """Open the price management dialog after employee verification"""
         # Require employee login with price_update permission
-        login_dialog = EmployeeLoginDialog(self, for_management=True, required_action="price_update")
+        login_dialog = _login_dialog(self, for_management=True, required_action="price_update")
         result = login_dialog.exec()
         
         if result == QDialog.DialogCode.Accepted:
+            from modules.price_manager import PriceManagerDialog
             dialog = PriceManagerDialog(
                 self,
                 login_dialog.employee_id,
@@ -6,18 +6,16 @@ Generates properly formatted receipts with correct spacing
 from datetime import datetime
 
 
-def generate_receipt_text(cart, products_df, customer_name="Customer", 
+def generate_receipt_text(cart, catalog, customer_name="Customer", 
                          payment_amount=None, change_amount=None, 
                          cashier_name="Cashier"):
-    """Generate formatted receipt text with proper alignment"""
+    """Generate formatted receipt text with proper alignment
+    
+    cart is a modules.cart.Cart, catalog the shared ProductCatalog
+    """
     if not cart:
         return "No items in cart."
 
-    # Count quantities
-    summary = {}
-    for pid in cart:
-        summary[pid] = summary.get(pid, 0) + 1
-
     lines = []
     lines.append("=" * 60)
     lines.append("          Toko: AKBAR JAYA")
@@ -35,13 +33,12 @@ def generate_receipt_text(cart, products_df, customer_name="Customer",
     lines.append(f"{'ITEM':<28} {'QTY':>5} {'PRICE':>10} {'TOTAL':>12}")
     lines.append("-" * 60)
 
-    total_amount = 0.0
-    for pid, qty in summary.items():
-        product = products_df[products_df['product_id'] == pid].iloc[0]
-        name = product['name'][:28]  # Truncate long names
-        price = float(product['price'])
-        total = price * qty
-        total_amount += total
+    for line in cart:
+        product = catalog.get(line.product_id)
+        name = (product.name if product else line.name)[:28]  # Truncate long names
+        qty = line.qty
+        price = line.unit_price
+        total = line.total
         
         # Better aligned format
         lines.append(f"{name:<28} {qty:>5} ${price:>9.2f} ${total:>10.2f}")
@@ -50,7 +47,7 @@ def generate_receipt_text(cart, products_df, customer_name="Customer",
     lines.append("")
     
     # Right-aligned totals with proper spacing
-    lines.append(f"{'SUBTOTAL:':>48} ${total_amount:>10.2f}")
+    lines.append(f"{'SUBTOTAL:':>48} ${cart.subtotal:>10.2f}")
     
     if payment_amount is not None:
         lines.append(f"{'PAYMENT:':>48} ${payment_amount:>10.2f}")
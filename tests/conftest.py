@@ -0,0 +1,27 @@
+"""
+Shared fixtures: every test works on its own data directory under tmp_path
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+PRODUCTS_CSV = """product_id,name,category,price,stock,barcode
+AJ001,Milo 3-in-1,Drink,4.9,20,0012345678905
+AJ002,Maggi Curry,Food,3.5,10,
+AJ003,Teh Botol,Drink,2.0,5,
+"""
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """data/ with a small products.csv; the working directory is tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    folder = tmp_path / "data"
+    folder.mkdir()
+    (folder / "products.csv").write_text(PRODUCTS_CSV, encoding="utf-8")
+    return str(folder)
@@ -0,0 +1,66 @@
+"""
+Scanner input parsing and code lookup (modules/barcode_scanner.py)
+"""
+
+import pandas as pd
+import pytest
+
+from modules.barcode_scanner import BarcodeIndex, MAX_SCAN_QTY, parse_scan
+from modules.catalog import ProductCatalog
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("AJ001", (1, "AJ001")),
+    ("  0012345678905\n", (1, "0012345678905")),
+    ("5*AJ001", (5, "AJ001")),
+    ("12 * aj002", (12, "aj002")),
+    (f"{MAX_SCAN_QTY}*AJ001", (MAX_SCAN_QTY, "AJ001")),
+])
+def test_parse_scan(text, expected):
+    assert parse_scan(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "   ", "AJ 001", "0*AJ001", f"{MAX_SCAN_QTY + 1}*AJ001"])
+def test_parse_scan_rejects(text):
+    assert parse_scan(text) is None
+
+
+def index_for(barcodes):
+    return BarcodeIndex(ProductCatalog(pd.DataFrame({
+        'product_id': ["AJ001", "AJ002", "AJ003"],
+        'name': ["Milo 3-in-1", "Maggi Curry", "Teh Botol"],
+        'category': ["Drink", "Food", "Drink"],
+        'price': [4.9, 3.5, 2.0],
+        'stock': [20, 10, 5],
+        'barcode': barcodes,
+    })))
+
+
+def test_lookup_by_product_id_ignores_case():
+    index = index_for(["0012345678905", None, float("nan")])
+
+    assert index.lookup("AJ002") == "AJ002"
+    assert index.lookup(" aj003 ") == "AJ003"
+    assert index.lookup("AJ999") is None
+
+
+def test_lookup_by_barcode_keeps_leading_zeros():
+    index = index_for(["0012345678905", None, float("nan")])
+
+    assert index.lookup("0012345678905") == "AJ001"
+    assert index.lookup("12345678905") is None
+
+
+def test_missing_barcodes_are_not_indexed():
+    index = index_for(["0012345678905", None, float("nan")])
+
+    assert len(index) == 4
+    assert index.lookup("nan") is None
+    assert index.lookup("None") is None
+
+
+def test_catalog_without_barcode_column():
+    catalog = ProductCatalog(pd.DataFrame({'product_id': ["AJ001"], 'name': ["Milo"]}))
+
+    assert BarcodeIndex(catalog).lookup("aj001") == "AJ001"
+    assert BarcodeIndex().lookup("AJ001") is None
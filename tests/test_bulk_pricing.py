@@ -0,0 +1,84 @@
+"""
+Bulk repricing rules and supplier price lists (modules/bulk_pricing.py)
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+from modules.bulk_pricing import adjust_prices, select_products, supplier_price_plan
+
+
+PRODUCTS = pd.DataFrame({
+    'product_id': ["AJ001", "AJ002", "AJ003", "DR010"],
+    'name': ["Milo 3-in-1", "Maggi Curry", "Teh Botol", "Tehbotol Sosro"],
+    'category': ["Drink", "Food", "Drink", "Drink"],
+    'price': [4.9, 3.5, 0.04, 2.0],
+    'stock': [20, 10, 5, 8],
+})
+
+
+def changes(plan):
+    return dict(zip(plan.changes['product_id'], plan.changes['new_price']))
+
+
+def rejects(plan):
+    return dict(zip(plan.rejected['product_id'], plan.rejected['reason']))
+
+
+def test_select_products_combines_criteria():
+    mask = select_products(PRODUCTS, category="Drink", prefix="AJ")
+
+    assert list(PRODUCTS['product_id'][mask]) == ["AJ001", "AJ003"]
+    assert select_products(PRODUCTS, product_ids=["DR010"]).sum() == 1
+    assert select_products(PRODUCTS).all()
+
+
+def test_percent_rounds_to_cents():
+    plan = adjust_prices(PRODUCTS, select_products(PRODUCTS, category="Drink"), percent=10)
+
+    assert changes(plan) == {"AJ001": 5.39, "DR010": 2.2}
+    assert plan.rule == "+10%"
+    # 0.04 * 1.10 rounds back to 0.04, so it is not a change
+    assert "AJ003" not in changes(plan)
+    assert plan.rejected.empty
+
+
+def test_amount_below_minimum_is_rejected():
+    plan = adjust_prices(PRODUCTS, select_products(PRODUCTS, category="Drink"), amount=-0.10)
+
+    assert changes(plan) == {"AJ001": 4.8, "DR010": 1.9}
+    assert rejects(plan) == {"AJ003": "price would be $-0.06"}
+    assert plan.rule == "-$0.10"
+    assert plan.summary() == "-$0.10: 2 price(s) change, 1 rejected"
+
+
+def test_percent_or_amount_is_required():
+    mask = select_products(PRODUCTS)
+    with pytest.raises(ValueError):
+        adjust_prices(PRODUCTS, mask)
+    with pytest.raises(ValueError):
+        adjust_prices(PRODUCTS, mask, percent=5, amount=1)
+
+
+def test_supplier_price_list():
+    source = io.StringIO(
+        " Product_ID , Price ,note\n"
+        "AJ001,5.20,new\n"
+        "AJ002,3.50,same\n"
+        "ZZ999,1.00,\n"
+        "AJ003,n/a,\n"
+        "DR010,2.40,\n"
+        "DR010,2.60,corrected\n"
+    )
+    plan = supplier_price_plan(PRODUCTS, source)
+
+    assert changes(plan) == {"AJ001": 5.2, "DR010": 2.6}
+    assert rejects(plan) == {"ZZ999": "unknown product", "AJ003": "price is not a number"}
+    assert list(plan.changes['old_price']) == [4.9, 2.0]
+
+
+def test_supplier_list_needs_both_columns():
+    with pytest.raises(ValueError, match="price"):
+        supplier_price_plan(PRODUCTS, io.StringIO("product_id,cost\nAJ001,1.0\n"))
@@ -0,0 +1,82 @@
+"""
+Shopping cart: quantities, running totals and checkout records (modules/cart.py)
+"""
+
+from modules.cart import Cart
+from modules.catalog import ProductRecord
+
+
+MILO = ProductRecord("AJ001", "Milo 3-in-1", "Drink", 4.9, 20)
+MAGGI = ProductRecord("AJ002", "Maggi Curry", "Food", 3.5, 10)
+TEH = ProductRecord("AJ003", "Teh Botol", "Drink", 0.1, 5)
+
+
+def test_adding_a_product_twice_keeps_one_line():
+    cart = Cart()
+    cart.add(MILO)
+    cart.add(MAGGI)
+    cart.add(MILO, 2)
+
+    assert len(cart) == 2
+    assert cart.quantity("AJ001") == 3
+    assert cart.item_count == 4
+    assert cart.subtotal == 18.2
+    assert [line.product_id for line in cart] == ["AJ001", "AJ002"]
+
+
+def test_remove_never_goes_below_zero():
+    cart = Cart()
+    cart.add(MILO, 2)
+
+    assert cart.remove("AJ001", 5) == 2
+    assert "AJ001" not in cart
+    assert not cart
+    assert cart.item_count == 0
+    assert cart.subtotal == 0
+    assert cart.remove("AJ001") == 0
+
+
+def test_set_quantity_changes_adds_and_removes_lines():
+    cart = Cart()
+    cart.add(MILO)
+
+    assert cart.set_quantity(MILO, 4).qty == 4
+    assert cart.set_quantity(MAGGI, 0) is None
+    assert "AJ002" not in cart
+    assert cart.set_quantity(MAGGI, 2).qty == 2
+    assert cart.set_quantity(MILO, 0) is None
+    assert cart.lines() == [cart.line("AJ002")]
+    assert cart.item_count == 2
+    assert cart.subtotal == 7.0
+
+
+def test_subtotal_does_not_drift():
+    cart = Cart()
+    for _ in range(30):
+        cart.add(TEH)
+    for _ in range(10):
+        cart.remove("AJ003")
+
+    assert cart.subtotal == 2.0
+
+
+def test_clear_resets_the_totals():
+    cart = Cart()
+    cart.add(MILO, 3)
+    cart.clear()
+
+    assert len(cart) == 0
+    assert cart.item_count == 0
+    assert cart.subtotal == 0
+
+
+def test_checkout_records():
+    cart = Cart()
+    cart.add(MILO, 3)
+    cart.add(MAGGI)
+
+    assert cart.stock_deltas() == {"AJ001": -3, "AJ002": -1}
+    assert cart.sale_items() == [
+        {'product_id': "AJ001", 'qty': 3, 'unit_price_at_sale': 4.9, 'line_total': 14.7},
+        {'product_id': "AJ002", 'qty': 1, 'unit_price_at_sale': 3.5, 'line_total': 3.5},
+    ]
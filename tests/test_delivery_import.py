@@ -0,0 +1,120 @@
+"""
+Delivery note import: chunked reading, rejects and the stock update (modules/delivery_import.py)
+"""
+
+import csv
+
+import pandas as pd
+import pytest
+
+from modules import delivery_import, storage
+from modules.activity_logger import ActivityLogger
+from modules.delivery_import import main, read_delivery
+
+
+PRODUCTS = pd.DataFrame({'product_id': ["AJ001", "AJ002", "AJ003"], 'stock': [20, 10, 5]})
+
+NOTE = (
+    "Product_ID,description,QTY\n"
+    "AJ001,Milo carton,12\n"
+    "AJ002,Maggi,5\n"
+    ",,\n"
+    "ZZ999,Unknown,3\n"
+    "AJ003,Teh,2.5\n"
+    "AJ001,Milo extra,3\n"
+    ",Forgot the id,4\n"
+    "AJ002,Maggi,-1\n"
+    "AJ003,Teh,abc\n"
+    "AJ003,Teh,4.0\n"
+)
+
+
+def write_note(tmp_path, text=NOTE):
+    path = tmp_path / "delivery.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def report_rows(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+@pytest.mark.parametrize("chunk_lines", [1, 3, 10_000])
+def test_same_result_for_any_chunk_size(tmp_path, chunk_lines):
+    plan = read_delivery(write_note(tmp_path), PRODUCTS, chunk_lines=chunk_lines)
+
+    assert plan.deltas == {"AJ001": 15, "AJ002": 5, "AJ003": 4}
+    assert plan.lines == 9
+    assert plan.rejected == 5
+    assert plan.summary() == "9 line(s): 24 unit(s) for 3 product(s), 5 rejected"
+    assert report_rows(plan.report_path) == [
+        ["line", "product_id", "qty", "reason"],
+        ["5", "ZZ999", "3", "unknown product"],
+        ["6", "AJ003", "2.5", "quantity is not a positive whole number"],
+        ["8", "", "4", "missing product id"],
+        ["9", "AJ002", "-1", "quantity is not a positive whole number"],
+        ["10", "AJ003", "abc", "quantity is not a positive whole number"],
+    ]
+
+
+def test_clean_note_removes_a_stale_report(tmp_path):
+    path = write_note(tmp_path)
+    plan = read_delivery(path, PRODUCTS)
+    assert (tmp_path / "delivery.rejected.csv").exists()
+
+    write_note(tmp_path, "product_id,qty\nAJ001,1\n")
+    plan = read_delivery(path, PRODUCTS)
+
+    assert plan.deltas == {"AJ001": 1}
+    assert not plan.rejected
+    assert not (tmp_path / "delivery.rejected.csv").exists()
+
+
+def test_short_rows_are_padded(tmp_path):
+    plan = read_delivery(write_note(tmp_path, "qty,product_id\n4,AJ002\n7\n"), PRODUCTS)
+
+    assert plan.deltas == {"AJ002": 4}
+    assert report_rows(plan.report_path)[1] == ["3", "", "7", "missing product id"]
+
+
+def test_note_without_qty_column(tmp_path):
+    with pytest.raises(ValueError, match="qty"):
+        read_delivery(write_note(tmp_path, "product_id,units\nAJ001,1\n"), PRODUCTS)
+
+
+@pytest.fixture
+def csv_storage(data_dir, tmp_path, monkeypatch):
+    """A fresh CSV backend behind get_storage(), audit records under tmp_path/logs"""
+    monkeypatch.delenv("AKBAR_STORAGE", raising=False)
+    monkeypatch.setattr(storage, "_storage", None)
+    logger = ActivityLogger(str(tmp_path / "logs"))
+    monkeypatch.setattr(delivery_import, "activity_logger", logger)
+    yield data_dir
+    logger.close()
+
+
+def stock():
+    return storage.CsvStorage().load_products().set_index('product_id')['stock'].to_dict()
+
+
+def test_import_adds_to_stock(csv_storage, tmp_path):
+    assert main([write_note(tmp_path)]) == 0
+
+    assert stock() == {"AJ001": 35, "AJ002": 15, "AJ003": 9}
+    delivery_import.activity_logger.flush()
+    assert "STOCK_DELIVERY" in next((tmp_path / "logs").iterdir()).read_text(encoding="utf-8")
+
+
+def test_dry_run_changes_nothing(csv_storage, tmp_path):
+    assert main([write_note(tmp_path), "--dry-run"]) == 0
+
+    assert stock() == {"AJ001": 20, "AJ002": 10, "AJ003": 5}
+
+
+def test_refused_while_a_till_holds_the_wal(csv_storage, tmp_path):
+    till = storage.CsvStorage()
+    assert till.acquire_till()
+
+    assert main([write_note(tmp_path)]) == 1
+    assert stock() == {"AJ001": 20, "AJ002": 10, "AJ003": 5}
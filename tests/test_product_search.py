@@ -0,0 +1,71 @@
+"""
+Search-as-you-type index: prefix matches, ranking and typo tolerance (modules/product_search.py)
+"""
+
+import pandas as pd
+
+from modules.catalog import ProductCatalog
+from modules.product_search import ProductSearchIndex
+
+
+def catalog(*rows):
+    return ProductCatalog(pd.DataFrame(
+        [(pid, name, "Food", 1.0, 10) for pid, name in rows],
+        columns=["product_id", "name", "category", "price", "stock"]
+    ))
+
+
+INDEX = ProductSearchIndex(catalog(
+    ("AJ001", "Milo 3-in-1"),
+    ("AJ002", "Maggi Curry"),
+    ("AJ003", "Maggi Chicken"),
+    ("DR010", "Tehbotol Sosro"),
+    ("DR011", "Teh Manis"),
+))
+
+
+def test_empty_query_finds_nothing():
+    assert INDEX.search("") == []
+    assert INDEX.search("  -- ") == []
+
+
+def test_prefix_of_a_name_word():
+    assert INDEX.search("mil") == ["AJ001"]
+    assert INDEX.search("MAGG") == ["AJ002", "AJ003"]
+
+
+def test_product_id_and_its_parts():
+    assert INDEX.search("aj002") == ["AJ002"]
+    assert INDEX.search("dr") == ["DR010", "DR011"]
+
+
+def test_every_word_must_match():
+    assert INDEX.search("maggi chick") == ["AJ003"]
+    assert INDEX.search("curry chicken") == []
+
+
+def test_exact_word_ranks_before_longer_words():
+    assert INDEX.search("teh") == ["DR011", "DR010"]
+
+
+def test_limit():
+    assert INDEX.search("aj", limit=2) == ["AJ001", "AJ002"]
+
+
+def test_typo_is_corrected():
+    assert INDEX.search("maggie") == ["AJ002", "AJ003"]
+    assert INDEX.search("maggie curyy") == ["AJ002"]
+
+
+def test_unrelated_words_find_nothing():
+    assert INDEX.search("xyzzy") == []
+    assert INDEX.search("milo xyzzy") == []
+
+
+def test_rebuild_follows_the_catalog():
+    index = ProductSearchIndex(catalog(("AJ001", "Milo 3-in-1")))
+    index.rebuild(catalog(("AJ001", "Nescafe Classic")))
+
+    assert len(index) == 1
+    assert index.search("milo") == []
+    assert index.search("nescaf") == ["AJ001"]
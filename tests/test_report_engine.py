@@ -0,0 +1,86 @@
+"""
+Daily report summaries from the stored rollup and from raw history (modules/report_engine.py)
+"""
+
+from datetime import date
+
+import pandas as pd
+
+from modules.catalog import ProductCatalog
+from modules.report_engine import DaySummary, build_report_pages, summarize_rollup, summarize_sales
+from modules.sales_rollup import SalesRollup, build_rollup
+
+
+SALES = pd.DataFrame([
+    ("2026-01-05 10:00:00", "Ali", "Siti", "s1"),
+    ("2026-01-05 11:00:00", "Budi", "Siti", "s2"),
+    ("1/5/2026 12:15", "Ali", "Rina", "s3"),
+    ("2026-01-07 09:00:00", "", "Rina", "s4"),
+], columns=["datetime", "customer_name", "cashier_name", "sale_id"])
+
+ITEMS = pd.DataFrame([
+    ("s1", "AJ001", 2, 9.8),
+    ("s1", "AJ002", 1, 3.5),
+    ("s2", "AJ003", 6, 12.0),
+    ("s3", "AJ001", 1, 4.9),
+    ("s4", "AJ002", 2, 7.0),
+], columns=["sale_id", "product_id", "qty", "line_total"])
+
+
+def cents(products):
+    return [(pid, qty, round(revenue, 2)) for pid, qty, revenue in products]
+
+
+def fields(summary):
+    """Summary fields with money rounded to cents"""
+    values = {name: getattr(summary, name) for name in DaySummary.__slots__}
+    values['products'] = cents(summary.products)
+    values['top_products'] = cents(summary.top_products)
+    values['total_revenue'] = round(summary.total_revenue, 2)
+    return values
+
+
+def test_summaries_from_history():
+    first, second = summarize_sales(SALES, ITEMS)
+
+    assert first.day == date(2026, 1, 5)
+    assert first.cashiers == ["Siti", "Rina"]
+    assert first.customers == ["Ali", "Budi"]
+    assert cents(first.products) == [("AJ001", 3, 14.7), ("AJ002", 1, 3.5), ("AJ003", 6, 12.0)]
+    assert [pid for pid, _, _ in first.top_products] == ["AJ003", "AJ001", "AJ002"]
+    assert first.frequent_customers == [("Ali", 2), ("Budi", 1)]
+    assert first.total_transactions == 3
+    assert round(first.total_revenue, 2) == 30.2
+
+    assert second.day == date(2026, 1, 7)
+    assert second.customers == ["Unknown"]
+    assert second.total_transactions == 1
+
+
+def test_stored_rollup_gives_the_same_summaries(data_dir):
+    rollup = SalesRollup()
+    for sale in SALES.to_dict('records'):
+        rollup.record(sale, ITEMS[ITEMS['sale_id'] == sale['sale_id']].to_dict('records'))
+
+    from_history = [fields(s) for s in summarize_sales(SALES, ITEMS)]
+    assert [fields(s) for s in summarize_rollup(rollup.load())] == from_history
+
+    rollup.compact()
+    assert [fields(s) for s in summarize_rollup(SalesRollup().load())] == from_history
+
+
+def test_report_page_uses_catalog_names_and_stock():
+    catalog = ProductCatalog(pd.DataFrame({
+        'product_id': ["AJ001", "AJ003"],
+        'name': ["Milo 3-in-1", "Teh Botol"],
+        'stock': [17, 4],
+    }))
+
+    page = build_report_pages(build_rollup(SALES, ITEMS), catalog)[0]
+
+    assert page.startswith("📅 SALES REPORT - 2026-01-05\n")
+    assert "Teh Botol (AJ003): 6 sold" in page
+    assert "AJ002 (AJ002): 1 sold" in page
+    assert "Total Transactions: 3\n" in page
+    assert "Total Revenue($): 30.20\n" in page
+    assert [line.split()[-1] for line in page.splitlines() if line.startswith("AJ00")] == ["17", "N/A", "4"]
@@ -0,0 +1,97 @@
+"""
+Sales journal: torn-line repair and header compaction (modules/sales_journal.py)
+"""
+
+import csv
+
+from modules.sales_journal import SalesJournal, SALES_COLUMNS
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_canonical_journal_needs_no_compaction(tmp_path):
+    path = tmp_path / "sales.csv"
+    journal = SalesJournal(str(path), SALES_COLUMNS)
+    journal.append({'datetime': "2026-01-05 10:00:00", 'sale_id': "s1", 'total': 4.9})
+
+    assert not SalesJournal(str(path), SALES_COLUMNS).needs_compaction()
+    assert read_rows(path)[0] == SALES_COLUMNS
+
+
+def test_compact_rewrites_legacy_header(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text(
+        "datetime,customer_name,cashier_name,Unnamed: 3,employee_id,note,total\n"
+        "2026-01-05 10:00:00,Ali,Siti,,123456,paid cash,9.80\n"
+        ",,,,,,\n"
+        "2026-01-05 11:00:00,Budi,Siti,,123456,,3.50\n",
+        encoding="utf-8"
+    )
+    journal = SalesJournal(str(path), SALES_COLUMNS)
+    assert journal.needs_compaction()
+
+    journal.maybe_compact()
+
+    rows = read_rows(path)
+    assert rows[0] == SALES_COLUMNS + ["note"]  # Unnamed dropped, named extra kept
+    assert rows[1] == ["2026-01-05 10:00:00", "Ali", "Siti", "123456", "", "9.80", "paid cash"]
+    assert rows[2] == ["2026-01-05 11:00:00", "Budi", "Siti", "123456", "", "3.50", ""]
+    assert len(rows) == 3  # Blank row dropped
+    assert journal.columns == rows[0]
+    assert not SalesJournal(str(path), SALES_COLUMNS).needs_compaction()
+    assert not (tmp_path / "sales.csv.tmp").exists()
+
+
+def test_appends_after_compaction_follow_the_new_header(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text("datetime,total,Unnamed: 2\n2026-01-05 10:00:00,9.80,\n", encoding="utf-8")
+    journal = SalesJournal(str(path), SALES_COLUMNS)
+    journal.maybe_compact()
+
+    journal.append({'datetime': "2026-01-06 09:00:00", 'sale_id': "s2", 'total': 1.5})
+
+    df = journal.read_dataframe()
+    assert list(df.columns) == SALES_COLUMNS
+    assert list(df['sale_id'].fillna("")) == ["", "s2"]
+
+
+def test_torn_last_line_is_moved_aside(tmp_path):
+    path = tmp_path / "sales.csv"
+    journal = SalesJournal(str(path), SALES_COLUMNS)
+    journal.append({'datetime': "2026-01-05 10:00:00", 'sale_id': "s1", 'total': 4.9})
+    with open(path, "ab") as f:
+        f.write(b'2026-01-05 11:00:00,"Bu')
+
+    reopened = SalesJournal(str(path), SALES_COLUMNS)
+
+    assert reopened.recovered_partial
+    assert reopened.needs_compaction()
+    assert len(read_rows(path)) == 2
+    assert (tmp_path / "sales.csv.partial").read_text(encoding="utf-8") == '2026-01-05 11:00:00,"Bu\n'
+
+
+def test_complete_last_line_without_newline_is_kept(tmp_path):
+    path = tmp_path / "sales.csv"
+    SalesJournal(str(path), SALES_COLUMNS)
+    with open(path, "ab") as f:
+        f.write(b"2026-01-05 10:00:00,Ali,Siti,123456,s1,4.9")
+
+    reopened = SalesJournal(str(path), SALES_COLUMNS)
+
+    assert not reopened.recovered_partial
+    assert read_rows(path)[-1] == ["2026-01-05 10:00:00", "Ali", "Siti", "123456", "s1", "4.9"]
+
+
+def test_tail_returns_the_end_of_the_journal(tmp_path):
+    path = tmp_path / "sales.csv"
+    journal = SalesJournal(str(path), SALES_COLUMNS)
+    journal.append_many([{'sale_id': f"s{i}", 'total': 1.0} for i in range(50)])
+
+    assert journal.tail().endswith(b",s49,1.0\n")
+    assert b"s0," in journal.tail()
+    assert b"s0," not in journal.tail(window=40)
+    empty = SalesJournal(str(tmp_path / "new.csv"), SALES_COLUMNS)
+    assert empty.tail() == (",".join(SALES_COLUMNS) + "\n").encode("utf-8")
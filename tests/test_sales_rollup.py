@@ -0,0 +1,90 @@
+"""
+Daily sales rollup: history rebuild vs per-sale recording (modules/sales_rollup.py)
+"""
+
+from datetime import date
+
+import pandas as pd
+
+from modules.sales_rollup import SalesRollup, build_rollup, rollup_rows
+
+
+SALES = [
+    {'datetime': "2026-01-05 10:00:00", 'customer_name': "Ali", 'cashier_name': "Siti", 'sale_id': "s1"},
+    {'datetime': "1/5/2026 15:30", 'customer_name': "", 'cashier_name': "Siti", 'sale_id': "s2"},
+    {'datetime': "2026-01-06 09:00:00", 'customer_name': "Ali", 'cashier_name': "Budi", 'sale_id': "s3"},
+    {'datetime': "15:30", 'customer_name': "Ali", 'cashier_name': "Budi", 'sale_id': "s4"},
+]
+
+ITEMS = {
+    "s1": [{'sale_id': "s1", 'product_id': "AJ001", 'qty': 2, 'line_total': 9.8},
+           {'sale_id': "s1", 'product_id': "AJ002", 'qty': 1, 'line_total': 3.5}],
+    "s2": [{'sale_id': "s2", 'product_id': "AJ001", 'qty': 1, 'line_total': 4.9}],
+    "s3": [{'sale_id': "s3", 'product_id': "AJ003", 'qty': 3, 'line_total': 6.0}],
+    "s4": [{'sale_id': "s4", 'product_id': "AJ003", 'qty': 1, 'line_total': 2.0}],
+}
+
+
+def history():
+    items = [item for sale in SALES for item in ITEMS[sale['sale_id']]]
+    return pd.DataFrame(SALES), pd.DataFrame(items)
+
+
+def as_dict(df):
+    return {
+        (row.day, row.kind, row.key): (int(row.count), int(row.qty), round(float(row.revenue), 2))
+        for row in df.itertuples()
+    }
+
+
+EXPECTED = {
+    ("2026-01-05", "product", "AJ001"): (2, 3, 14.7),
+    ("2026-01-05", "product", "AJ002"): (1, 1, 3.5),
+    ("2026-01-05", "cashier", "Siti"): (2, 0, 0.0),
+    ("2026-01-05", "customer", "Ali"): (1, 0, 0.0),
+    ("2026-01-05", "customer", "Unknown"): (1, 0, 0.0),
+    ("2026-01-06", "product", "AJ003"): (1, 3, 6.0),
+    ("2026-01-06", "cashier", "Budi"): (1, 0, 0.0),
+    ("2026-01-06", "customer", "Ali"): (1, 0, 0.0),
+}
+
+
+def test_build_rollup_aggregates_history():
+    rollup = build_rollup(*history())
+
+    assert as_dict(rollup) == EXPECTED
+    assert list(rollup['day']) == sorted(rollup['day'])
+
+
+def test_sale_without_a_date_adds_nothing():
+    assert rollup_rows(SALES[3], ITEMS["s4"]) == []
+
+
+def test_recorded_sales_match_the_rebuild(data_dir):
+    rollup = SalesRollup()
+    for sale in SALES:
+        rollup.record(sale, ITEMS[sale['sale_id']])
+
+    assert as_dict(rollup.load()) == EXPECTED
+
+
+def test_compact_folds_delta_rows(data_dir):
+    rollup = SalesRollup()
+    for sale in SALES:
+        rollup.record(sale, ITEMS[sale['sale_id']])
+
+    rollup.compact()
+
+    raw = pd.read_csv(rollup.path)
+    assert len(raw) == len(EXPECTED)
+    assert raw['sale_id'].isna().all()
+    assert as_dict(SalesRollup().load()) == EXPECTED
+
+
+def test_load_filters_by_day(data_dir):
+    rollup = SalesRollup()
+    rollup.rebuild(*history())
+
+    day = date(2026, 1, 6)
+    assert set(as_dict(rollup.load(day, day))) == {k for k in EXPECTED if k[0] == "2026-01-06"}
+    assert rollup.load(date(2026, 2, 1)).empty
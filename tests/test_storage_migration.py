@@ -0,0 +1,92 @@
+"""
+CSV -> SQLite migration (SqliteStorage.import_csv in modules/storage.py)
+"""
+
+import os
+
+import pandas as pd
+
+from modules.storage import SqliteStorage
+
+
+USERS_CSV = """employee_id,name,role,date_registered,active
+ADMIN001,Administrator,Manager,11/3/2025 20:19,True
+012345,Siti,Cashier,11/3/2025 20:20,False
+"""
+
+SALES_CSV = """datetime,customer_name,cashier_name,employee_id,sale_id,total
+2026-01-05 10:00:00,Ali,Siti,012345,s1,9.80
+1/6/2026 11:30,Budi,Siti,012345,s2,5.50
+"""
+
+SALE_ITEMS_CSV = """sale_id,product_id,qty,unit_price_at_sale,line_total
+s1,AJ001,2,4.9,9.8
+s2,AJ002,1,3.5,3.5
+s2,AJ003,1,2.0,2.0
+"""
+
+
+def write(data_dir, name, text):
+    with open(os.path.join(data_dir, name), "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def migrate(data_dir):
+    write(data_dir, "users.csv", USERS_CSV)
+    write(data_dir, "sales.csv", SALES_CSV)
+    write(data_dir, "sale_items.csv", SALE_ITEMS_CSV)
+    storage = SqliteStorage(os.path.join(data_dir, "test.db"))
+    storage.import_csv(data_dir)
+    return storage
+
+
+def test_import_copies_every_row(data_dir):
+    storage = migrate(data_dir)
+
+    assert len(storage.load_products()) == 3
+    assert len(storage.load_users()) == 2
+    assert len(storage.load_sales()) == 2
+    assert len(storage.load_sale_items()) == 3
+
+
+def test_import_keeps_identifiers_as_text(data_dir):
+    storage = migrate(data_dir)
+
+    products = storage.load_products().set_index('product_id')
+    assert products.loc["AJ001", 'barcode'] == "0012345678905"
+    assert pd.isna(products.loc["AJ002", 'barcode'])
+    assert products.loc["AJ001", 'stock'] == 20
+
+    users = storage.load_users().set_index('employee_id')
+    assert not users.loc["012345", 'active']
+    assert set(storage.load_sales()['employee_id']) == {"012345"}
+
+
+def test_import_stores_iso_datetimes(data_dir):
+    storage = migrate(data_dir)
+
+    sales = storage.load_sales().set_index('sale_id')
+    assert sales.loc["s2", 'datetime'] == "2026-01-06 11:30:00"
+
+
+def test_import_twice_does_not_duplicate(data_dir):
+    storage = migrate(data_dir)
+    storage.import_csv(data_dir)
+
+    assert len(storage.load_products()) == 3
+    assert len(storage.load_users()) == 2
+    assert len(storage.load_sales()) == 2
+    assert len(storage.load_sale_items()) == 3
+
+
+def test_import_migrates_legacy_product_strings(data_dir):
+    write(data_dir, "sales.csv",
+          "datetime,products,customer_name,cashier_name,employee_id\n"
+          '11/1/2025 19:25,"AJ001,AJ001,AJ002",,,\n')
+    storage = SqliteStorage(os.path.join(data_dir, "test.db"))
+    storage.import_csv(data_dir)
+
+    assert len(storage.load_sales()) == 1
+    items = storage.load_sale_items().set_index('product_id')
+    assert items.loc["AJ001", 'qty'] == 2
+    assert items.loc["AJ002", 'qty'] == 1
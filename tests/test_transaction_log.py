@@ -0,0 +1,287 @@
+"""
+Checkout WAL: commit, checkpoint and crash replay (modules/transaction_log.py)
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from modules import transaction_log
+from modules.storage import CsvStorage
+
+
+def stock(data_dir):
+    products = pd.read_csv(os.path.join(data_dir, "products.csv"), dtype={'product_id': str})
+    return dict(zip(products['product_id'], products['stock']))
+
+
+def sale(total=9.8):
+    return {'datetime': "2026-01-05 10:00:00", 'customer_name': "Customer",
+            'cashier_name': "Test", 'employee_id': "123456", 'total': total}
+
+
+ITEMS = [{'product_id': "AJ001", 'qty': 2, 'unit_price_at_sale': 4.9, 'line_total': 9.8}]
+
+
+def sales_rows(data_dir):
+    return pd.read_csv(os.path.join(data_dir, "sales.csv"), dtype={'sale_id': str})
+
+
+def items_rows(data_dir):
+    return pd.read_csv(os.path.join(data_dir, "sale_items.csv"), dtype={'sale_id': str})
+
+
+def wal_lines(data_dir):
+    path = os.path.join(data_dir, "checkout.wal")
+    if not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
+
+
+class Crash(BaseException):
+    """The process dying: not an Exception, so nothing in the code under test catches it"""
+
+
+def crash_on(monkeypatch, name, call):
+    """Make the call-th os.<name>() inside the transaction log raise, as a crash would"""
+    real = getattr(os, name)
+    calls = []
+
+    def crashing(*args):
+        calls.append(args)
+        if len(calls) == call:
+            raise OSError("simulated crash")
+        return real(*args)
+
+    monkeypatch.setattr(transaction_log.os, name, crashing)
+
+
+def test_commit_logs_sale_without_rewriting_products(data_dir):
+    storage = CsvStorage(data_dir)
+    before = stock(data_dir)
+
+    sale_id = storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+
+    assert stock(data_dir) == before
+    assert wal_lines(data_dir) == 1
+    assert list(sales_rows(data_dir)['sale_id']) == [sale_id]
+    assert list(items_rows(data_dir)['sale_id']) == [sale_id]
+
+
+def test_checkpoint_applies_logged_deltas_and_clears_wal(data_dir):
+    storage = CsvStorage(data_dir)
+    storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    storage.commit_sale({"AJ001": -1, "AJ003": -5}, sale(), ITEMS)
+
+    storage.checkpoint()
+
+    assert stock(data_dir) == {"AJ001": 17, "AJ002": 10, "AJ003": 0}
+    assert wal_lines(data_dir) == 0
+    assert not os.path.exists(os.path.join(data_dir, "products.csv.tmp"))
+    assert not os.path.exists(os.path.join(data_dir, "checkout.wal.ckpt"))
+
+
+def test_checkpoint_every_n_sales(data_dir, monkeypatch):
+    monkeypatch.setattr(transaction_log, "CHECKPOINT_EVERY", 2)
+    storage = CsvStorage(data_dir)
+    storage.commit_sale({"AJ001": -1}, sale(), ITEMS)
+    assert stock(data_dir)["AJ001"] == 20
+    storage.commit_sale({"AJ001": -1}, sale(), ITEMS)
+    assert stock(data_dir)["AJ001"] == 18
+    assert wal_lines(data_dir) == 0
+
+
+def test_checkpoint_without_sales_leaves_products_alone(data_dir):
+    storage = CsvStorage(data_dir)
+    path = os.path.join(data_dir, "products.csv")
+    with open(path, "rb") as f:
+        before = f.read()
+
+    storage.checkpoint()
+
+    with open(path, "rb") as f:
+        assert f.read() == before
+
+
+def test_checkpoint_keeps_stock_changed_by_another_tool(data_dir):
+    storage = CsvStorage(data_dir)
+    storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    # A delivery import while the sale is only in the WAL
+    CsvStorage(data_dir).adjust_stock({"AJ001": 100, "AJ002": 5})
+
+    storage.checkpoint()
+
+    assert stock(data_dir) == {"AJ001": 118, "AJ002": 15, "AJ003": 5}
+
+
+def test_checkpoint_keeps_barcodes(data_dir):
+    storage = CsvStorage(data_dir)
+    storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    storage.checkpoint()
+
+    products = CsvStorage(data_dir).load_products()
+    assert products.loc[products['product_id'] == "AJ001", 'barcode'].item() == "0012345678905"
+
+
+def test_crash_mid_commit_is_replayed_once(data_dir, monkeypatch):
+    storage = CsvStorage(data_dir)
+    storage.commit_sale({"AJ002": -1}, sale(3.5), [])
+
+    # The WAL line is written, then the till dies before the journals are appended
+    def crash(*args):
+        raise Crash()
+
+    with monkeypatch.context() as m, pytest.raises(Crash):
+        m.setattr(storage.items_journal, "append_many", crash)
+        storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    assert len(sales_rows(data_dir)) == 1
+
+    CsvStorage(data_dir).recover()
+
+    assert stock(data_dir) == {"AJ001": 18, "AJ002": 9, "AJ003": 5}
+    assert len(sales_rows(data_dir)) == 2
+    assert len(items_rows(data_dir)) == 1
+    assert wal_lines(data_dir) == 0
+
+    # Replaying again (e.g. a second start-up) changes nothing
+    CsvStorage(data_dir).recover()
+
+    assert stock(data_dir) == {"AJ001": 18, "AJ002": 9, "AJ003": 5}
+    assert len(sales_rows(data_dir)) == 2
+    assert len(items_rows(data_dir)) == 1
+
+
+def test_failed_journal_append_keeps_the_sale_committed(data_dir, monkeypatch):
+    storage = CsvStorage(data_dir)
+
+    def disk_full(*args):
+        raise OSError("No space left on device")
+
+    with monkeypatch.context() as m:
+        m.setattr(storage.sales_journal, "append", disk_full)
+        sale_id = storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    storage.commit_sale({"AJ002": -1}, sale(3.5), [])
+
+    # Not reported as failed, so the cashier does not ring the sale up again
+    assert sale_id
+    storage.checkpoint()
+
+    assert stock(data_dir) == {"AJ001": 18, "AJ002": 9, "AJ003": 5}
+    assert list(sales_rows(data_dir)['sale_id']).count(sale_id) == 1
+    assert len(sales_rows(data_dir)) == 2
+    assert list(items_rows(data_dir)['sale_id']) == [sale_id]
+
+
+def test_failed_wal_write_is_retried_once(data_dir, monkeypatch):
+    storage = CsvStorage(data_dir)
+
+    with monkeypatch.context() as m, pytest.raises(OSError):
+        crash_on(m, "write", 1)
+        storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    # The cashier retries the checkout the till reported as not saved
+    storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    storage.checkpoint()
+    CsvStorage(data_dir).recover()
+
+    assert stock(data_dir)["AJ001"] == 18
+    assert len(sales_rows(data_dir)) == 1
+    assert len(items_rows(data_dir)) == 1
+
+
+def test_replay_journals_every_logged_sale(data_dir, monkeypatch):
+    storage = CsvStorage(data_dir)
+
+    def disk_full(*args):
+        raise OSError("No space left on device")
+
+    with monkeypatch.context() as m:
+        m.setattr(storage.items_journal, "append_many", disk_full)
+        m.setattr(storage.sales_journal, "append", disk_full)
+        first = storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    storage.commit_sale({"AJ002": -1}, sale(3.5), [])
+    # The till dies before its next checkpoint
+
+    CsvStorage(data_dir).recover()
+
+    assert stock(data_dir) == {"AJ001": 18, "AJ002": 9, "AJ003": 5}
+    assert len(sales_rows(data_dir)) == 2
+    assert list(items_rows(data_dir)['sale_id']) == [first]
+
+
+def test_torn_wal_entry_is_ignored(data_dir):
+    storage = CsvStorage(data_dir)
+    storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    with open(os.path.join(data_dir, "checkout.wal"), "ab") as f:
+        f.write(b'{"sale_id": "torn", "deltas": {"AJ00')
+
+    assert CsvStorage(data_dir).transaction_log.replay() == 1
+    assert stock(data_dir)["AJ001"] == 18
+    assert len(sales_rows(data_dir)) == 1
+
+
+@pytest.mark.parametrize("name, call", [
+    ("replace", 1),  # products.csv.tmp written, WAL not moved yet
+    ("replace", 2),  # WAL moved to checkout.wal.ckpt, products.csv not replaced yet
+    ("remove", 1),   # products.csv replaced, checkout.wal.ckpt not deleted yet
+])
+def test_interrupted_checkpoint_applies_deltas_once(data_dir, monkeypatch, name, call):
+    storage = CsvStorage(data_dir)
+    storage.commit_sale({"AJ001": -2}, sale(), ITEMS)
+    storage.commit_sale({"AJ003": -1}, sale(2.0), [])
+
+    with monkeypatch.context() as m, pytest.raises(OSError):
+        crash_on(m, name, call)
+        storage.checkpoint()
+
+    CsvStorage(data_dir).recover()
+    CsvStorage(data_dir).recover()
+
+    assert stock(data_dir) == {"AJ001": 18, "AJ002": 10, "AJ003": 4}
+    assert len(sales_rows(data_dir)) == 2
+    for leftover in ("checkout.wal.ckpt", "products.csv.tmp"):
+        assert not os.path.exists(os.path.join(data_dir, leftover))
+
+
+def test_till_lock(data_dir):
+    till = CsvStorage(data_dir)
+    other = CsvStorage(data_dir)
+    assert not other.till_running()
+
+    assert till.acquire_till()
+    assert other.till_running()
+
+    till.release_till()
+    assert not other.till_running()
+
+    # Sales not yet checkpointed also count as a running till
+    till.commit_sale({"AJ001": -1}, sale(), ITEMS)
+    assert other.till_running()
+
+
+def test_recover_leaves_a_running_till_alone(data_dir):
+    till = CsvStorage(data_dir)
+    assert till.acquire_till()
+    till.commit_sale({"AJ001": -2}, sale(), ITEMS)
+
+    # A second program started on the same files
+    CsvStorage(data_dir).recover()
+
+    assert wal_lines(data_dir) == 1
+    assert stock(data_dir)["AJ001"] == 20
+
+    till.checkpoint()
+    till.release_till()
+    assert stock(data_dir)["AJ001"] == 18
+
+
+def test_recover_releases_the_lock_it_took(data_dir):
+    storage = CsvStorage(data_dir)
+    storage.recover()
+    assert not CsvStorage(data_dir).till_running()
+
+    assert storage.acquire_till()
+    storage.recover()
+    assert CsvStorage(data_dir).till_running()
+    storage.release_till()